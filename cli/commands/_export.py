@@ -0,0 +1,34 @@
+import sys
+
+
+def export_table(table_name, output="-", format="csv"):
+    """테이블을 COPY TO STDOUT으로 CSV 또는 JSONL 파일에 내보냅니다"""
+    from repository.bulk import copy_out, format_progress, get_table
+    from repository.handler import DatabaseManager
+
+    table = get_table(table_name)
+
+    def on_progress(rows, elapsed):
+        print(format_progress(table.name, rows, elapsed), file=sys.stderr)
+
+    stream = sys.stdout.buffer if output == "-" else open(output, "wb")
+    try:
+        total = copy_out(DatabaseManager().engine, table, stream, format, on_progress)
+    finally:
+        if stream is not sys.stdout.buffer:
+            stream.close()
+    print(f"{table.name}: {total:,}행 내보내기 완료", file=sys.stderr)
+
+
+def setup_parser(subparsers):
+    """export 명령어 파서를 설정합니다"""
+    parser = subparsers.add_parser("export", help="테이블을 JSONL/CSV 파일로 내보내기")
+    parser.add_argument("table", help="내보낼 테이블 (예: videos, posts, users)")
+    parser.add_argument("-o", "--output", default="-", help="출력 파일 경로 (기본값: 표준 출력)")
+    parser.add_argument("-f", "--format", choices=["csv", "jsonl"], default="csv", help="출력 형식")
+    return parser
+
+
+def handle_command(args):
+    """export 명령어 처리"""
+    export_table(args.table, args.output, args.format)
@@ -0,0 +1,54 @@
+import sys
+
+
+def import_table(table_name, path, format=None, upsert=False, chunk_size=50_000):
+    """JSONL 또는 CSV 파일을 COPY FROM STDIN으로 테이블에 적재합니다"""
+    from repository.bulk import copy_in, format_progress, get_table, read_rows
+    from repository.handler import DatabaseManager
+
+    table = get_table(table_name)
+    format = format or ("csv" if path.endswith(".csv") else "jsonl")
+
+    def on_progress(rows, elapsed):
+        print(format_progress(table.name, rows, elapsed), file=sys.stderr)
+
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8", newline="")
+    try:
+        columns, rows = read_rows(stream, format)
+        total = copy_in(
+            DatabaseManager().engine,
+            table,
+            columns,
+            rows,
+            chunk_size=chunk_size,
+            upsert=upsert,
+            on_progress=on_progress,
+        )
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    print(f"{table.name}: {total:,}행 적재 완료", file=sys.stderr)
+
+
+def setup_parser(subparsers):
+    """import 명령어 파서를 설정합니다"""
+    parser = subparsers.add_parser("import", help="JSONL/CSV 파일을 테이블에 대량 적재")
+    parser.add_argument("table", help="적재할 테이블 (예: videos, posts, users)")
+    parser.add_argument("path", help="입력 파일 경로 (- 이면 표준 입력)")
+    parser.add_argument(
+        "-f", "--format", choices=["jsonl", "csv"], help="입력 형식 (기본값: 확장자로 판단)"
+    )
+    parser.add_argument(
+        "--upsert",
+        action="store_true",
+        help="스테이징 테이블을 거쳐 기본 키가 같은 행은 갱신",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=50_000, help="한 번에 COPY 및 커밋할 행 수"
+    )
+    return parser
+
+
+def handle_command(args):
+    """import 명령어 처리"""
+    import_table(args.table, args.path, args.format, args.upsert, args.chunk_size)
@@ -0,0 +1,68 @@
+import sys
+
+
+def repair_follow_counts(batch_size=10_000):
+    """users의 팔로워/팔로잉 수를 follows 테이블에서 배치 단위로 다시 계산합니다"""
+    from repository.follow_repository import FollowRepository
+    from repository.handler import DatabaseManager
+
+    after, total = 0, 0
+    while after is not None:
+        # 배치마다 커밋하여 잠금을 오래 유지하지 않습니다.
+        with DatabaseManager() as session:
+            fixed, after = FollowRepository(session).repair_counts(after, batch_size)
+        total += fixed
+        if after is not None:
+            print(f"users: id {after:,}까지 확인, {total:,}명 수정", file=sys.stderr)
+    print(f"users: 팔로워/팔로잉 수 {total:,}명 수정 완료", file=sys.stderr)
+
+
+def rebuild_category_closure():
+    """category_closure를 categories.upper_category_id에서 다시 만듭니다"""
+    from repository.category_repository import CategoryRepository
+    from repository.handler import DatabaseManager
+
+    with DatabaseManager() as session:
+        total = CategoryRepository(session).rebuild_closure()
+    print(f"category_closure: {total:,}행 다시 생성 완료", file=sys.stderr)
+
+
+def reconcile_like_counts():
+    """like_counts를 likes에서 다시 계산합니다"""
+    from service.like_service import reconcile_like_counts
+
+    total = reconcile_like_counts()
+    print(f"like_counts: {total:,}개 대상 수정 완료", file=sys.stderr)
+
+
+def rebuild_search_index():
+    """search_documents를 videos와 posts에서 다시 만듭니다"""
+    from repository.handler import DatabaseManager
+    from repository.search_repository import SearchRepository
+
+    with DatabaseManager() as session:
+        total = SearchRepository(session).rebuild()
+    print(f"search_documents: {total:,}개 문서 색인 완료", file=sys.stderr)
+
+
+def setup_parser(subparsers):
+    """repair 명령어 파서를 설정합니다"""
+    parser = subparsers.add_parser("repair", help="비정규화된 집계값을 원본 테이블에서 다시 계산")
+    parser.add_argument(
+        "target", choices=["follows", "categories", "likes", "search"], help="다시 계산할 집계값"
+    )
+    parser.add_argument("--batch-size", type=int, default=10_000, help="한 번에 처리할 행 수")
+    return parser
+
+
+def handle_command(args):
+    """repair 명령어 처리"""
+    match args.target:
+        case "follows":
+            repair_follow_counts(args.batch_size)
+        case "categories":
+            rebuild_category_closure()
+        case "likes":
+            reconcile_like_counts()
+        case "search":
+            rebuild_search_index()
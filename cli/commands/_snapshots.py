@@ -0,0 +1,46 @@
+import sys
+
+
+def compact_snapshots():
+    """월 파티션을 준비하고 보존 기간이 지난 조회수 기록을 요약합니다"""
+    from service.snapshot_service import ViewSnapshotService
+
+    result = ViewSnapshotService().compact()
+    for name in result["created_partitions"]:
+        print(f"video_view_snapshots: 파티션 {name} 생성", file=sys.stderr)
+    if result["skipped"]:
+        print("video_view_snapshots: 다른 프로세스가 요약 중이므로 건너뜀", file=sys.stderr)
+        return
+    print(
+        f"video_view_snapshots: 원본 {result['hourly_rolled_up']:,}행 시간 단위 요약, "
+        f"시간 단위 {result['daily_rolled_up']:,}행 일 단위 요약 완료",
+        file=sys.stderr,
+    )
+
+
+def prepare_partitions():
+    """이번 달과 다음 달의 조회수 기록 파티션을 만듭니다"""
+    from service.snapshot_service import ViewSnapshotService
+
+    created = ViewSnapshotService.prepare_partitions()
+    print(f"video_view_snapshots: 파티션 {len(created)}개 생성 완료", file=sys.stderr)
+
+
+def setup_parser(subparsers):
+    """snapshots 명령어 파서를 설정합니다"""
+    parser = subparsers.add_parser("snapshots", help="조회수 기록의 파티션 준비와 보존 기간 정리")
+    parser.add_argument(
+        "action",
+        choices=["compact", "partitions"],
+        help="compact: 파티션 준비 후 오래된 기록 요약, partitions: 파티션만 준비",
+    )
+    return parser
+
+
+def handle_command(args):
+    """snapshots 명령어 처리"""
+    match args.action:
+        case "compact":
+            compact_snapshots()
+        case "partitions":
+            prepare_partitions()
@@ -1,6 +1,6 @@
 import argparse
 
-from cli.commands import _install, _serve, _test, _format
+from cli.commands import _install, _serve, _test, _format, _import, _export, _repair, _snapshots
 
 
 def entry_point():
@@ -15,6 +15,10 @@ def entry_point():
     _test.setup_parser(subparsers)
     _serve.setup_parser(subparsers)
     _format.setup_parser(subparsers)
+    _import.setup_parser(subparsers)
+    _export.setup_parser(subparsers)
+    _repair.setup_parser(subparsers)
+    _snapshots.setup_parser(subparsers)
 
     args = parser.parse_args()
 
@@ -27,6 +31,14 @@ def entry_point():
             _serve.handle_command(args)
         case "format":
             _format.handle_command(args)
+        case "import":
+            _import.handle_command(args)
+        case "export":
+            _export.handle_command(args)
+        case "repair":
+            _repair.handle_command(args)
+        case "snapshots":
+            _snapshots.handle_command(args)
         case _:
             parser.print_help()
             exit(1)
@@ -1,11 +1,31 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import Annotated, Literal
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from model.controller import (
+    CommentThreadResponse,
+    CrawlJobResponse,
+    HashTagBatchCrawlRequest,
+    HashTagBatchCrawlResponse,
     HashTagCrawlRequest,
     HashTagCrawlResponse,
+    PostFeedResponse,
+    SearchResponse,
+    VideoBatchRequest,
+    VideoBatchResponse,
     VideoCreateRequest,
     VideoCreateResponse,
+    VideoViewSeriesRequest,
+    VideoViewSeriesResponse,
 )
+from repository.handler import AsyncDatabaseManager, get_async_session
+
+# 요청 단위 비동기 DB 세션 (응답 후 커밋, 예외 시 롤백)
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
 
 
 def _project_version() -> str:
@@ -21,6 +41,30 @@ def _project_version() -> str:
         return "0.0.1"
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작 시 브라우저 풀을 예열하고, 종료 시 정리합니다."""
+    import threading
+
+    from service.batch_service import get_batch_service
+    from service.cache import get_crawl_cache
+    from service.job_service import get_job_manager
+    from service.snapshot_service import get_snapshot_maintenance
+    from service.youtube.pool import get_driver_pool
+
+    pool = get_driver_pool()
+    threading.Thread(target=pool.warm_up, daemon=True).start()
+    # 월 파티션 준비와 보존 기간에 따른 요약을 주기적으로 실행합니다. 실패해도 서버는 시작합니다.
+    maintenance = get_snapshot_maintenance()
+    yield
+    maintenance.close()
+    get_job_manager().shutdown()
+    get_batch_service().shutdown()
+    get_crawl_cache().shutdown()
+    pool.close()
+    await AsyncDatabaseManager.dispose()
+
+
 app = FastAPI(
     title="Inssider Crawler",
     description="인사이더 데이터 크롤링 및 조회 API",
@@ -30,24 +74,231 @@ app = FastAPI(
         "url": "http://github.com/ooMia",
         "email": "hyeonhak.kim.dev@gmail.com",
     },
+    lifespan=lifespan,
 )
 
 
 @app.post("/api/v1/videos")
 async def create_video(req: VideoCreateRequest) -> VideoCreateResponse:
-    from service.video_service import VideoService
+    from service.video_service import VideoNotFound, VideoService
 
     service = VideoService(req.video_id)
-    data = service.create_video()
+    try:
+        data = await run_in_threadpool(service.create_video)
+    except VideoNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
     return VideoCreateResponse.from_dict(data)
 
 
-@app.post("/api/v1/crawl/hashtag")
-async def crawl_hashtag(req: HashTagCrawlRequest) -> HashTagCrawlResponse:
+@app.post("/api/v1/videos:batch")
+async def create_videos(req: VideoBatchRequest) -> VideoBatchResponse:
+    """여러 영상의 메타데이터를 동시에 조회하고, 실패한 영상은 errors에 담아 반환합니다."""
+    from service.video_service import VideoBatchService
+
+    data = await run_in_threadpool(VideoBatchService(req.video_ids).create_videos)
+
+    return VideoBatchResponse.from_dict(data)
+
+
+@app.post("/api/v1/videos/views:series")
+async def video_view_series(
+    req: VideoViewSeriesRequest, session: AsyncSessionDep
+) -> VideoViewSeriesResponse:
+    """여러 영상의 조회수 시계열을 조회합니다."""
+    from service.snapshot_service import ViewSnapshotService
+
+    data = await ViewSnapshotService().series(session, req.video_ids, req.since)
+
+    return VideoViewSeriesResponse.from_dict(data)
+
+
+@app.get("/api/v1/posts/feed")
+async def post_feed(
+    session: AsyncSessionDep,
+    limit: Annotated[int, Query(ge=1, le=100, description="페이지 크기")] = 20,
+    cursor: Annotated[str | None, Query(description="이전 페이지의 next_cursor")] = None,
+    category_id: Annotated[
+        int | None, Query(description="카테고리 ID (하위 카테고리 포함)")
+    ] = None,
+    tag: Annotated[str | None, Query(description="태그 이름")] = None,
+) -> PostFeedResponse:
+    """게시글을 최신순으로 조회합니다. next_cursor로 다음 페이지를 조회합니다."""
+    from service.cursor import InvalidCursor
+    from service.post_service import PostFeedService
+
+    try:
+        data = await PostFeedService().feed(session, limit, cursor, category_id, tag)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return PostFeedResponse.from_dict(data)
+
+
+@app.get("/api/v1/posts/{post_id}/comments")
+async def comment_thread(
+    post_id: int,
+    session: AsyncSessionDep,
+    limit: Annotated[int, Query(ge=1, le=100, description="최상위 댓글 페이지 크기")] = 20,
+    cursor: Annotated[str | None, Query(description="이전 페이지의 next_cursor")] = None,
+) -> CommentThreadResponse:
+    """게시글의 최상위 댓글과 대댓글 트리를 조회합니다."""
+    from service.comment_service import CommentThreadService
+    from service.cursor import InvalidCursor
+
+    try:
+        data = await CommentThreadService().thread(session, post_id, limit, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return CommentThreadResponse.from_dict(data)
+
+
+@app.get("/api/v1/search")
+async def search(
+    session: AsyncSessionDep,
+    q: Annotated[str, Query(min_length=1, max_length=200, description="검색어")],
+    type: Annotated[
+        Literal["video", "post"] | None, Query(description="문서 종류 (생략하면 전체)")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=100, description="페이지 크기")] = 20,
+    cursor: Annotated[str | None, Query(description="이전 페이지의 next_cursor")] = None,
+) -> SearchResponse:
+    """영상 제목/설명과 게시글 제목/내용을 관련도 순으로 검색합니다."""
+    from service.cursor import InvalidCursor
+    from service.search_service import SearchService
+
+    try:
+        data = await SearchService().search(session, q, type, limit, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return SearchResponse.from_dict(data)
+
+
+def _submit_crawl_hashtag(req: HashTagCrawlRequest):
     from service.hashtag_service import HashTagService
+    from service.job_service import get_job_manager
 
     service = HashTagService()
-    data = service.crawl_hashtag(req)
+    return get_job_manager().submit(
+        "crawl_hashtag", lambda job: service.crawl_hashtag(req, job.report), total=req.limit
+    )
+
+
+def _bypass_cache(cache_control: str | None) -> bool:
+    """`Cache-Control: no-cache` 또는 `no-store` 요청 헤더가 있으면 캐시를 사용하지 않습니다."""
+    directives = {d.strip().lower() for d in (cache_control or "").split(",")}
+    return bool(directives & {"no-cache", "no-store"})
+
+
+@app.post("/api/v1/crawl/hashtag")
+async def crawl_hashtag(
+    req: HashTagCrawlRequest,
+    cache_control: Annotated[str | None, Header()] = None,
+) -> HashTagCrawlResponse:
+    import asyncio
+
+    from service.cache import get_crawl_cache
+    from service.hashtag_service import HashTagService
+    from service.singleflight import get_single_flight
+
+    if _bypass_cache(cache_control):
+        get_crawl_cache().bypass()
+    elif (data := await run_in_threadpool(HashTagService().cached_hashtag, req)) is not None:
+        return HashTagCrawlResponse.from_dict(data)
+
+    # 같은 해시태그를 같거나 더 많이 크롤링하는 작업이 진행 중이면 새로 실행하지 않고 기다립니다.
+    future, _ = get_single_flight().submit(
+        HashTagService.flight_key(req),
+        lambda: _submit_crawl_hashtag(req).future,
+        size=req.limit,
+    )
+    data = await asyncio.wrap_future(future)
+
+    return HashTagCrawlResponse.from_dict(HashTagService.limit_result(data, req.limit))
+
+
+@app.get("/api/v1/crawl/hashtag/stream")
+async def stream_hashtag(
+    hashtag: Annotated[str, Query(description="검색 해시태그", examples=["밈"])],
+    limit: Annotated[int, Query(description="검색 결과 개수")] = 10,
+    format: Annotated[Literal["ndjson", "sse"], Query(description="응답 형식")] = "ndjson",
+) -> StreamingResponse:
+    """수집한 콘텐츠를 NDJSON 또는 Server-Sent Events로 즉시 전송하고, 마지막에 요약을 전송합니다."""
+    import json
+
+    from service.hashtag_service import HashTagService
+
+    def encode(records):
+        # 동기 제너레이터는 StreamingResponse가 스레드풀에서 순회하므로 이벤트 루프를 막지 않습니다.
+        for record in records:
+            if format == "sse":
+                data = json.dumps(record["data"], ensure_ascii=False, default=str)
+                yield f"event: {record['type']}\ndata: {data}\n\n"
+            else:
+                line = {"type": record["type"], **record["data"]}
+                yield json.dumps(line, ensure_ascii=False, default=str) + "\n"
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        encode(HashTagService().stream_hashtag(HashTagCrawlRequest(hashtag=hashtag, limit=limit))),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/v1/crawl/hashtag/batch")
+async def crawl_hashtag_batch(req: HashTagBatchCrawlRequest) -> HashTagBatchCrawlResponse:
+    from service.batch_service import get_batch_service
+
+    data = await run_in_threadpool(get_batch_service().crawl, req.requests)
+
+    return HashTagBatchCrawlResponse.from_dict(data)
+
+
+@app.post("/api/v1/crawl/hashtag/jobs", status_code=202)
+async def create_crawl_hashtag_job(req: HashTagCrawlRequest) -> CrawlJobResponse:
+    job = _submit_crawl_hashtag(req)
+
+    return CrawlJobResponse.from_dict(job.to_dict())
+
+
+@app.get("/api/v1/crawl/hashtag/jobs/{job_id}")
+async def get_crawl_hashtag_job(job_id: str) -> CrawlJobResponse:
+    from service.job_service import get_job_manager
+
+    job = get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    return CrawlJobResponse.from_dict(job.to_dict())
+
+
+@app.delete("/api/v1/crawl/hashtag/jobs/{job_id}")
+async def cancel_crawl_hashtag_job(job_id: str) -> CrawlJobResponse:
+    from service.job_service import get_job_manager
+
+    job = get_job_manager().cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    return CrawlJobResponse.from_dict(job.to_dict())
+
+
+@app.get("/api/v1/metrics")
+async def get_metrics() -> dict:
+    """커넥션 풀 사용량, 캐시 적중률, 중복 요청 병합 수, 영상 저장 처리량 등 서비스 내부 지표를 반환합니다."""
+    from repository.handler import pool_stats
+    from service.cache import get_crawl_cache
+    from service.like_service import get_like_counter
+    from service.singleflight import get_single_flight
+    from service.video_pipeline import get_video_pipeline
 
-    return HashTagCrawlResponse.from_dict(data)
+    return {
+        "database_pool": pool_stats(),
+        "hashtag_cache": get_crawl_cache().stats(),
+        "like_counter": get_like_counter().stats(),
+        "single_flight": get_single_flight().stats(),
+        "video_pipeline": get_video_pipeline().stats(),
+    }
@@ -3,6 +3,31 @@ from typing import cast
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def crawl_cache(monkeypatch, tmp_path):
+    """테스트마다 비어 있는 캐시를 사용합니다."""
+    from service import cache
+    from service.cache import CrawlCache
+
+    crawl_cache = CrawlCache(ttl=60, stale_ttl=60, path=tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(cache, "_default_cache", crawl_cache)
+    yield crawl_cache
+    crawl_cache.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def video_pipeline(monkeypatch):
+    """크롤링 결과를 데이터베이스 대신 목록에 저장합니다."""
+    from service import video_pipeline
+    from service.video_pipeline import VideoUpsertPipeline
+
+    written = []
+    pipeline = VideoUpsertPipeline(flush_interval=0.01, writer=written.extend)
+    monkeypatch.setattr(video_pipeline, "_default_pipeline", pipeline)
+    yield written
+    pipeline.close()
+
+
 @pytest.mark.asyncio
 @pytest.mark.slow
 async def test_create_video():
@@ -33,3 +58,353 @@ async def test_crawl_hashtag():
     assert res.length >= 10
     for content in res.contents:
         assert content.view_count >= 1_000_000
+
+
+def test_crawl_hashtag_job(monkeypatch):
+    """해시태그 크롤링 작업 API 테스트"""
+    import time
+
+    from fastapi.testclient import TestClient
+
+    from controller.main import app
+    from service.hashtag_service import HashTagService
+
+    def fake_crawl_hashtag(self, req, on_progress=None):
+        contents = [
+            {
+                "video_id": f"video{i}",
+                "thumbnail_url": f"https://i.ytimg.com/vi/video{i}/hq2.jpg",
+                "video_url": f"https://www.youtube.com/watch?v=video{i}",
+                "title": "밈",
+                "channel": "채널",
+                "view_count": 1_000_000,
+                "date": "1일 전",
+            }
+            for i in range(req.limit)
+        ]
+        on_progress(len(contents))
+        return {"length": len(contents), "contents": contents, "stop_reason": "limit"}
+
+    monkeypatch.setattr(HashTagService, "crawl_hashtag", fake_crawl_hashtag)
+    client = TestClient(app)
+
+    res = client.post("/api/v1/crawl/hashtag/jobs", json={"hashtag": "밈", "limit": 3})
+    assert res.status_code == 202
+    job_id = res.json()["job_id"]
+
+    for _ in range(100):
+        job = client.get(f"/api/v1/crawl/hashtag/jobs/{job_id}").json()
+        if job["status"] == "succeeded":
+            break
+        time.sleep(0.01)
+    assert job["progress"] == 3
+    assert job["result"]["length"] == 3
+
+    res = client.post("/api/v1/crawl/hashtag", json={"hashtag": "밈", "limit": 2})
+    assert res.json()["length"] == 2
+
+    assert client.get("/api/v1/crawl/hashtag/jobs/unknown").status_code == 404
+
+
+def test_stream_hashtag(monkeypatch):
+    """해시태그 스트리밍 API 테스트"""
+    import json
+
+    from fastapi.testclient import TestClient
+
+    from controller.main import app
+    from service.hashtag_service import HashTagService
+    from service.youtube.strategy import StopReason
+
+    class FakeCrawler:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def iterate(self, url, strategy, limit):
+            for i in range(limit):
+                yield {"video_id": f"video{i}", "view_count": 1_000_000}
+            return StopReason.LIMIT
+
+    monkeypatch.setattr(HashTagService, "_youtube_engine", lambda self: (FakeCrawler(), None))
+    client = TestClient(app)
+
+    res = client.get("/api/v1/crawl/hashtag/stream", params={"hashtag": "밈", "limit": 2})
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in res.text.splitlines()]
+    assert [record["type"] for record in records] == ["item", "item", "summary"]
+    assert records[0]["video_id"] == "video0"
+    assert records[-1]["length"] == 2
+    assert records[-1]["stop_reason"] == "limit"
+    assert records[-1]["time_to_first_item"] is not None
+
+    res = client.get(
+        "/api/v1/crawl/hashtag/stream", params={"hashtag": "밈", "limit": 1, "format": "sse"}
+    )
+    assert res.headers["content-type"].startswith("text/event-stream")
+    assert res.text.startswith('event: item\ndata: {"video_id": "video0"')
+    assert "event: summary\n" in res.text
+
+
+def test_stream_hashtag_persists_in_batches(monkeypatch):
+    from model.controller import HashTagCrawlRequest
+    from service.hashtag_service import HashTagService
+    from service.youtube.strategy import StopReason
+
+    class FakeCrawler:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def iterate(self, url, strategy, limit):
+            for i in range(limit):
+                yield {"video_id": f"video{i}"}
+            return StopReason.LIMIT
+
+    persisted = []
+    monkeypatch.setattr(HashTagService, "_youtube_engine", lambda self: (FakeCrawler(), None))
+    monkeypatch.setattr(HashTagService, "_persist", staticmethod(persisted.append))
+    monkeypatch.setattr(HashTagService, "STREAM_PERSIST_BATCH", 2)
+
+    records = list(HashTagService().stream_hashtag(HashTagCrawlRequest(hashtag="밈", limit=5)))
+    assert len(records) == 6
+    assert [len(batch) for batch in persisted] == [2, 2, 1]
+
+    # 클라이언트가 중간에 끊어도 수집한 콘텐츠는 저장합니다.
+    persisted.clear()
+    stream = HashTagService().stream_hashtag(HashTagCrawlRequest(hashtag="밈", limit=5))
+    next(stream)
+    stream.close()
+    assert [len(batch) for batch in persisted] == [1]
+
+
+def test_crawl_hashtag_cache(monkeypatch, video_pipeline):
+    """해시태그 크롤링 캐시, 결과 저장 및 지표 API 테스트"""
+    from fastapi.testclient import TestClient
+
+    from controller.main import app
+    from service.hashtag_service import HashTagService
+    from service.video_pipeline import get_video_pipeline
+    from service.youtube.strategy import StopReason
+
+    calls = []
+
+    class FakeCrawler:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def scrape(self, url, strategy, limit, on_progress=None, incremental=None):
+            calls.append(limit)
+            contents = [
+                {
+                    "video_id": f"video{i}",
+                    "thumbnail_url": f"https://i.ytimg.com/vi/video{i}/hq2.jpg",
+                    "video_url": f"https://www.youtube.com/watch?v=video{i}",
+                    "title": "밈",
+                    "channel": "채널",
+                    "view_count": 1_000_000,
+                    "date": "1일 전",
+                }
+                for i in range(limit)
+            ]
+            return {"length": limit, "contents": contents, "stop_reason": StopReason.LIMIT.value}
+
+    monkeypatch.setattr(HashTagService, "_youtube_engine", lambda self: (FakeCrawler(), None))
+    client = TestClient(app)
+
+    assert (
+        client.post("/api/v1/crawl/hashtag", json={"hashtag": "밈", "limit": 5}).status_code == 200
+    )
+    res = client.post("/api/v1/crawl/hashtag", json={"hashtag": "밈", "limit": 3})
+    assert res.json()["length"] == 3
+    assert calls == [5]
+
+    res = client.post(
+        "/api/v1/crawl/hashtag",
+        json={"hashtag": "밈", "limit": 3},
+        headers={"Cache-Control": "no-cache"},
+    )
+    assert res.json()["length"] == 3
+    assert calls == [5, 3]
+
+    metrics = client.get("/api/v1/metrics").json()["hashtag_cache"]
+    assert metrics["memory_hits"] == 1
+    assert metrics["misses"] == 1
+    assert metrics["bypasses"] == 1
+
+    get_video_pipeline().flush()
+    assert len(video_pipeline) == 8
+    assert video_pipeline[0] == {
+        "id": "video0",
+        "title": "밈",
+        "thumbnail_url": "https://i.ytimg.com/vi/video0/hq2.jpg",
+        "views": 1_000_000,
+    }
+
+
+def test_create_videos_batch(monkeypatch):
+    """영상 메타데이터 일괄 조회 API 테스트"""
+    from fastapi.testclient import TestClient
+
+    from controller.main import app
+    from service.video_service import VideoBatchService
+
+    def fake_create_videos(self):
+        return {
+            "videos": [{"video_id": video_id} for video_id in self.video_ids[:-1]],
+            "errors": [{"video_id": self.video_ids[-1], "error": "VideoPrivate: private"}],
+        }
+
+    monkeypatch.setattr(VideoBatchService, "create_videos", fake_create_videos)
+    client = TestClient(app)
+
+    res = client.post("/api/v1/videos:batch", json={"video_ids": ["a", "a", "b", "c"]})
+    assert res.status_code == 200
+    assert [video["video_id"] for video in res.json()["videos"]] == ["a", "b"]
+    assert res.json()["errors"] == [{"video_id": "c", "error": "VideoPrivate: private"}]
+
+    assert client.post("/api/v1/videos:batch", json={"video_ids": []}).status_code == 422
+
+
+def test_video_view_series():
+    from datetime import datetime
+
+    from fastapi.testclient import TestClient
+
+    from controller.main import app
+    from repository.handler import DatabaseManager
+    from repository.snapshot_repository import ViewSnapshotRepository
+
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+    with DatabaseManager() as session:
+        ViewSnapshotRepository(session).add_many([("a", 1)], captured_at=datetime(2025, 1, 1))
+
+    client = TestClient(app)
+    for _ in range(2):
+        res = client.post("/api/v1/videos/views:series", json={"video_ids": ["a", "b"]})
+        assert res.status_code == 200
+        assert res.json() == {"series": {"a": [{"at": "2025-01-01T00:00:00", "views": 1}], "b": []}}
+
+
+def test_post_feed():
+    from fastapi.testclient import TestClient
+
+    from controller.main import app
+    from model.repository.test import create_sample_data
+    from repository.handler import DatabaseManager
+
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+    with DatabaseManager() as session:
+        categories = [category.id for category in create_sample_data(session)["categories"]]
+
+    client = TestClient(app)
+    res = client.get("/api/v1/posts/feed", params={"limit": 4})
+    assert res.status_code == 200
+    first = res.json()
+    assert len(first["posts"]) == 4
+    assert first["posts"][0]["user"]["username"]
+    assert first["posts"][0]["like_count"] == 0
+
+    res = client.get("/api/v1/posts/feed", params={"limit": 4, "cursor": first["next_cursor"]})
+    assert len(res.json()["posts"]) == 3
+    assert res.json()["next_cursor"] is None
+
+    # 계층1의 하위 카테고리 글까지 모두 포함합니다.
+    res = client.get("/api/v1/posts/feed", params={"category_id": categories[0]})
+    assert len(res.json()["posts"]) == 5
+
+    assert client.get("/api/v1/posts/feed", params={"cursor": "invalid"}).status_code == 400
+
+
+def test_comment_thread():
+    from fastapi.testclient import TestClient
+    from sqlalchemy import insert
+
+    from controller.main import app
+    from model.repository.post import Comment
+    from model.repository.test import create_sample_data
+    from repository.handler import DatabaseManager
+
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+    with DatabaseManager() as session:
+        post_id = create_sample_data(session)["posts"][0].id
+        session.execute(
+            insert(Comment).values(
+                [
+                    {"id": 1, "post_id": post_id, "content": "댓글", "parent_comment_id": None},
+                    {"id": 2, "post_id": post_id, "content": "대댓글", "parent_comment_id": 1},
+                ]
+            )
+        )
+
+    client = TestClient(app)
+    res = client.get(f"/api/v1/posts/{post_id}/comments")
+    assert res.status_code == 200
+    (comment,) = res.json()["comments"]
+    assert comment["content"] == "댓글"
+    assert [reply["content"] for reply in comment["replies"]] == ["대댓글"]
+    assert res.json()["next_cursor"] is None
+
+    with DatabaseManager() as session:
+        session.execute(
+            insert(Comment).values(
+                id=3, post_id=post_id, content="두 번째 댓글", parent_comment_id=None
+            )
+        )
+    res = client.get(f"/api/v1/posts/{post_id}/comments", params={"limit": 1})
+    cursor = res.json()["next_cursor"]
+    assert isinstance(cursor, str)
+    res = client.get(f"/api/v1/posts/{post_id}/comments", params={"cursor": cursor})
+    assert [comment["id"] for comment in res.json()["comments"]] == [3]
+    assert (
+        client.get(f"/api/v1/posts/{post_id}/comments", params={"cursor": "1"}).status_code == 400
+    )
+
+
+def test_search():
+    from fastapi.testclient import TestClient
+
+    from controller.main import app
+    from repository.handler import DatabaseManager
+    from repository.search_repository import SearchRepository
+
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+    with DatabaseManager() as session:
+        SearchRepository(session).index(
+            "video", [(f"v{i}", f"고양이 밈 {i}", "설명" * 200) for i in range(3)]
+        )
+
+    client = TestClient(app)
+    res = client.get("/api/v1/search", params={"q": "고양이", "limit": 2})
+    assert res.status_code == 200
+    first = res.json()
+    assert len(first["results"]) == 2
+    assert len(first["results"][0]["body"]) == 200
+
+    res = client.get("/api/v1/search", params={"q": "고양이", "cursor": first["next_cursor"]})
+    assert len(res.json()["results"]) == 1
+    assert res.json()["next_cursor"] is None
+
+    assert client.get("/api/v1/search", params={"q": "고양이", "cursor": "x"}).status_code == 400
+    assert client.get("/api/v1/search", params={"q": ""}).status_code == 422
+
+
+def test_crawl_empty_hashtag():
+    """정규화하면 비어 있는 해시태그는 크롤링하지 않고 422로 응답합니다."""
+    from fastapi.testclient import TestClient
+
+    from controller.main import app
+
+    client = TestClient(app)
+    assert client.post("/api/v1/crawl/hashtag", json={"hashtag": "#"}).status_code == 422
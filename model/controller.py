@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class VideoCreateRequest(BaseModel):
@@ -25,15 +26,170 @@ class VideoCreateResponse(BaseModel):
         return cls(**data)
 
 
+class VideoBatchRequest(BaseModel):
+    video_ids: list[str] = Field(
+        description="유튜브 비디오 ID 목록 (중복은 제거됩니다)",
+        min_length=1,
+        max_length=200,
+        json_schema_extra={"example": ["MLpmiywRNzY", "-vUUQ2ENjWs"]},
+    )
+
+
+class VideoBatchResponse(BaseModel):
+    class Error(BaseModel):
+        video_id: str
+        error: str
+
+    videos: list[VideoCreateResponse]
+    errors: list[Error]
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            videos=[VideoCreateResponse.from_dict(video) for video in data["videos"]],
+            errors=[cls.Error(**error) for error in data["errors"]],
+        )
+
+
+class VideoViewSeriesRequest(BaseModel):
+    video_ids: list[str] = Field(
+        description="유튜브 비디오 ID 목록 (중복은 제거됩니다)",
+        min_length=1,
+        max_length=200,
+        json_schema_extra={"example": ["MLpmiywRNzY", "-vUUQ2ENjWs"]},
+    )
+    since: datetime | None = Field(
+        description="이 시간 이후의 기록만 조회합니다. 생략하면 전체 기간을 조회합니다.",
+        default=None,
+    )
+
+
+class VideoViewSeriesResponse(BaseModel):
+    class Point(BaseModel):
+        at: datetime
+        views: int
+
+    series: dict[str, list[Point]] = Field(
+        description="영상 ID별 조회수 시계열. 오래된 구간은 시간 또는 일 단위로 요약되어 있습니다.",
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            series={
+                video_id: [cls.Point(**point) for point in points]
+                for video_id, points in data["series"].items()
+            }
+        )
+
+
+class PostFeedResponse(BaseModel):
+    class Item(BaseModel):
+        class Author(BaseModel):
+            id: int
+            username: str | None
+
+        class Category(BaseModel):
+            id: int
+            name: str
+
+        id: int
+        title: str
+        content: str
+        media_url: str
+        media_upload_time: datetime
+        user: Author | None
+        category: Category | None
+        tags: list[str]
+        like_count: int
+
+    posts: list[Item]
+    next_cursor: str | None = Field(
+        description="다음 페이지를 조회할 때 cursor로 전달하는 값. 마지막 페이지이면 null입니다.",
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            posts=[cls.Item(**post) for post in data["posts"]],
+            next_cursor=data["next_cursor"],
+        )
+
+
+class CommentThreadResponse(BaseModel):
+    class Comment(BaseModel):
+        id: int
+        user_id: int | None
+        content: str | None = Field(description="댓글 내용 (삭제된 댓글은 null)")
+        created_at: datetime | None
+        depth: int
+        deleted: bool
+        reply_count: int = Field(description="바로 아래 대댓글 수 (삭제된 댓글 포함)")
+        more_replies: bool = Field(description="깊이 또는 개수 제한으로 불러오지 않은 대댓글 여부")
+        replies: list[Self]
+
+    comments: list[Comment]
+    next_cursor: str | None = Field(
+        description="다음 페이지를 조회할 때 cursor로 전달하는 값. 마지막 페이지이면 null입니다.",
+    )
+    truncated: bool = Field(description="대댓글 개수 제한에 도달했는지 여부")
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            comments=[cls.Comment(**comment) for comment in data["comments"]],
+            next_cursor=data["next_cursor"],
+            truncated=data["truncated"],
+        )
+
+
+class SearchResponse(BaseModel):
+    class Result(BaseModel):
+        doc_type: str = Field(description="문서 종류 (video, post)")
+        doc_id: str = Field(description="영상 ID 또는 게시글 ID")
+        title: str
+        body: str | None = Field(description="영상 설명 또는 게시글 내용의 앞부분")
+        score: float = Field(description="관련도 점수")
+
+    results: list[Result]
+    next_cursor: str | None = Field(
+        description="다음 페이지를 조회할 때 cursor로 전달하는 값. 마지막 페이지이면 null입니다.",
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            results=[cls.Result(**result) for result in data["results"]],
+            next_cursor=data["next_cursor"],
+        )
+
+
+def normalize_hashtag(hashtag: str) -> str:
+    """앞뒤 공백과 해시태그 기호(#)를 제거하고 대소문자를 통일합니다. `#Meme`과 `meme`은 같은 해시태그입니다."""
+    return hashtag.strip().lstrip("#").strip().casefold()
+
+
 class HashTagCrawlRequest(BaseModel):
     hashtag: str = Field(
-        description="검색 해시태그",
+        description="검색 해시태그 (`#`과 대소문자는 구분하지 않습니다)",
         json_schema_extra={"example": "밈"},
     )
     limit: int = Field(
         description="검색 결과 개수",
         default=10,
     )
+    incremental: bool = Field(
+        description="이전에 수집한 영상은 건너뛰고, 연속으로 나타나면 조기 종료하는 증분 크롤링 여부",
+        default=False,
+    )
+
+    @field_validator("hashtag")
+    @classmethod
+    def _normalize_hashtag(cls, hashtag: str) -> str:
+        # 캐시, 수집 이력, single-flight 키가 모두 정규화된 해시태그를 사용합니다.
+        if not (normalized := normalize_hashtag(hashtag)):
+            raise ValueError("해시태그가 비어 있습니다.")
+        return normalized
 
 
 class HashTagCrawlResponse(BaseModel):
@@ -48,15 +204,85 @@ class HashTagCrawlResponse(BaseModel):
 
     length: int
     contents: list[SearchResult]
+    stop_reason: str | None = Field(
+        description="크롤링 종료 사유 (limit, end_of_feed, timeout, error, cancelled, known)",
+        default=None,
+    )
+    new_count: int | None = Field(
+        description="증분 크롤링에서 새로 추출한 영상 수",
+        default=None,
+    )
+    skipped_count: int | None = Field(
+        description="증분 크롤링에서 이미 수집하여 건너뛴 영상 수",
+        default=None,
+    )
 
     @classmethod
     def from_dict(cls, data: dict):
         return cls(
             contents=[cls.SearchResult(**item) for item in data.get("contents", [])],
             length=data.get("length", len(data.get("contents", []))),
+            stop_reason=data.get("stop_reason"),
+            new_count=data.get("new_count"),
+            skipped_count=data.get("skipped_count"),
+        )
+
+
+class HashTagBatchCrawlRequest(BaseModel):
+    requests: list[HashTagCrawlRequest] = Field(
+        description="크롤링할 해시태그 요청 목록",
+        min_length=1,
+        max_length=100,
+    )
+
+
+class HashTagBatchCrawlResponse(BaseModel):
+    class Item(BaseModel):
+        hashtag: str
+        limit: int
+        result: HashTagCrawlResponse | None = None
+        error: str | None = None
+
+    succeeded: int
+    failed: int
+    results: list[Item]
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            succeeded=data["succeeded"],
+            failed=data["failed"],
+            results=[
+                cls.Item(
+                    hashtag=item["hashtag"],
+                    limit=item["limit"],
+                    result=(
+                        HashTagCrawlResponse.from_dict(item["result"]) if item["result"] else None
+                    ),
+                    error=item["error"],
+                )
+                for item in data["results"]
+            ],
         )
 
 
+class CrawlJobResponse(BaseModel):
+    job_id: str
+    status: str = Field(description="작업 상태 (pending, running, succeeded, failed, cancelled)")
+    progress: int = Field(description="현재까지 수집한 콘텐츠 개수")
+    total: int | None = Field(description="목표 콘텐츠 개수", default=None)
+    result: HashTagCrawlResponse | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        result = data.get("result")
+        return cls(**{**data, "result": HashTagCrawlResponse.from_dict(result) if result else None})
+
+
 """
     LoginRequest,
     LoginResponse,
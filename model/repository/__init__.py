@@ -24,7 +24,12 @@ Conventions
 # isort: skip_file
 from .user import User  # noqa: F401
 from .user import UserDetail, Follow  # noqa: F401
+from .user import Like, LikeCount, LikeCountEpoch  # noqa: F401
 from .post import Post  # noqa: F401
-from .post import Category  # noqa: F401
+from .post import Category, CategoryClosure  # noqa: F401
 
 from .video import Video  # noqa: F401
+from .video import HashTagSeenVideo, HashTagFilteredVideo  # noqa: F401
+from .video import VideoViewSnapshot, VideoViewRollup  # noqa: F401
+
+from .search import SearchDocument  # noqa: F401
@@ -3,8 +3,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from model.repository import User
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, String, Text
-from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column, relationship
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text, event, text
+from sqlalchemy.orm import Mapped, MappedAsDataclass, Session, mapped_column, relationship
 
 from model.repository._base import Base, SoftDeleteTimestampMixin
 
@@ -68,6 +68,15 @@ class Post(MappedAsDataclass, Base, SoftDeleteTimestampMixin):
         init=True,
     )
 
+    # 6. 인덱스 (피드의 키셋 페이지네이션: 최신순 전체, 카테고리별)
+    __table_args__ = (
+        Index("ix_posts_media_upload_time_id", "media_upload_time", "id"),
+        Index(
+            "ix_posts_category_id_media_upload_time_id", "category_id", "media_upload_time", "id"
+        ),
+        {"extend_existing": True},
+    )
+
 
 class Category(MappedAsDataclass, Base):
     __tablename__ = "categories"
@@ -105,6 +114,86 @@ class Category(MappedAsDataclass, Base):
     )
 
 
+class CategoryClosure(MappedAsDataclass, Base):
+    """카테고리 계층의 모든 (조상, 자손) 쌍입니다. 자기 자신도 depth 0으로 포함합니다.
+
+    하위 카테고리 전체와 상위 경로를 재귀 없이 한 번의 조인으로 조회하기 위해 사용하며,
+    `Category`의 추가/이동은 아래 매퍼 이벤트가, 삭제는 외래 키 CASCADE가 반영합니다.
+    """
+
+    __tablename__ = "category_closure"
+
+    ancestor_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True
+    )
+    descendant_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False, doc="조상에서 자손까지의 거리")
+
+    __table_args__ = (Index("ix_category_closure_descendant_id", "descendant_id", "depth"),)
+
+
+@event.listens_for(Category, "after_insert")
+def _insert_category_closure(mapper, connection, target: Category):
+    connection.execute(
+        text(
+            "INSERT INTO category_closure (ancestor_id, descendant_id, depth) "
+            "SELECT ancestor_id, :id, depth + 1 FROM category_closure "
+            "WHERE descendant_id = :parent "
+            "UNION ALL SELECT :id, :id, 0"
+        ),
+        {"id": target.id, "parent": target.upper_category_id},
+    )
+    Session.object_session(target).info["category_changed"] = True
+
+
+@event.listens_for(Category, "after_update")
+def _move_category_closure(mapper, connection, target: Category):
+    from sqlalchemy import inspect
+
+    session = Session.object_session(target)
+    session.info["category_changed"] = True
+    if not inspect(target).attrs.upper_category_id.history.has_changes():
+        return
+    params = {"id": target.id, "parent": target.upper_category_id}
+    if (
+        target.upper_category_id is not None
+        and connection.execute(
+            text(
+                "SELECT 1 FROM category_closure WHERE ancestor_id = :id AND descendant_id = :parent"
+            ),
+            params,
+        ).first()
+    ):
+        raise ValueError(f"카테고리를 자신의 하위 카테고리 아래로 옮길 수 없습니다: {target.id}")
+    # 서브트리와 기존 조상 사이의 쌍을 지우고, 새 조상과의 쌍을 추가합니다.
+    connection.execute(
+        text(
+            "DELETE FROM category_closure "
+            "WHERE descendant_id IN (SELECT descendant_id FROM category_closure "
+            "WHERE ancestor_id = :id) "
+            "AND ancestor_id NOT IN (SELECT descendant_id FROM category_closure "
+            "WHERE ancestor_id = :id)"
+        ),
+        params,
+    )
+    connection.execute(
+        text(
+            "INSERT INTO category_closure (ancestor_id, descendant_id, depth) "
+            "SELECT up.ancestor_id, sub.descendant_id, up.depth + sub.depth + 1 "
+            "FROM category_closure up CROSS JOIN category_closure sub "
+            "WHERE up.descendant_id = :parent AND sub.ancestor_id = :id"
+        ),
+        params,
+    )
+
+
+@event.listens_for(Category, "after_delete")
+def _delete_category(mapper, connection, target: Category):
+    Session.object_session(target).info["category_changed"] = True
+
+
 class PostTag(MappedAsDataclass, Base):
     __tablename__ = "post_tags"
 
@@ -119,10 +208,14 @@ class PostTag(MappedAsDataclass, Base):
 class Tag(MappedAsDataclass, Base, SoftDeleteTimestampMixin):
     __tablename__ = "tags"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, doc="태그 PK")
+    id: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, autoincrement=True, doc="태그 PK", init=False
+    )
     name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, doc="태그 이름")
 
-    posts: Mapped[list["Post"]] = relationship("Post", secondary="post_tags", back_populates="tags")
+    posts: Mapped[list["Post"]] = relationship(
+        "Post", secondary="post_tags", back_populates="tags", default_factory=list
+    )
 
 
 class Comment(MappedAsDataclass, Base, SoftDeleteTimestampMixin):
@@ -176,6 +269,13 @@ class Comment(MappedAsDataclass, Base, SoftDeleteTimestampMixin):
         doc="대댓글 목록",
     )
 
+    # 5. 인덱스 (게시글별 최상위 댓글 키셋 페이지네이션, 대댓글 재귀 조회)
+    __table_args__ = (
+        Index("ix_comments_post_id_parent_comment_id_id", "post_id", "parent_comment_id", "id"),
+        Index("ix_comments_parent_comment_id", "parent_comment_id"),
+        {"extend_existing": True},
+    )
+
 
 # users : detail one-to-one
 # introduction : text
@@ -0,0 +1,75 @@
+from datetime import datetime
+
+from sqlalchemy import DDL, DateTime, Index, String, Text, event, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column
+
+from model.repository._base import Base
+from model.repository.post import Post
+
+
+class SearchDocument(MappedAsDataclass, Base):
+    """영상과 게시글의 검색 색인입니다. `repository.search_repository`가 갱신하고 조회합니다.
+
+    한국어는 형태소 분석 대신 글자 2-gram으로 나눈 토큰을 저장합니다.
+    PostgreSQL에서는 토큰으로 만든 tsvector와 GIN 인덱스를, SQLite에서는 FTS5 가상 테이블을
+    사용합니다.
+    """
+
+    __tablename__ = "search_documents"
+
+    doc_type: Mapped[str] = mapped_column(
+        String(20), primary_key=True, doc="문서 종류 (video, post)"
+    )
+    doc_id: Mapped[str] = mapped_column(String(20), primary_key=True, doc="영상 ID 또는 게시글 ID")
+    title: Mapped[str] = mapped_column(Text, doc="제목")
+    body: Mapped[str | None] = mapped_column(
+        Text, default=None, doc="본문 (영상 설명, 게시글 내용)"
+    )
+    title_tokens: Mapped[str] = mapped_column(Text, default="", doc="제목 토큰 (공백 구분)")
+    body_tokens: Mapped[str | None] = mapped_column(Text, default=None, doc="본문 토큰 (공백 구분)")
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        default=None,
+        doc="제목(가중치 A)과 본문(가중치 B) 토큰의 tsvector",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), init=False
+    )
+
+    __table_args__ = (
+        Index("ix_search_documents_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+
+event.listen(
+    SearchDocument.__table__,
+    "after_create",
+    DDL(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_documents_fts USING fts5("
+        "doc_type UNINDEXED, doc_id UNINDEXED, title_tokens, body_tokens)"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    SearchDocument.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS search_documents_fts").execute_if(dialect="sqlite"),
+)
+
+
+@event.listens_for(Post, "after_insert")
+@event.listens_for(Post, "after_update")
+def _index_post(mapper, connection, target: Post):
+    from repository.search_repository import delete_documents, upsert_documents
+
+    if target.is_deleted:
+        delete_documents(connection, "post", [str(target.id)])
+    else:
+        upsert_documents(connection, "post", [(str(target.id), target.title, target.content)])
+
+
+@event.listens_for(Post, "after_delete")
+def _unindex_post(mapper, connection, target: Post):
+    from repository.search_repository import delete_documents
+
+    delete_documents(connection, "post", [str(target.id)])
@@ -37,12 +37,10 @@ def _intern_create_categories(session: Session):
 
 
 def _intern_create_posts(session: Session, users, categories):
+    from repository.category_repository import CategoryRepository
 
     def _get_root_category(category):
-        current = category
-        while current.upper_category is not None:
-            current = current.upper_category
-        return current
+        return CategoryRepository(session).path_to_root(category.id)[-1]
 
     posts = []
     for idx, category in enumerate(categories):
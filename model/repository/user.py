@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from model.repository import Post
 
-from sqlalchemy import BigInteger, Boolean, String, Text
+from sqlalchemy import DDL, BigInteger, Boolean, Index, String, Text, event
 from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column, relationship
 
 from model.repository._base import Base, SoftDeleteTimestampMixin, users_id_fk
@@ -42,9 +42,41 @@ class Like(MappedAsDataclass, Base, SoftDeleteTimestampMixin):
 
     __table_args__ = (
         UniqueConstraint("user_id", "target_type", "target_id", name="uq_like_user_target"),
+        # 대상별 좋아요 수를 다시 계산할 때 사용합니다.
+        Index("ix_likes_target_type_target_id", "target_type", "target_id"),
     )
 
 
+class LikeCount(MappedAsDataclass, Base):
+    """대상별 좋아요 수 집계입니다. `service.like_service.LikeCounter`가 변경분을 모아 일괄 반영합니다."""
+
+    __tablename__ = "like_counts"
+
+    target_type: Mapped[str] = mapped_column(String(50), primary_key=True, doc="대상 종류")
+    target_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, doc="대상 ID")
+    count: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", doc="좋아요 수")
+
+
+class LikeCountEpoch(MappedAsDataclass, Base):
+    """좋아요 수 집계의 세대입니다. 행은 하나뿐이며, 집계를 다시 계산할 때마다 1씩 올라갑니다.
+
+    좋아요를 기록하는 트랜잭션은 이 행을 공유 잠금하고 읽은 세대를 변경분에 붙입니다.
+    다시 계산한 집계에는 이전 세대의 좋아요가 모두 포함되므로, 이전 세대의 변경분은 반영하지 않습니다.
+    """
+
+    __tablename__ = "like_count_epochs"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, doc="항상 1")
+    epoch: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", doc="세대")
+
+
+event.listen(
+    LikeCountEpoch.__table__,
+    "after_create",
+    DDL("INSERT INTO like_count_epochs (id, epoch) VALUES (1, 0)"),
+)
+
+
 class Follow(MappedAsDataclass, Base, SoftDeleteTimestampMixin):
     __tablename__ = "follows"
 
@@ -55,6 +87,12 @@ class Follow(MappedAsDataclass, Base, SoftDeleteTimestampMixin):
         BigInteger, users_id_fk(), primary_key=True, doc="팔로우 요청 대상의 사용자 ID"
     )
 
+    # 팔로잉 목록은 기본 키 (from_user_id, to_user_id)로, 팔로워 목록은 아래 역방향 인덱스로 조회합니다.
+    __table_args__ = (
+        Index("ix_follows_to_user_id_from_user_id", "to_user_id", "from_user_id"),
+        {"extend_existing": True},
+    )
+
 
 class UserDetail(MappedAsDataclass, Base, SoftDeleteTimestampMixin):
     __tablename__ = "user_details"
@@ -105,6 +143,14 @@ class User(MappedAsDataclass, Base, SoftDeleteTimestampMixin):
     password: Mapped[str] = mapped_column(String(255), doc="비밀번호 해싱값")
     password_salt: Mapped[str] = mapped_column(String(255), doc="비밀번호 해싱용 salt")
 
+    # 2-1. 집계값 (init=False, `FollowRepository`가 팔로우/언팔로우와 함께 갱신)
+    follower_count: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0", init=False, doc="팔로워 수"
+    )
+    following_count: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0", init=False, doc="팔로잉 수"
+    )
+
     # 3. 관계 필드 (init=False, 객체지향적 사용)
     details: Mapped["UserDetail"] = relationship(
         "UserDetail",
@@ -1,6 +1,17 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    DateTime,
+    Float,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    event,
+    func,
+)
 from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column
 
 from model.repository._base import Base, SoftDeleteTimestampMixin
@@ -16,4 +27,83 @@ class Video(MappedAsDataclass, Base, SoftDeleteTimestampMixin):
     rating: Mapped[float | None] = mapped_column(Float, doc="평균 평점")
     publish_date: Mapped[datetime | None] = mapped_column(DateTime, doc="영상 게시 날짜")
     thumbnail_url: Mapped[str | None] = mapped_column(String(255), doc="썸네일 URL")
-    views: Mapped[int | None] = mapped_column(Integer, default=0, doc="조회수")
+    views: Mapped[int | None] = mapped_column(BigInteger, default=0, doc="조회수")
+    fetched_at: Mapped[datetime | None] = mapped_column(
+        DateTime, default=None, doc="YouTube에서 상세 메타데이터를 가져온 시간"
+    )
+
+
+class HashTagSeenVideo(MappedAsDataclass, Base):
+    """해시태그 증분 크롤링에서 이미 수집한 영상 ID 인덱스입니다."""
+
+    __tablename__ = "hashtag_seen_videos"
+
+    hashtag: Mapped[str] = mapped_column(String(255), primary_key=True, doc="해시태그")
+    video_id: Mapped[str] = mapped_column(String(20), primary_key=True, doc="유튜브 영상 ID")
+    first_seen_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), init=False, doc="처음 수집한 시간"
+    )
+
+
+class HashTagFilteredVideo(MappedAsDataclass, Base):
+    """해시태그 증분 크롤링에서 추출했지만 필터 조건에 맞지 않아 제외한 영상 ID 인덱스입니다.
+
+    `filter_key`가 현재 필터 조건과 같은 행만 이미 검사한 영상으로 봅니다. 필터 조건이 바뀌면
+    이전 조건으로 제외한 영상은 다시 검사합니다.
+    """
+
+    __tablename__ = "hashtag_filtered_videos"
+
+    hashtag: Mapped[str] = mapped_column(String(255), primary_key=True, doc="해시태그")
+    video_id: Mapped[str] = mapped_column(String(20), primary_key=True, doc="유튜브 영상 ID")
+    filter_key: Mapped[str] = mapped_column(String(255), doc="제외할 때 적용한 필터 조건")
+    first_seen_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), init=False, doc="처음 제외한 시간"
+    )
+
+
+class VideoViewSnapshot(MappedAsDataclass, Base):
+    """크롤링 또는 영상 조회 시점의 조회수 기록입니다.
+
+    `captured_at` 기준으로 월 단위 RANGE 파티션에 저장되며, 파티션이 없는 기간은 기본 파티션에 저장됩니다.
+    쓰기 부담을 줄이기 위해 기본 키 외의 인덱스와 외래키를 두지 않고, 고정 길이 열을 앞에 배치합니다.
+    """
+
+    __tablename__ = "video_view_snapshots"
+    __table_args__ = (
+        # 영상별 시계열 조회를 위해 video_id를 기본 키 인덱스의 선두 열로 둡니다.
+        PrimaryKeyConstraint("video_id", "captured_at"),
+        {"postgresql_partition_by": "RANGE (captured_at)"},
+    )
+
+    captured_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), doc="기록 시간"
+    )
+    views: Mapped[int] = mapped_column(BigInteger, nullable=False, doc="조회수")
+    video_id: Mapped[str] = mapped_column(String(20), doc="유튜브 영상 ID")
+
+
+event.listen(
+    VideoViewSnapshot.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS video_view_snapshots_default "
+        "PARTITION OF video_view_snapshots DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
+
+
+class VideoViewRollup(MappedAsDataclass, Base):
+    """보존 기간이 지난 조회수 기록을 시간 또는 일 단위로 요약한 값입니다."""
+
+    __tablename__ = "video_view_rollups"
+
+    video_id: Mapped[str] = mapped_column(String(20), primary_key=True, doc="유튜브 영상 ID")
+    resolution: Mapped[str] = mapped_column(
+        String(8), primary_key=True, doc="요약 단위 (hour, day)"
+    )
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True, doc="구간 시작 시간")
+    views_min: Mapped[int] = mapped_column(BigInteger, nullable=False, doc="구간 최소 조회수")
+    views_max: Mapped[int] = mapped_column(BigInteger, nullable=False, doc="구간 최대 조회수")
+    views_last: Mapped[int] = mapped_column(BigInteger, nullable=False, doc="구간 마지막 조회수")
+    samples: Mapped[int] = mapped_column(Integer, nullable=False, doc="요약한 기록 수")
@@ -0,0 +1,199 @@
+import csv
+import json
+import time
+from datetime import datetime
+from itertools import islice
+from typing import IO, Callable, Iterable, Iterator
+
+from sqlalchemy import Engine, Table
+from sqlalchemy.sql.functions import now
+
+from model.repository._base import Base
+
+# COPY 진행 상황 콜백: (처리한 행 수, 경과 시간(초))
+Progress = Callable[[int, float], None]
+
+
+def get_table(name: str) -> Table:
+    """ORM 모델에 정의된 테이블을 이름으로 찾습니다."""
+    if name not in Base.metadata.tables:
+        tables = ", ".join(sorted(Base.metadata.tables))
+        raise ValueError(f"알 수 없는 테이블입니다: {name} (사용 가능: {tables})")
+    return Base.metadata.tables[name]
+
+
+def read_rows(stream: IO[str], format: str) -> tuple[list[str], Iterator[dict]]:
+    """JSONL 또는 CSV 스트림을 한 행씩 읽습니다. 열 목록은 CSV 헤더 또는 첫 JSON 객체에서 정합니다.
+
+    CSV의 빈 문자열은 NULL로 처리합니다.
+    """
+    match format:
+        case "csv":
+            reader = csv.DictReader(stream)
+            columns = list(reader.fieldnames or [])
+            rows = ({k: (v if v != "" else None) for k, v in row.items()} for row in reader)
+            return columns, rows
+        case "jsonl":
+            lines = (line for line in stream if line.strip())
+            first = next(lines, None)
+            if first is None:
+                return [], iter(())
+            head = json.loads(first)
+
+            def rows():
+                yield head
+                for line in lines:
+                    yield json.loads(line)
+
+            return list(head), rows()
+        case _:
+            raise ValueError(f"지원하지 않는 형식입니다: {format}")
+
+
+def copy_in(
+    engine: Engine,
+    table: Table,
+    columns: list[str],
+    rows: Iterable[dict],
+    chunk_size: int = 50_000,
+    upsert: bool = False,
+    on_progress: Progress | None = None,
+) -> int:
+    """행을 chunk_size개씩 `COPY FROM STDIN`으로 적재하고, 적재한 행 수를 반환합니다.
+
+    청크마다 커밋하므로 메모리 사용량과 트랜잭션 크기는 청크 크기로 제한됩니다.
+    upsert가 참이면 임시 스테이징 테이블에 COPY한 뒤 기본 키 충돌 시 입력값으로 갱신합니다.
+    입력에 없는 열 중 기본값이 있는 열(created_at 등)은 기본값으로 채웁니다.
+    """
+    unknown = [column for column in columns if column not in table.c]
+    if unknown:
+        raise ValueError(f"{table.name} 테이블에 없는 열입니다: {', '.join(unknown)}")
+    defaults = _defaults(table, columns)
+    all_columns = [*columns, *defaults]
+    primary_keys = [column.name for column in table.primary_key]
+    if upsert and not set(primary_keys) <= set(columns):
+        raise ValueError(f"upsert하려면 기본 키 열이 필요합니다: {', '.join(primary_keys)}")
+
+    rows = iter(rows)
+    target = f"_staging_{table.name}" if upsert else table.name
+    column_list = ", ".join(f'"{column}"' for column in all_columns)
+    started, total = time.monotonic(), 0
+    raw = engine.raw_connection()
+    try:
+        conn = raw.driver_connection
+        with conn.cursor() as cursor:
+            if upsert:
+                # 커밋할 때마다 비워지는 스테이징 테이블로, 청크 단위로 재사용합니다.
+                cursor.execute(
+                    f'CREATE TEMP TABLE IF NOT EXISTS "{target}" '
+                    f'(LIKE "{table.name}" INCLUDING DEFAULTS) ON COMMIT DELETE ROWS'
+                )
+                conn.commit()
+            while chunk := list(islice(rows, chunk_size)):
+                with cursor.copy(f'COPY "{target}" ({column_list}) FROM STDIN') as copy:
+                    values = list(defaults.values())
+                    for row in chunk:
+                        copy.write_row([*(row.get(column) for column in columns), *values])
+                if upsert:
+                    cursor.execute(_upsert_sql(table.name, target, all_columns, primary_keys))
+                conn.commit()
+                total += len(chunk)
+                if on_progress:
+                    on_progress(total, time.monotonic() - started)
+            _sync_sequence(cursor, table, columns)
+            if upsert:
+                cursor.execute(f'DROP TABLE IF EXISTS "{target}"')
+            conn.commit()
+    finally:
+        raw.close()
+    return total
+
+
+def copy_out(
+    engine: Engine,
+    table: Table,
+    stream: IO[bytes],
+    format: str,
+    on_progress: Progress | None = None,
+) -> int:
+    """테이블 전체를 `COPY TO STDOUT`으로 내보내고, 내보낸 행 수를 반환합니다."""
+    started, total, last_report = time.monotonic(), 0, 0.0
+    raw = engine.raw_connection()
+    try:
+        with raw.driver_connection.cursor() as cursor:
+            match format:
+                case "csv":
+                    sql = f'COPY "{table.name}" TO STDOUT WITH (FORMAT csv, HEADER)'
+                case "jsonl":
+                    sql = f'COPY (SELECT row_to_json(t)::text FROM "{table.name}" t) TO STDOUT'
+                case _:
+                    raise ValueError(f"지원하지 않는 형식입니다: {format}")
+            with cursor.copy(sql) as copy:
+                if format == "jsonl":
+                    # 텍스트 형식의 이스케이프를 해제하기 위해 행 단위로 읽습니다.
+                    copy.set_types(["text"])
+                    chunks = ((row[0] + "\n").encode() for row in copy.rows())
+                else:
+                    chunks = (bytes(data) for data in copy)
+                for data in chunks:
+                    stream.write(data)
+                    total += data.count(b"\n")
+                    elapsed = time.monotonic() - started
+                    if on_progress and elapsed - last_report >= 1:
+                        last_report = elapsed
+                        on_progress(total, elapsed)
+        raw.driver_connection.commit()
+    finally:
+        raw.close()
+    if format == "csv":
+        total = max(total - 1, 0)  # 헤더 행 제외
+    if on_progress:
+        on_progress(total, time.monotonic() - started)
+    return total
+
+
+def _defaults(table: Table, columns: list[str]) -> dict[str, object]:
+    """입력에 없는 열 중 상수 또는 now() 기본값이 있는 열의 값을 계산합니다."""
+    defaults = {}
+    for column in table.columns:
+        if column.name in columns or column.default is None:
+            continue
+        default = column.default
+        if default.is_scalar:
+            defaults[column.name] = default.arg
+        elif default.is_clause_element and isinstance(default.arg, now):
+            defaults[column.name] = datetime.now()
+    return defaults
+
+
+def _upsert_sql(table: str, staging: str, columns: list[str], primary_keys: list[str]) -> str:
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    updates = ", ".join(
+        f'"{column}" = EXCLUDED."{column}"' for column in columns if column not in primary_keys
+    )
+    conflict = ", ".join(f'"{column}"' for column in primary_keys)
+    action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+    # 같은 청크에 같은 키가 여러 번 있으면 마지막 행을 사용합니다.
+    return (
+        f'INSERT INTO "{table}" ({column_list}) '
+        f"SELECT DISTINCT ON ({conflict}) {column_list} "
+        f'FROM (SELECT *, ctid AS _ord FROM "{staging}") s ORDER BY {conflict}, _ord DESC '
+        f"ON CONFLICT ({conflict}) {action}"
+    )
+
+
+def _sync_sequence(cursor, table: Table, columns: list[str]):
+    """자동 증가 기본 키를 직접 적재했다면 시퀀스를 최댓값 이후로 맞춥니다."""
+    for column in table.primary_key:
+        if column.name in columns and column.autoincrement is True:
+            cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence('\"{table.name}\"', '{column.name}'), "
+                f'COALESCE(MAX("{column.name}"), 1), MAX("{column.name}") IS NOT NULL) '
+                f'FROM "{table.name}"'
+            )
+
+
+def format_progress(table: str, rows: int, elapsed: float) -> str:
+    """진행 상황을 `videos: 1,000행, 1.0초 (1,000행/초)` 형식으로 표시합니다."""
+    rate = rows / elapsed if elapsed > 0 else 0
+    return f"{table}: {rows:,}행, {elapsed:,.1f}초 ({rate:,.0f}행/초)"
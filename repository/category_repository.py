@@ -0,0 +1,68 @@
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from model.repository import Category, CategoryClosure, Post
+
+
+class CategoryRepository:
+    """`category_closure`를 이용해 카테고리 계층을 한 번의 쿼리로 조회합니다."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def descendants(self, category_id: int, include_self: bool = True) -> list[Category]:
+        """category_id의 모든 하위 카테고리를 깊이 순으로 조회합니다."""
+        query = (
+            select(Category)
+            .join(CategoryClosure, CategoryClosure.descendant_id == Category.id)
+            .where(CategoryClosure.ancestor_id == category_id)
+            .order_by(CategoryClosure.depth, Category.id)
+        )
+        if not include_self:
+            query = query.where(CategoryClosure.depth > 0)
+        return list(self.session.scalars(query))
+
+    def path_to_root(self, category_id: int) -> list[Category]:
+        """category_id부터 최상위 카테고리까지의 경로를 조회합니다. 마지막 원소가 최상위 카테고리입니다."""
+        query = (
+            select(Category)
+            .join(CategoryClosure, CategoryClosure.ancestor_id == Category.id)
+            .where(CategoryClosure.descendant_id == category_id)
+            .order_by(CategoryClosure.depth)
+        )
+        return list(self.session.scalars(query))
+
+    def post_counts(self, category_ids: list[int] | None = None) -> dict[int, int]:
+        """카테고리별로 하위 카테고리를 포함한 게시글 수를 조회합니다. 삭제된 게시글은 제외합니다."""
+        query = (
+            select(CategoryClosure.ancestor_id, func.count(Post.id))
+            .outerjoin(
+                Post,
+                (Post.category_id == CategoryClosure.descendant_id) & Post.is_deleted.isnot(True),
+            )
+            .group_by(CategoryClosure.ancestor_id)
+        )
+        if category_ids is not None:
+            query = query.where(CategoryClosure.ancestor_id.in_(category_ids))
+        counts = dict(self.session.execute(query).all())
+        if category_ids is not None:
+            return {category_id: counts.get(category_id, 0) for category_id in category_ids}
+        return counts
+
+    def rebuild_closure(self) -> int:
+        """`upper_category_id`로부터 `category_closure`를 다시 만들고, 만든 행 수를 반환합니다.
+
+        ORM을 거치지 않고 적재한 카테고리(`inssider import categories` 등)를 반영할 때 사용합니다.
+        """
+        self.session.execute(text("DELETE FROM category_closure"))
+        return self.session.execute(
+            text(
+                "INSERT INTO category_closure (ancestor_id, descendant_id, depth) "
+                "WITH RECURSIVE tree (ancestor_id, descendant_id, depth) AS ("
+                "SELECT id, id, 0 FROM categories "
+                "UNION ALL "
+                "SELECT tree.ancestor_id, c.id, tree.depth + 1 "
+                "FROM tree JOIN categories c ON c.upper_category_id = tree.descendant_id) "
+                "SELECT ancestor_id, descendant_id, depth FROM tree"
+            )
+        ).rowcount
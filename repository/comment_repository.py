@@ -0,0 +1,101 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# 게시글의 최상위 댓글 페이지와 그 대댓글을 한 번에 조회하는 재귀 CTE.
+# 재귀 CTE는 깊이 순(너비 우선)으로 행을 만들므로, 바깥 쿼리의 LIMIT에 도달하면 더 깊은 대댓글은
+# 계산하지 않습니다. 최상위 댓글은 다음 페이지 여부를 알기 위해 하나 더 가져오되 대댓글은 펼치지 않습니다.
+# 바깥 LIMIT은 가져온 최상위 댓글 수에 대댓글 max_nodes + 1개를 더해, max_nodes를 넘는 대댓글이
+# 있는지 알 수 있게 합니다.
+_THREAD_SQL = text("""
+    WITH RECURSIVE top AS (
+        SELECT id, parent_comment_id, user_id, content, is_deleted, created_at
+        FROM comments
+        WHERE post_id = :post_id AND parent_comment_id IS NULL AND id > :after
+        ORDER BY id
+        LIMIT :limit + 1
+    ),
+    thread AS (
+        SELECT top.*, 0 AS depth, row_number() OVER (ORDER BY top.id) AS rn
+        FROM top
+        UNION ALL
+        SELECT c.id, c.parent_comment_id, c.user_id, c.content, c.is_deleted, c.created_at,
+               t.depth + 1, NULL
+        FROM comments c
+        JOIN thread t ON c.parent_comment_id = t.id
+        WHERE t.depth < :max_depth AND (t.depth > 0 OR t.rn <= :limit)
+    )
+    SELECT t.id, t.parent_comment_id, t.user_id, t.content, t.is_deleted, t.created_at,
+           t.depth, t.rn,
+           (SELECT count(*) FROM comments r WHERE r.parent_comment_id = t.id) AS reply_count
+    FROM thread t
+    LIMIT (SELECT count(*) FROM top) + :max_nodes + 1
+    """)
+
+
+class CommentRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def thread(
+        self,
+        post_id: int,
+        after: int | None = None,
+        limit: int = 20,
+        max_depth: int = 10,
+        max_nodes: int = 2000,
+    ) -> tuple[list[dict], int | None, bool]:
+        """게시글의 최상위 댓글 limit개와 그 대댓글 트리를 한 번의 쿼리로 조회합니다.
+
+        - 최상위 댓글은 id 순으로, after 이후부터 조회합니다.
+        - 대댓글은 max_depth 깊이까지, 최상위 댓글을 제외하고 최대 max_nodes개까지 불러옵니다.
+          `reply_count`는 삭제된 댓글을 포함한 바로 아래 대댓글 수이며, 불러오지 못한 대댓글이
+          있는 댓글은 `more_replies`가 참입니다.
+        - 삭제된 댓글은 남은 대댓글이 있을 때만 내용 없이 포함합니다.
+        (최상위 댓글 트리 목록, 다음 커서, max_nodes에 도달했는지)를 반환합니다.
+        """
+        rows = self.session.execute(
+            _THREAD_SQL,
+            {
+                "post_id": post_id,
+                "after": after or 0,
+                "limit": limit,
+                "max_depth": max_depth,
+                "max_nodes": max_nodes,
+            },
+        ).all()
+
+        tops = [row for row in rows if row.depth == 0]
+        next_cursor = tops[limit - 1].id if len(tops) > limit else None
+        replies = [row for row in rows if row.depth > 0]
+        truncated = len(replies) > max_nodes
+        return _assemble(tops[:limit], replies[:max_nodes]), next_cursor, truncated
+
+
+def _assemble(tops, replies) -> list[dict]:
+    """행 목록을 O(n)으로 트리로 조립합니다. 대댓글은 id 순으로 정렬합니다."""
+    nodes = {}
+    for row in [*tops, *replies]:
+        nodes[row.id] = {
+            "id": row.id,
+            "user_id": row.user_id,
+            "content": None if row.is_deleted else row.content,
+            "created_at": row.created_at,
+            "depth": row.depth,
+            "deleted": bool(row.is_deleted),
+            "reply_count": row.reply_count,
+            "more_replies": False,
+            "replies": [],
+        }
+    for row in sorted(replies, key=lambda row: row.id):
+        parent = nodes.get(row.parent_comment_id)
+        if parent is not None:
+            parent["replies"].append(nodes[row.id])
+    for node in nodes.values():
+        node["more_replies"] = len(node["replies"]) < node["reply_count"]
+
+    def prune(node: dict) -> bool:
+        # 대댓글을 먼저 정리한 뒤, 남은 대댓글이 없는 삭제된 댓글은 제외합니다.
+        node["replies"] = [reply for reply in node["replies"] if prune(reply)]
+        return not node["deleted"] or bool(node["replies"]) or node["more_replies"]
+
+    return [nodes[row.id] for row in tops if prune(nodes[row.id])]
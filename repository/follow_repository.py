@@ -0,0 +1,123 @@
+from sqlalchemy import delete, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from model.repository import Follow, User
+
+
+class FollowRepository:
+    """팔로우 관계와 `users`의 팔로워/팔로잉 수를 함께 관리합니다.
+
+    `User.following` 관계를 직접 수정하면 집계값이 갱신되지 않으므로 팔로우/언팔로우는 이
+    저장소를 사용합니다. 어긋난 집계값은 `repair_counts`로 다시 계산합니다.
+    soft-delete된 팔로우와 사용자는 목록과 다시 계산한 집계값에서 제외합니다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def follow(self, from_user_id: int, to_user_id: int) -> bool:
+        """팔로우하고, 새로 팔로우했으면 양쪽 사용자의 집계값을 1 늘립니다.
+
+        soft-delete된 팔로우가 있으면 되살리고 새로 팔로우한 것으로 봅니다.
+        """
+        if from_user_id == to_user_id:
+            raise ValueError("자기 자신은 팔로우할 수 없습니다.")
+        inserted = self.session.execute(
+            insert(Follow)
+            .values(from_user_id=from_user_id, to_user_id=to_user_id)
+            .on_conflict_do_update(
+                index_elements=[Follow.from_user_id, Follow.to_user_id],
+                set_={"is_deleted": False, "deleted_at": None, "updated_at": func.now()},
+                where=Follow.is_deleted.is_(True),
+            )
+            .returning(Follow.from_user_id)
+        ).first()
+        if inserted is None:
+            return False
+        self._add_counts(from_user_id, to_user_id, 1)
+        return True
+
+    def unfollow(self, from_user_id: int, to_user_id: int) -> bool:
+        """언팔로우하고, 팔로우 중이었으면 양쪽 사용자의 집계값을 1 줄입니다."""
+        deleted = self.session.execute(
+            delete(Follow)
+            .where(
+                Follow.from_user_id == from_user_id,
+                Follow.to_user_id == to_user_id,
+                Follow.is_deleted.isnot(True),
+            )
+            .returning(Follow.from_user_id)
+        ).first()
+        if deleted is None:
+            return False
+        self._add_counts(from_user_id, to_user_id, -1)
+        return True
+
+    def followers(
+        self, user_id: int, after: int | None = None, limit: int = 20
+    ) -> tuple[list[User], int | None]:
+        """user_id를 팔로우하는 사용자를 ID 순으로 limit명 조회하고, (목록, 다음 커서)를 반환합니다."""
+        return self._page(Follow.to_user_id, Follow.from_user_id, user_id, after, limit)
+
+    def following(
+        self, user_id: int, after: int | None = None, limit: int = 20
+    ) -> tuple[list[User], int | None]:
+        """user_id가 팔로우하는 사용자를 ID 순으로 limit명 조회하고, (목록, 다음 커서)를 반환합니다."""
+        return self._page(Follow.from_user_id, Follow.to_user_id, user_id, after, limit)
+
+    def repair_counts(self, after: int = 0, limit: int = 10_000) -> tuple[int, int | None]:
+        """ID가 after보다 큰 사용자 limit명의 집계값을 `follows`에서 다시 계산합니다.
+
+        (수정한 사용자 수, 다음 배치의 after)를 반환하며, 마지막 배치이면 after는 None입니다.
+        """
+        last = self.session.execute(
+            select(func.max(User.id)).where(
+                User.id.in_(select(User.id).where(User.id > after).order_by(User.id).limit(limit))
+            )
+        ).scalar()
+        if last is None:
+            return 0, None
+        fixed = self.session.execute(
+            text(
+                "UPDATE users u SET follower_count = a.follower_count, "
+                "following_count = a.following_count "
+                "FROM (SELECT id, "
+                "(SELECT count(*) FROM follows f JOIN users o ON o.id = f.from_user_id "
+                "WHERE f.to_user_id = users.id "
+                "AND f.is_deleted IS NOT TRUE AND o.is_deleted IS NOT TRUE) AS follower_count, "
+                "(SELECT count(*) FROM follows f JOIN users o ON o.id = f.to_user_id "
+                "WHERE f.from_user_id = users.id "
+                "AND f.is_deleted IS NOT TRUE AND o.is_deleted IS NOT TRUE) AS following_count "
+                "FROM users WHERE id > :after AND id <= :last) a "
+                "WHERE u.id = a.id AND (u.follower_count, u.following_count) "
+                "IS DISTINCT FROM (a.follower_count, a.following_count) "
+                "RETURNING u.id"
+            ),
+            {"after": after, "last": last},
+        ).all()
+        return len(fixed), last
+
+    def _add_counts(self, from_user_id: int, to_user_id: int, delta: int):
+        # 동시에 서로를 팔로우할 때 교착 상태가 생기지 않도록 항상 ID 순서로 행을 잠급니다.
+        columns = {from_user_id: User.following_count, to_user_id: User.follower_count}
+        for user_id in sorted(columns):
+            column = columns[user_id]
+            self.session.execute(
+                update(User).where(User.id == user_id).values({column: column + delta})
+            )
+
+    def _page(self, owner, other, user_id, after, limit):
+        query = (
+            select(User)
+            .join(Follow, other == User.id)
+            .where(owner == user_id, Follow.is_deleted.isnot(True), User.is_deleted.isnot(True))
+            .order_by(other)
+            .limit(limit + 1)
+        )
+        if after is not None:
+            query = query.where(other > after)
+        users = list(self.session.scalars(query))
+        if len(users) > limit:
+            return users[:limit], users[limit - 1].id
+        return users, None
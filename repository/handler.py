@@ -1,6 +1,18 @@
+import threading
+import time
+from functools import cache
+from typing import AsyncIterator
+
 from dotenv import dotenv_values, load_dotenv
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy import AsyncAdaptedQueuePool, Engine, QueuePool, create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
 
 from model.repository._base import Base
 
@@ -8,39 +20,120 @@ from model.repository._base import Base
 load_dotenv()
 
 
+@cache
+def _settings() -> dict[str, str | None]:
+    """`.env` 파일은 프로세스에서 한 번만 읽습니다."""
+    return dotenv_values()
+
+
+def _database_url(database=None, user=None, password=None, host=None, port=None) -> str:
+    """환경 변수와 매개변수로 psycopg 데이터베이스 URL을 만듭니다. 매개변수가 환경 변수보다 우선합니다."""
+    # 환경 변수에서 설정 가져오기 (기본값 제공)
+    envs = _settings()
+    db = database or envs.get("POSTGRES_DATABASE", "dev")
+    user = user or envs.get("POSTGRES_USER", "user")
+    pwd = password or envs.get("POSTGRES_PASSWORD", "user")
+    port = port or envs.get("POSTGRES_PORT", "5432")
+
+    # host 정규화: localhost와 127.0.0.1을 동일하게 처리
+    host = host or envs.get("POSTGRES_HOST", "localhost")
+    if host in ["localhost", "127.0.0.1"]:
+        host = "localhost"  # 정규화된 값으로 통일
+
+    # 데이터베이스 URL 생성 (엔진 키로 사용)
+    return f"postgresql+psycopg://{user}:{pwd}@{host}:{port}/{db}"
+
+
+@cache
+def _pool_options() -> dict:
+    """커넥션 풀 설정입니다. 워커 수 x (pool_size + max_overflow)가 Postgres의 max_connections를
+    넘지 않도록 설정합니다.
+    """
+    envs = _settings()
+    return {
+        "pool_size": int(envs.get("POSTGRES_POOL_SIZE") or 5),
+        "max_overflow": int(envs.get("POSTGRES_MAX_OVERFLOW") or 10),
+        "pool_timeout": float(envs.get("POSTGRES_POOL_TIMEOUT") or 30),
+        "pool_pre_ping": (envs.get("POSTGRES_POOL_PRE_PING") or "true").lower() == "true",
+        "pool_recycle": int(envs.get("POSTGRES_POOL_RECYCLE") or 1800),
+    }
+
+
+class _PoolMetrics:
+    """커넥션을 얻기까지 기다린 시간과 대기 시간 초과 횟수를 집계하는 QueuePool 확장입니다."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._metrics_lock:
+                self._timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._metrics_lock:
+                self._checkouts += 1
+                self._wait_seconds += waited
+                self._max_wait_seconds = max(self._max_wait_seconds, waited)
+
+    def stats(self) -> dict:
+        with self._metrics_lock:
+            checkouts, wait_seconds = self._checkouts, self._wait_seconds
+            return {
+                "size": self.size(),
+                "checked_out": self.checkedout(),
+                "checked_in": self.checkedin(),
+                "overflow": max(self.overflow(), 0),
+                "max_overflow": self._max_overflow,
+                "checkouts": checkouts,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": round(wait_seconds / checkouts * 1000, 3) if checkouts else None,
+                "max_wait_ms": round(self._max_wait_seconds * 1000, 3),
+            }
+
+
+class MeteredQueuePool(_PoolMetrics, QueuePool):
+    """지표를 집계하는 동기 엔진용 커넥션 풀입니다."""
+
+
+class MeteredAsyncQueuePool(_PoolMetrics, AsyncAdaptedQueuePool):
+    """지표를 집계하는 비동기 엔진용 커넥션 풀입니다."""
+
+
 class DatabaseManager:
     """SQLAlchemy를 사용한 데이터베이스 관리자 클래스"""
 
-    _engines = {}  # URL별로 엔진을 저장하는 클래스 변수
+    _engines: dict[str, Engine] = {}  # URL별로 엔진을 저장하는 클래스 변수
+    _sessionmakers: dict[str, sessionmaker[Session]] = {}
 
     def __init__(self, database=None, user=None, password=None, host=None, port=None):
         """
         환경 변수에서 설정을 가져와 데이터베이스 연결을 초기화합니다.
         매개변수를 제공하면 환경 변수보다 우선합니다.
         """
-        # 환경 변수에서 설정 가져오기 (기본값 제공)
-        envs = dotenv_values()
-        db = database or envs.get("POSTGRES_DATABASE", "dev")
-        user = user or envs.get("POSTGRES_USER", "user")
-        pwd = password or envs.get("POSTGRES_PASSWORD", "user")
-        port = port or envs.get("POSTGRES_PORT", "5432")
-
-        # host 정규화: localhost와 127.0.0.1을 동일하게 처리
-        host = host or envs.get("POSTGRES_HOST", "localhost")
-        if host in ["localhost", "127.0.0.1"]:
-            host = "localhost"  # 정규화된 값으로 통일
-
-        # 데이터베이스 URL 생성 (엔진 키로 사용)
-        self.db_url = f"postgresql+psycopg://{user}:{pwd}@{host}:{port}/{db}"
+        self.db_url = _database_url(database, user, password, host, port)
 
         # URL에 해당하는 엔진 가져오기 (없으면 새로 생성)
         if self.db_url not in self._engines:
-            self._engines[self.db_url] = create_engine(self.db_url, echo=False)
+            engine = create_engine(
+                self.db_url, echo=False, poolclass=MeteredQueuePool, **_pool_options()
+            )
+            self._engines[self.db_url] = engine
+            self._sessionmakers[self.db_url] = sessionmaker(bind=engine)
         self.engine: Engine = self._engines[self.db_url]
 
-    def __enter__(self):
-        """컨텍스트 매니저 진입 시 호출됩니다."""
-        self.session = scoped_session(sessionmaker(bind=self.engine))
+    def __enter__(self) -> Session:
+        """컨텍스트 매니저 진입 시 호출됩니다. 진입할 때마다 새 세션을 엽니다."""
+        self.session = self._sessionmakers[self.db_url]()
         return self.session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -61,6 +154,75 @@ class DatabaseManager:
         Base.metadata.drop_all(self.engine)
 
 
+class AsyncDatabaseManager:
+    """`DatabaseManager`의 비동기 버전으로, psycopg 비동기 드라이버와 `AsyncSession`을 사용합니다.
+
+    async 핸들러에서 스레드 풀을 거치지 않고 이벤트 루프 안에서 DB 작업을 처리합니다.
+    엔진은 `DatabaseManager`와 같이 URL별로 공유합니다.
+    """
+
+    _engines: dict[str, AsyncEngine] = {}  # URL별로 엔진을 저장하는 클래스 변수
+    _sessionmakers: dict[str, async_sessionmaker[AsyncSession]] = {}
+
+    def __init__(self, database=None, user=None, password=None, host=None, port=None):
+        self.db_url = _database_url(database, user, password, host, port)
+
+        # URL에 해당하는 엔진 가져오기 (없으면 새로 생성)
+        if self.db_url not in self._engines:
+            engine = create_async_engine(
+                self.db_url, echo=False, poolclass=MeteredAsyncQueuePool, **_pool_options()
+            )
+            self._engines[self.db_url] = engine
+            self._sessionmakers[self.db_url] = async_sessionmaker(engine, expire_on_commit=False)
+        self.engine: AsyncEngine = self._engines[self.db_url]
+
+    async def __aenter__(self) -> AsyncSession:
+        """비동기 컨텍스트 매니저 진입 시 호출됩니다."""
+        self.session = self._sessionmakers[self.db_url]()
+        return self.session
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료 시 호출됩니다."""
+        if exc_type is not None:
+            await self.session.rollback()
+            print(f"세션 롤백: {exc_val}")
+        else:
+            await self.session.commit()
+        await self.session.close()
+
+    @classmethod
+    async def dispose(cls):
+        """모든 비동기 엔진의 연결을 닫습니다. 이벤트 루프가 끝나기 전에 호출해야 합니다."""
+        for engine in cls._engines.values():
+            await engine.dispose()
+
+
+def pool_stats() -> dict:
+    """생성된 모든 엔진의 커넥션 풀 지표를 반환합니다. 키는 비밀번호를 가린 URL입니다."""
+    engines = {
+        "sync": DatabaseManager._engines.values(),
+        "async": AsyncDatabaseManager._engines.values(),
+    }
+    return {
+        kind: {
+            engine.url.render_as_string(hide_password=True): engine.pool.stats()
+            for engine in values
+        }
+        for kind, values in engines.items()
+    }
+
+
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI 의존성으로 사용하는 요청 단위 비동기 세션입니다. 응답 후 커밋하고, 예외 시 롤백합니다.
+
+    ```python
+    async def handler(session: Annotated[AsyncSession, Depends(get_async_session)]): ...
+    ```
+    """
+    async with AsyncDatabaseManager() as session:
+        yield session
+
+
 if __name__ == "__main__":
     from sqlalchemy.schema import CreateTable
 
@@ -0,0 +1,140 @@
+from typing import Iterable
+
+from sqlalchemy import delete, func, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from model.repository import Like, LikeCount, LikeCountEpoch
+
+# 좋아요 대상: (target_type, target_id)
+Target = tuple[str, int]
+
+
+class LikeRepository:
+    """좋아요 기록과 대상별 좋아요 수 집계(`like_counts`)를 관리합니다.
+
+    soft-delete된 좋아요는 좋아요하지 않은 것으로 보고 다시 계산한 집계에서 제외합니다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def like(self, user_id: int, target: Target) -> bool:
+        """좋아요를 기록하고, 새로 기록했는지 반환합니다.
+
+        soft-delete된 좋아요가 있으면 되살리고 새로 기록한 것으로 봅니다.
+        """
+        target_type, target_id = target
+        inserted = self.session.execute(
+            insert(Like)
+            .values(user_id=user_id, target_type=target_type, target_id=target_id)
+            .on_conflict_do_update(
+                index_elements=[Like.user_id, Like.target_type, Like.target_id],
+                set_={"is_deleted": False, "deleted_at": None, "updated_at": func.now()},
+                where=Like.is_deleted.is_(True),
+            )
+            .returning(Like.id)
+        ).first()
+        return inserted is not None
+
+    def unlike(self, user_id: int, target: Target) -> bool:
+        """좋아요를 취소하고, 취소할 기록이 있었는지 반환합니다."""
+        target_type, target_id = target
+        deleted = self.session.execute(
+            delete(Like)
+            .where(
+                Like.user_id == user_id,
+                Like.target_type == target_type,
+                Like.target_id == target_id,
+                Like.is_deleted.isnot(True),
+            )
+            .returning(Like.id)
+        ).first()
+        return deleted is not None
+
+    def epoch(self) -> int:
+        """집계의 현재 세대를 공유 잠금하고 반환합니다. 잠금은 트랜잭션이 끝날 때까지 유지됩니다.
+
+        `reconcile`은 세대를 올리면서 이 잠금을 기다리므로, 세대를 읽은 트랜잭션의 좋아요는
+        커밋된 뒤에 다시 계산됩니다. 모든 좋아요 트랜잭션이 같은 행을 공유 잠금하므로, 동시에 여러
+        트랜잭션이 잠그면 Postgres가 MultiXact를 만듭니다. 좋아요가 매우 많이 몰리는 환경에서는
+        `pg_stat_slru`의 MultiXact 사용량을 지켜봐야 합니다.
+        """
+        return self.session.execute(
+            select(LikeCountEpoch.epoch).where(LikeCountEpoch.id == 1).with_for_update(read=True)
+        ).scalar_one()
+
+    def apply_deltas(self, deltas: dict[Target, int], epoch: int | None = None) -> int:
+        """대상별 변경분을 한 번의 upsert로 집계에 더하고, 반영한 대상 수를 반환합니다.
+
+        epoch는 변경분을 기록할 때 읽은 세대입니다. 그 뒤에 `reconcile`이 집계를 다시 계산했다면
+        변경분이 이미 집계에 포함되어 있으므로 반영하지 않고 0을 반환합니다.
+        """
+        if epoch is not None and epoch < self.epoch():
+            return 0
+        # 여러 프로세스가 동시에 반영할 때 교착 상태가 생기지 않도록 항상 같은 순서로 행을 잠급니다.
+        values = [
+            {"target_type": target_type, "target_id": target_id, "count": delta}
+            for (target_type, target_id), delta in sorted(deltas.items())
+            if delta
+        ]
+        if not values:
+            return 0
+        statement = insert(LikeCount).values(values)
+        self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[LikeCount.target_type, LikeCount.target_id],
+                set_={"count": LikeCount.count + statement.excluded.count},
+            )
+        )
+        return len(values)
+
+    def counts(self, targets: Iterable[Target]) -> dict[Target, int]:
+        """여러 대상의 좋아요 수를 한 번의 쿼리로 조회합니다. 집계가 없는 대상은 0입니다."""
+        targets = list(dict.fromkeys(targets))
+        if not targets:
+            return {}
+        rows = self.session.execute(
+            select(LikeCount.target_type, LikeCount.target_id, LikeCount.count).where(
+                tuple_(LikeCount.target_type, LikeCount.target_id).in_(targets)
+            )
+        )
+        counts = {(target_type, target_id): count for target_type, target_id, count in rows}
+        return {target: counts.get(target, 0) for target in targets}
+
+    def reconcile(self) -> int:
+        """`likes`에서 좋아요 수를 다시 계산하여 어긋난 집계를 고치고, 고친 대상 수를 반환합니다.
+
+        먼저 세대를 올립니다. 세대를 읽은 좋아요 트랜잭션이 모두 끝나야 올릴 수 있고, 이 트랜잭션이
+        끝날 때까지 새 좋아요와 변경분 반영은 기다리므로, 다시 계산한 집계에는 이전 세대의 좋아요가
+        모두 포함됩니다. 아직 반영되지 않은 이전 세대의 변경분은 `apply_deltas`에서 버려집니다.
+
+        세대 행의 잠금은 `likes` 전체를 다시 세는 동안 유지되므로, 그동안 모든 좋아요, 좋아요 취소,
+        변경분 반영이 멈춥니다. `likes`가 커질수록 멈추는 시간이 길어지므로 트래픽이 적은 시간에
+        실행해야 합니다.
+        """
+        self.session.execute(
+            update(LikeCountEpoch)
+            .where(LikeCountEpoch.id == 1)
+            .values(epoch=LikeCountEpoch.epoch + 1)
+        )
+        fixed = self.session.execute(
+            text(
+                "INSERT INTO like_counts (target_type, target_id, count) "
+                "SELECT target_type, target_id, count(*) FROM likes "
+                "WHERE is_deleted IS NOT TRUE GROUP BY 1, 2 "
+                "ON CONFLICT (target_type, target_id) DO UPDATE SET count = EXCLUDED.count "
+                "WHERE like_counts.count <> EXCLUDED.count "
+                "RETURNING target_type"
+            )
+        ).all()
+        zeroed = self.session.execute(
+            text(
+                "UPDATE like_counts c SET count = 0 WHERE count <> 0 AND NOT EXISTS ("
+                "SELECT 1 FROM likes l "
+                "WHERE l.target_type = c.target_type AND l.target_id = c.target_id "
+                "AND l.is_deleted IS NOT TRUE) "
+                "RETURNING target_type"
+            )
+        ).all()
+        return len(fixed) + len(zeroed)
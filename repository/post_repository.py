@@ -0,0 +1,57 @@
+from datetime import datetime
+
+from sqlalchemy import exists, select, tuple_
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from model.repository import Post, User
+from model.repository.post import PostTag, Tag
+from repository.tag_repository import normalize_tag
+
+# 피드 커서: 마지막 게시글의 (media_upload_time, id)
+FeedCursor = tuple[datetime, int]
+
+
+class PostRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def feed(
+        self,
+        after: FeedCursor | None = None,
+        limit: int = 20,
+        category_ids: list[int] | None = None,
+        tag: str | None = None,
+    ) -> tuple[list[Post], FeedCursor | None]:
+        """게시글을 최신순으로 limit개 조회하고, (목록, 다음 커서)를 반환합니다.
+
+        (media_upload_time, id) 키셋으로 페이지를 나누므로 페이지 깊이와 관계없이 인덱스 범위만
+        읽습니다. 작성자, 카테고리는 조인으로, 태그는 selectin으로 함께 불러와 페이지마다 쿼리는
+        2번입니다.
+        """
+        query = (
+            select(Post)
+            .where(Post.is_deleted.isnot(True))
+            .options(
+                joinedload(Post.user).joinedload(User.details),
+                joinedload(Post.category),
+                selectinload(Post.tags),
+            )
+            .order_by(Post.media_upload_time.desc(), Post.id.desc())
+            .limit(limit + 1)
+        )
+        if after is not None:
+            query = query.where(tuple_(Post.media_upload_time, Post.id) < tuple_(*after))
+        if category_ids is not None:
+            query = query.where(Post.category_id.in_(category_ids))
+        if tag is not None:
+            # 태그는 정규화한 이름으로 저장되므로 `#밈`과 `밈`은 같은 태그입니다.
+            query = query.where(
+                exists()
+                .where(PostTag.post_id == Post.id, PostTag.tag_id == Tag.id)
+                .where(Tag.name == normalize_tag(tag))
+            )
+        posts = list(self.session.scalars(query).unique())
+        if len(posts) > limit:
+            last = posts[limit - 1]
+            return posts[:limit], (last.media_upload_time, last.id)
+        return posts, None
@@ -0,0 +1,208 @@
+import re
+from itertools import batched
+from typing import Iterable
+
+from sqlalchemy import Connection, select, text
+from sqlalchemy.orm import Session
+
+from model.repository import Post, Video
+
+# 한글 연속 구간, 그 밖의 문자/숫자 연속 구간
+_WORD = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+_HANGUL = re.compile(r"[가-힣]+")
+
+# (문서 ID, 제목, 본문). 본문이 None이면 저장된 본문을 유지합니다.
+Document = tuple[str, str, str | None]
+# 검색 커서: 마지막 결과의 (점수, 문서 종류, 문서 ID)
+SearchCursor = tuple[float, str, str]
+
+
+def tokenize(value: str | None) -> list[str]:
+    """검색 토큰으로 나눕니다. 한글은 글자 2-gram으로, 그 밖의 단어는 소문자 단어로 나눕니다.
+
+    "밈모음 BTS" -> ["밈모", "모음", "bts"]
+    """
+    tokens = []
+    for word in _WORD.findall((value or "").lower()):
+        if _HANGUL.fullmatch(word) and len(word) > 1:
+            tokens += [a + b for a, b in zip(word, word[1:])]
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _query_terms(query: str) -> list[tuple[str, bool]]:
+    """검색어를 (토큰, 접두사 검색 여부) 목록으로 만듭니다. 한 글자 한글은 2-gram의 접두사로 찾습니다."""
+    terms = dict.fromkeys(tokenize(query))
+    return [(term, bool(_HANGUL.fullmatch(term)) and len(term) == 1) for term in terms]
+
+
+_UPSERT_SQL = {
+    "postgresql": (
+        "INSERT INTO search_documents "
+        "(doc_type, doc_id, title, body, title_tokens, body_tokens, search_vector, updated_at) "
+        "VALUES (:doc_type, :doc_id, :title, :body, :title_tokens, :body_tokens, "
+        "setweight(to_tsvector('simple', :title_tokens), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(CAST(:body_tokens AS text), '')), 'B'), "
+        "CURRENT_TIMESTAMP) "
+        "ON CONFLICT (doc_type, doc_id) DO UPDATE SET "
+        "title = EXCLUDED.title, "
+        "body = coalesce(EXCLUDED.body, search_documents.body), "
+        "title_tokens = EXCLUDED.title_tokens, "
+        "body_tokens = coalesce(EXCLUDED.body_tokens, search_documents.body_tokens), "
+        "search_vector = setweight(to_tsvector('simple', EXCLUDED.title_tokens), 'A') || "
+        "setweight(to_tsvector('simple', "
+        "coalesce(EXCLUDED.body_tokens, search_documents.body_tokens, '')), 'B'), "
+        "updated_at = CURRENT_TIMESTAMP "
+        # 내용이 같으면 GIN 인덱스를 다시 쓰지 않습니다.
+        "WHERE (search_documents.title, search_documents.body) IS DISTINCT FROM "
+        "(EXCLUDED.title, coalesce(EXCLUDED.body, search_documents.body))"
+    ),
+    "sqlite": (
+        "INSERT INTO search_documents "
+        "(doc_type, doc_id, title, body, title_tokens, body_tokens, updated_at) "
+        "VALUES (:doc_type, :doc_id, :title, :body, :title_tokens, :body_tokens, "
+        "CURRENT_TIMESTAMP) "
+        "ON CONFLICT (doc_type, doc_id) DO UPDATE SET "
+        "title = excluded.title, "
+        "body = coalesce(excluded.body, search_documents.body), "
+        "title_tokens = excluded.title_tokens, "
+        "body_tokens = coalesce(excluded.body_tokens, search_documents.body_tokens), "
+        "updated_at = CURRENT_TIMESTAMP"
+    ),
+}
+
+
+def upsert_documents(connection: Connection, doc_type: str, documents: Iterable[Document]):
+    """문서를 색인에 추가하거나 갱신합니다. 매퍼 이벤트에서도 호출하므로 연결을 받습니다."""
+    params = [
+        {
+            "doc_type": doc_type,
+            "doc_id": doc_id,
+            "title": title or "",
+            "body": body,
+            "title_tokens": " ".join(tokenize(title)),
+            "body_tokens": " ".join(tokenize(body)) if body is not None else None,
+        }
+        for doc_id, title, body in {doc[0]: doc for doc in documents}.values()
+    ]
+    if not params:
+        return
+    dialect = connection.dialect.name
+    connection.execute(text(_UPSERT_SQL[dialect]), params)
+    if dialect == "sqlite":
+        _sync_fts(connection, doc_type, [param["doc_id"] for param in params])
+
+
+def delete_documents(connection: Connection, doc_type: str, doc_ids: list[str]):
+    """문서를 색인에서 제거합니다."""
+    params = [{"doc_type": doc_type, "doc_id": doc_id} for doc_id in doc_ids]
+    if not params:
+        return
+    connection.execute(
+        text("DELETE FROM search_documents WHERE doc_type = :doc_type AND doc_id = :doc_id"),
+        params,
+    )
+    if connection.dialect.name == "sqlite":
+        _sync_fts(connection, doc_type, doc_ids)
+
+
+def _sync_fts(connection: Connection, doc_type: str, doc_ids: list[str]):
+    params = [{"doc_type": doc_type, "doc_id": doc_id} for doc_id in doc_ids]
+    connection.execute(
+        text("DELETE FROM search_documents_fts WHERE doc_type = :doc_type AND doc_id = :doc_id"),
+        params,
+    )
+    connection.execute(
+        text(
+            "INSERT INTO search_documents_fts (doc_type, doc_id, title_tokens, body_tokens) "
+            "SELECT doc_type, doc_id, title_tokens, body_tokens FROM search_documents "
+            "WHERE doc_type = :doc_type AND doc_id = :doc_id"
+        ),
+        params,
+    )
+
+
+class SearchRepository:
+    """영상과 게시글의 검색 색인(`search_documents`)을 갱신하고 조회합니다."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def index(self, doc_type: str, documents: Iterable[Document]):
+        upsert_documents(self.session.connection(), doc_type, documents)
+
+    def search(
+        self,
+        query: str,
+        doc_type: str | None = None,
+        after: SearchCursor | None = None,
+        limit: int = 20,
+    ) -> tuple[list[dict], SearchCursor | None]:
+        """검색어의 모든 토큰을 포함하는 문서를 관련도 순으로 limit개 조회합니다.
+
+        제목에 포함된 토큰이 본문보다 높은 점수를 받습니다. (점수, 문서 종류, 문서 ID) 키셋으로
+        페이지를 나눕니다. (결과 목록, 다음 커서)를 반환합니다.
+        """
+        terms = _query_terms(query)
+        if not terms:
+            return [], None
+        params = {"limit": limit + 1, "doc_type": doc_type}
+        if self.session.bind.dialect.name == "sqlite":
+            params["query"] = " AND ".join(
+                f'"{term}"' + ("*" if prefix else "") for term, prefix in terms
+            )
+            matches = (
+                "SELECT d.doc_type, d.doc_id, d.title, d.body, "
+                "-bm25(search_documents_fts, 0, 0, 2.0, 1.0) AS score "
+                "FROM search_documents_fts f JOIN search_documents d "
+                "ON d.doc_type = f.doc_type AND d.doc_id = f.doc_id "
+                "WHERE search_documents_fts MATCH :query"
+            )
+        else:
+            params["query"] = " & ".join(
+                f"'{term}'" + (":*" if prefix else "") for term, prefix in terms
+            )
+            matches = (
+                "SELECT doc_type, doc_id, title, body, "
+                "CAST(ts_rank_cd('{0.1, 0.2, 0.4, 1.0}', search_vector, query) AS float8) AS score "
+                "FROM search_documents, to_tsquery('simple', :query) query "
+                "WHERE search_vector @@ query"
+            )
+        conditions = []
+        if doc_type is not None:
+            conditions.append("doc_type = :doc_type")
+        if after is not None:
+            params["after_score"], params["after_type"], params["after_id"] = after
+            conditions.append("(score, doc_type, doc_id) < (:after_score, :after_type, :after_id)")
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        rows = self.session.execute(
+            text(
+                f"SELECT * FROM ({matches}) s {where}"
+                "ORDER BY score DESC, doc_type DESC, doc_id DESC LIMIT :limit"
+            ),
+            params,
+        ).all()
+        results = [row._asdict() for row in rows[:limit]]
+        if len(rows) > limit:
+            last = results[-1]
+            return results, (last["score"], last["doc_type"], last["doc_id"])
+        return results, None
+
+    def rebuild(self, batch_size: int = 1000) -> int:
+        """영상과 삭제되지 않은 게시글로 색인을 다시 만들고, 색인한 문서 수를 반환합니다."""
+        connection = self.session.connection()
+        connection.execute(text("DELETE FROM search_documents"))
+        if connection.dialect.name == "sqlite":
+            connection.execute(text("DELETE FROM search_documents_fts"))
+        sources = {
+            "video": select(Video.id, Video.title, Video.description),
+            "post": select(Post.id, Post.title, Post.content).where(Post.is_deleted.isnot(True)),
+        }
+        total = 0
+        for doc_type, query in sources.items():
+            rows = self.session.execute(query.execution_options(yield_per=batch_size))
+            for batch in batched(rows, batch_size):
+                upsert_documents(connection, doc_type, [(str(i), t, b) for i, t, b in batch])
+                total += len(batch)
+        return total
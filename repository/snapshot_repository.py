@@ -0,0 +1,210 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from model.repository import VideoViewSnapshot
+
+SNAPSHOT_TABLE = VideoViewSnapshot.__tablename__
+ROLLUP_RESOLUTIONS = ("hour", "day")
+
+
+def _next_month(day: date) -> date:
+    return (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+class ViewSnapshotRepository:
+    """조회수 기록을 저장하고, 오래된 기록을 요약하며, 여러 영상의 시계열을 조회합니다."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def add_many(self, rows: Iterable[tuple[str, int]], captured_at: datetime | None = None) -> int:
+        """(영상 ID, 조회수) 목록을 한 번의 INSERT로 저장합니다. captured_at이 없으면 현재 시간입니다."""
+        values = [
+            {"video_id": video_id, "views": views}
+            for video_id, views in dict(rows).items()
+            if views is not None
+        ]
+        if captured_at is not None:
+            for value in values:
+                value["captured_at"] = captured_at
+        if not values:
+            return 0
+        self.session.execute(insert(VideoViewSnapshot).values(values).on_conflict_do_nothing())
+        return len(values)
+
+    def ensure_partitions(self, today: date, months: int = 2) -> list[str]:
+        """today가 속한 달부터 months개월의 월 파티션을 만들고, 새로 만든 파티션 이름을 반환합니다.
+
+        파티션이 없는 동안 기본 파티션에 쌓인 그 달의 기록은 새 파티션으로 옮긴 뒤 붙입니다.
+        만들지 못한 파티션은 오류를 기록하고 다음 달로 넘어가며, 다음 실행에서 다시 시도합니다.
+        """
+        created, start = [], today.replace(day=1)
+        for _ in range(months):
+            end = _next_month(start)
+            name = f"{SNAPSHOT_TABLE}_{start:%Y%m}"
+            if not self._partition_exists(name):
+                try:
+                    with self.session.begin_nested():
+                        self._create_partition(name, start, end)
+                    created.append(name)
+                except DBAPIError as e:
+                    print(f"월 파티션 생성 실패 ({name}): {e.orig or e}")
+            start = end
+        return created
+
+    def rollup(self, resolution: str, before: datetime) -> int:
+        """before 이전의 기록을 resolution 단위로 요약하여 저장하고, 요약한 원본을 삭제합니다.
+
+        - hour: 원본 기록을 시간 단위로 요약합니다. 구간이 통째로 끝나는 파티션은 DELETE 대신
+          DROP하여 테이블 팽창 없이 공간을 돌려받습니다.
+        - day: 시간 단위 요약을 다시 일 단위로 요약합니다.
+        구간 경계가 before에 걸치지 않도록 before는 resolution 단위로 내림합니다.
+        반환값은 요약한 원본 행 수입니다.
+        """
+        if resolution not in ROLLUP_RESOLUTIONS:
+            raise ValueError(f"지원하지 않는 요약 단위입니다: {resolution}")
+        params = {"resolution": resolution, "before": before}
+        if resolution == "hour":
+            source = (
+                "SELECT video_id, date_trunc('hour', captured_at) AS bucket_start, "
+                "min(views) AS views_min, max(views) AS views_max, "
+                "(array_agg(views ORDER BY captured_at DESC))[1] AS views_last, "
+                "count(*) AS samples "
+                f"FROM {SNAPSHOT_TABLE} WHERE captured_at < date_trunc('hour', :before) "
+                "GROUP BY 1, 2"
+            )
+        else:
+            source = (
+                "SELECT video_id, date_trunc('day', bucket_start) AS bucket_start, "
+                "min(views_min) AS views_min, max(views_max) AS views_max, "
+                "(array_agg(views_last ORDER BY bucket_start DESC))[1] AS views_last, "
+                "sum(samples) AS samples "
+                "FROM video_view_rollups "
+                "WHERE resolution = 'hour' AND bucket_start < date_trunc('day', :before) "
+                "GROUP BY 1, 2"
+            )
+        rolled = self.session.execute(
+            text(
+                "INSERT INTO video_view_rollups "
+                "(video_id, resolution, bucket_start, views_min, views_max, views_last, samples) "
+                "SELECT video_id, :resolution, bucket_start, views_min, views_max, views_last, "
+                f"samples FROM ({source}) s "
+                "ON CONFLICT (video_id, resolution, bucket_start) DO UPDATE SET "
+                "views_min = least(video_view_rollups.views_min, EXCLUDED.views_min), "
+                "views_max = greatest(video_view_rollups.views_max, EXCLUDED.views_max), "
+                "views_last = EXCLUDED.views_last, "
+                "samples = video_view_rollups.samples + EXCLUDED.samples "
+                "RETURNING samples"
+            ),
+            params,
+        ).all()
+
+        if resolution == "hour":
+            cutoff = self.session.execute(
+                text("SELECT date_trunc('hour', CAST(:before AS timestamp))"), params
+            ).scalar()
+            for name, upper in self._partitions():
+                if upper <= cutoff:
+                    self.session.execute(text(f"DROP TABLE {name}"))
+            self.session.execute(
+                text(f"DELETE FROM {SNAPSHOT_TABLE} WHERE captured_at < :cutoff"),
+                {"cutoff": cutoff},
+            )
+        else:
+            self.session.execute(
+                text(
+                    "DELETE FROM video_view_rollups "
+                    "WHERE resolution = 'hour' AND bucket_start < date_trunc('day', :before)"
+                ),
+                params,
+            )
+        return sum(row.samples for row in rolled)
+
+    def series(
+        self, video_ids: Iterable[str], since: datetime | None = None
+    ) -> dict[str, list[tuple[datetime, int]]]:
+        """여러 영상의 조회수 시계열을 한 번의 쿼리로 조회합니다.
+
+        요약된 구간은 구간 시작 시간과 마지막 조회수로, 최근 구간은 원본 기록으로 반환하므로
+        오래된 구간일수록 간격이 넓어집니다.
+        """
+        params = {"video_ids": list(dict.fromkeys(video_ids)), "since": since or datetime.min}
+        rows = self.session.execute(
+            text(
+                "SELECT video_id, bucket_start AS at, views_last AS views FROM video_view_rollups "
+                "WHERE video_id = ANY(:video_ids) AND bucket_start >= :since "
+                "UNION ALL "
+                f"SELECT video_id, captured_at, views FROM {SNAPSHOT_TABLE} "
+                "WHERE video_id = ANY(:video_ids) AND captured_at >= :since "
+                "ORDER BY video_id, at"
+            ),
+            params,
+        )
+        series = defaultdict(list)
+        for row in rows:
+            series[row.video_id].append((row.at, row.views))
+        return {video_id: series.get(video_id, []) for video_id in params["video_ids"]}
+
+    def _create_partition(self, name: str, start: date, end: date):
+        bounds = f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        params = {"start": start, "end": end}
+        default = f"{SNAPSHOT_TABLE}_default"
+        stranded = self.session.execute(
+            text(
+                f"SELECT EXISTS (SELECT 1 FROM {default} "
+                "WHERE captured_at >= :start AND captured_at < :end)"
+            ),
+            params,
+        ).scalar()
+        if not stranded:
+            self.session.execute(
+                text(f"CREATE TABLE {name} PARTITION OF {SNAPSHOT_TABLE} {bounds}")
+            )
+            return
+        # 기본 파티션에 그 달의 기록이 있으면 바로 만들 수 없으므로, 같은 구조의 테이블에 기록을
+        # 옮긴 뒤 파티션으로 붙입니다. 옮기는 동안 기본 파티션은 잠깁니다.
+        self.session.execute(
+            text(
+                f"CREATE TABLE {name} "
+                f"(LIKE {SNAPSHOT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        self.session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {default} "
+                "WHERE captured_at >= :start AND captured_at < :end RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            ),
+            params,
+        )
+        self.session.execute(text(f"ALTER TABLE {SNAPSHOT_TABLE} ATTACH PARTITION {name} {bounds}"))
+
+    def _partition_exists(self, name: str) -> bool:
+        return (
+            self.session.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar()
+            is not None
+        )
+
+    def _partitions(self) -> list[tuple[str, datetime]]:
+        """월 파티션의 이름과 상한 시간을 반환합니다. 기본 파티션은 제외합니다."""
+        rows = self.session.execute(
+            text(
+                "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+                "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                f"WHERE i.inhparent = '{SNAPSHOT_TABLE}'::regclass"
+            )
+        )
+        partitions = []
+        for name, bound in rows:
+            if bound == "DEFAULT":
+                continue
+            # FOR VALUES FROM ('2024-01-01 00:00:00') TO ('2024-02-01 00:00:00')
+            upper = bound.rsplit("('", 1)[1].rstrip("')")
+            partitions.append((name, datetime.fromisoformat(upper)))
+        return partitions
@@ -0,0 +1,75 @@
+from typing import Iterable
+
+from sqlalchemy import BigInteger, String, any_, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.orm import Session
+
+from model.repository.post import PostTag, Tag
+
+
+def normalize_tag(name: str) -> str:
+    """앞뒤 공백과 해시태그 기호(#)를 제거하고, 열 길이에 맞게 자릅니다."""
+    return name.strip().lstrip("#").strip()[:255]
+
+
+class TagRepository:
+    """태그 이름을 ID로 일괄 변환하고, 게시글과 태그의 연결을 일괄 저장합니다."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_or_create(self, names: Iterable[str]) -> tuple[dict[str, int], set[str]]:
+        """태그 이름을 ID로 변환하고, 없는 태그는 만듭니다. (이름 -> ID, 새로 만든 이름)을 반환합니다.
+
+        이름 수와 관계없이 조회 한 번과 INSERT 한 번으로 처리합니다. 같은 태그를 다른
+        트랜잭션이 동시에 만들면 INSERT는 건너뛰고, 커밋된 행을 다시 조회합니다.
+        """
+        names = {normalized for name in names if (normalized := normalize_tag(name))}
+        ids = self._select(names)
+        created = set()
+        if missing := sorted(names - ids.keys()):
+            # 동시에 같은 태그들을 만들 때 교착 상태가 생기지 않도록 항상 이름 순서로 넣습니다.
+            rows = self.session.execute(
+                insert(Tag)
+                .from_select(["name"], select(func.unnest(literal(missing, ARRAY(String)))))
+                .on_conflict_do_nothing(index_elements=[Tag.name])
+                .returning(Tag.id, Tag.name)
+            )
+            for tag_id, name in rows:
+                ids[name] = tag_id
+                created.add(name)
+            if raced := names - ids.keys():
+                ids.update(self._select(raced))
+        return ids, created
+
+    def attach(self, pairs: Iterable[tuple[int, int]]) -> int:
+        """(게시글 ID, 태그 ID) 목록을 한 번의 INSERT로 연결하고, 새로 연결한 수를 반환합니다."""
+        pairs = sorted(set(pairs))
+        if not pairs:
+            return 0
+        # 행마다 파라미터를 두면 행 수만큼 SQL이 길어지고 매번 다시 컴파일되므로, 열별 배열 두 개를
+        # unnest로 풀어 넣습니다.
+        post_ids, tag_ids = zip(*pairs)
+        rows = (
+            func.unnest(
+                literal(list(post_ids), ARRAY(BigInteger)),
+                literal(list(tag_ids), ARRAY(BigInteger)),
+            )
+            .table_valued("post_id", "tag_id")
+            .render_derived()
+        )
+        attached = self.session.execute(
+            insert(PostTag)
+            .from_select(["post_id", "tag_id"], select(rows.c.post_id, rows.c.tag_id))
+            .on_conflict_do_nothing()
+            .returning(PostTag.post_id)
+        )
+        return len(attached.all())
+
+    def _select(self, names: set[str]) -> dict[str, int]:
+        if not names:
+            return {}
+        # 이름 수와 관계없이 바인드 파라미터 하나로 조회합니다.
+        names_param = literal(sorted(names), ARRAY(String))
+        rows = self.session.execute(select(Tag.name, Tag.id).where(Tag.name == any_(names_param)))
+        return dict(rows.all())
@@ -0,0 +1,113 @@
+import io
+import json
+
+import pytest
+from sqlalchemy import text
+
+from repository.bulk import copy_in, copy_out, get_table, read_rows
+from repository.handler import DatabaseManager
+
+
+@pytest.fixture
+def engine():
+    db = DatabaseManager()
+    db.drop_tables()
+    db.create_tables()
+    return db.engine
+
+
+def _jsonl(rows: list[dict]) -> io.StringIO:
+    return io.StringIO("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+
+
+def test_import_jsonl_in_chunks(engine):
+    rows = [{"id": f"video{i}", "title": f"밈 {i}", "views": i} for i in range(25)]
+    columns, stream = read_rows(_jsonl(rows), "jsonl")
+    progress = []
+
+    total = copy_in(
+        engine,
+        get_table("videos"),
+        columns,
+        stream,
+        chunk_size=10,
+        on_progress=lambda n, _: progress.append(n),
+    )
+
+    assert total == 25
+    assert progress == [10, 20, 25]
+    with engine.connect() as conn:
+        count, deleted = conn.execute(
+            text("SELECT count(*), bool_or(is_deleted) FROM videos WHERE created_at IS NOT NULL")
+        ).one()
+    assert (count, deleted) == (25, False)
+
+
+def test_upsert_through_staging_table(engine):
+    table = get_table("videos")
+    copy_in(engine, table, ["id", "title", "views"], [{"id": "a", "title": "이전", "views": 1}])
+
+    rows = [
+        {"id": "a", "title": "중간", "views": 2},
+        {"id": "b", "title": "새 영상", "views": 3},
+        {"id": "a", "title": "최신", "views": 4},
+    ]
+    assert copy_in(engine, table, ["id", "title", "views"], rows, upsert=True) == 3
+    # 같은 청크에 같은 키가 여러 번 있으면 나중 행이 저장됩니다.
+    with engine.connect() as conn:
+        result = conn.execute(text("SELECT id, title, views FROM videos ORDER BY id")).all()
+    assert [tuple(row) for row in result] == [("a", "최신", 4), ("b", "새 영상", 3)]
+
+    # 같은 연결에서 스테이징 테이블을 다시 만들 수 있어야 합니다.
+    copy_in(engine, table, ["id", "title", "views"], rows[:1], upsert=True)
+
+    with engine.connect() as conn:
+        result = conn.execute(text("SELECT id, title, views FROM videos ORDER BY id")).all()
+    assert [tuple(row) for row in result] == [("a", "중간", 2), ("b", "새 영상", 3)]
+
+
+def test_upsert_keeps_last_duplicate_in_chunk(engine):
+    table = get_table("videos")
+    # 한 청크에 같은 키가 여러 번 나오고, 청크 경계를 넘어서도 나옵니다.
+    rows = [{"id": "a", "title": f"제목 {i}", "views": i} for i in range(5)]
+    rows.insert(2, {"id": "b", "title": "다른 영상", "views": 100})
+    assert copy_in(engine, table, ["id", "title", "views"], rows, chunk_size=4, upsert=True) == 6
+
+    with engine.connect() as conn:
+        result = conn.execute(text("SELECT id, title, views FROM videos ORDER BY id")).all()
+    assert [tuple(row) for row in result] == [("a", "제목 4", 4), ("b", "다른 영상", 100)]
+
+
+def test_import_users_syncs_sequence(engine):
+    csv_data = io.StringIO(
+        "id,email,password,password_salt\n" "10,a@test.com,pw,salt\n" "11,b@test.com,pw,salt\n"
+    )
+    columns, rows = read_rows(csv_data, "csv")
+    copy_in(engine, get_table("users"), columns, rows)
+
+    with engine.begin() as conn:
+        new_id = conn.execute(
+            text(
+                "INSERT INTO users (email, password, password_salt, created_at, updated_at) "
+                "VALUES ('c@test.com', 'pw', 'salt', now(), now()) RETURNING id"
+            )
+        ).scalar()
+    assert new_id == 12
+
+
+def test_export_round_trip(engine):
+    table = get_table("videos")
+    rows = [{"id": "a", "title": 'say "hi"\\n', "views": 5_000_000_000}]
+    copy_in(engine, table, ["id", "title", "views"], rows)
+
+    jsonl = io.BytesIO()
+    assert copy_out(engine, table, jsonl, "jsonl") == 1
+    exported = json.loads(jsonl.getvalue())
+    assert exported["title"] == 'say "hi"\\n'
+    assert exported["views"] == 5_000_000_000
+
+    csv_out = io.BytesIO()
+    assert copy_out(engine, table, csv_out, "csv") == 1
+    columns, csv_rows = read_rows(io.StringIO(csv_out.getvalue().decode()), "csv")
+    assert "thumbnail_url" in columns
+    assert next(csv_rows)["title"] == 'say "hi"\\n'
@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy import text
+
+from model.repository import Category, Post
+from repository.category_repository import CategoryRepository
+from repository.handler import DatabaseManager
+
+
+@pytest.fixture(autouse=True)
+def reset_db():
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+
+
+def _closure(session) -> set[tuple[int, int, int]]:
+    rows = session.execute(text("SELECT ancestor_id, descendant_id, depth FROM category_closure"))
+    return {tuple(row) for row in rows}
+
+
+def _names(categories: list[Category]) -> list[str]:
+    return [category.name for category in categories]
+
+
+def test_hierarchy_queries(sample_data):
+    level1, level1_1, level1_1_a, level1_1_b, level1_2, level2, level2_1 = sample_data["categories"]
+    with DatabaseManager() as session:
+        repository = CategoryRepository(session)
+        assert _names(repository.descendants(level1.id)) == [
+            "계층1",
+            "계층1-1",
+            "계층1-2",
+            "계층1-1-A",
+            "계층1-1-B",
+        ]
+        assert _names(repository.descendants(level1_1.id, include_self=False)) == [
+            "계층1-1-A",
+            "계층1-1-B",
+        ]
+        assert _names(repository.path_to_root(level1_1_b.id)) == ["계층1-1-B", "계층1-1", "계층1"]
+        assert repository.post_counts([level1.id, level1_1.id, level2.id, level1_2.id]) == {
+            level1.id: 5,
+            level1_1.id: 3,
+            level2.id: 2,
+            level1_2.id: 1,
+        }
+
+        session.get(Post, sample_data["posts"][0].id).soft_delete()
+        session.flush()
+        assert repository.post_counts()[level1.id] == 4
+
+
+def test_closure_follows_move_and_delete(sample_data):
+    level1, level1_1, level1_1_a, _, _, level2, level2_1 = sample_data["categories"]
+    with DatabaseManager() as session:
+        repository = CategoryRepository(session)
+        moved = session.get(Category, level1_1.id)
+        moved.upper_category = session.get(Category, level2_1.id)
+        session.flush()
+        assert _names(repository.path_to_root(level1_1_a.id)) == [
+            "계층1-1-A",
+            "계층1-1",
+            "계층2-1",
+            "계층2",
+        ]
+        assert len(repository.descendants(level1.id)) == 2
+        assert len(repository.descendants(level2.id)) == 5
+
+        with pytest.raises(ValueError):
+            with session.begin_nested():
+                session.get(Category, level2.id).upper_category_id = level1_1_a.id
+                session.flush()
+
+    with DatabaseManager() as session:
+        session.delete(session.get(Category, level1_1.id))
+        session.flush()
+        repository = CategoryRepository(session)
+        assert _names(repository.descendants(level2.id)) == ["계층2", "계층2-1"]
+
+        expected = _closure(session)
+        assert repository.rebuild_closure() == len(expected)
+        assert _closure(session) == expected
@@ -0,0 +1,120 @@
+import pytest
+from sqlalchemy import event, insert
+
+from model.repository.post import Comment
+from repository.comment_repository import CommentRepository
+from repository.handler import DatabaseManager
+
+
+@pytest.fixture(autouse=True)
+def reset_db():
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+
+
+@pytest.fixture
+def post_id(sample_data):
+    post_id = sample_data["posts"][0].id
+    # (id, 부모 id, 삭제 여부)
+    comments = [
+        (1, None, False),
+        (2, 1, True),
+        (3, 1, False),
+        (4, 2, False),
+        (5, 4, False),
+        (6, None, True),
+        (7, None, False),
+        (8, 7, True),
+        (9, None, False),
+        (10, None, False),
+    ]
+    with DatabaseManager() as session:
+        session.execute(
+            insert(Comment).values(
+                [
+                    {
+                        "id": comment_id,
+                        "post_id": post_id,
+                        "parent_comment_id": parent_id,
+                        "content": None if deleted else f"댓글{comment_id}",
+                        "is_deleted": deleted,
+                    }
+                    for comment_id, parent_id, deleted in comments
+                ]
+            )
+        )
+    return post_id
+
+
+def _shape(comments: list[dict]) -> list:
+    return [(comment["id"], _shape(comment["replies"])) for comment in comments]
+
+
+def test_thread_in_one_query(post_id):
+    engine = DatabaseManager().engine
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with DatabaseManager() as session:
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            comments, cursor, truncated = CommentRepository(session).thread(post_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    assert len(statements) == 1
+    assert cursor is None and not truncated
+    # 삭제된 댓글 2는 대댓글이 남아 있어 내용 없이 포함하고, 6과 8은 제외합니다.
+    assert _shape(comments) == [
+        (1, [(2, [(4, [(5, [])])]), (3, [])]),
+        (7, []),
+        (9, []),
+        (10, []),
+    ]
+    deleted = comments[0]["replies"][0]
+    assert deleted["deleted"] and deleted["content"] is None and deleted["depth"] == 1
+    assert comments[0]["reply_count"] == 2 and not comments[0]["more_replies"]
+
+
+def test_thread_limits_and_paging(post_id):
+    with DatabaseManager() as session:
+        repository = CommentRepository(session)
+
+        comments, _, _ = repository.thread(post_id, max_depth=2)
+        node4 = comments[0]["replies"][0]["replies"][0]
+        assert node4["id"] == 4 and node4["replies"] == [] and node4["more_replies"]
+
+        comments, _, truncated = repository.thread(post_id, max_nodes=2)
+        assert truncated
+        # 불러오지 못한 대댓글이 있는 삭제된 댓글은 남겨 둡니다.
+        assert _shape(comments) == [(1, [(2, []), (3, [])]), (7, []), (9, []), (10, [])]
+        assert comments[0]["replies"][0]["more_replies"]
+
+        comments, cursor, _ = repository.thread(post_id, limit=2)
+        assert [comment["id"] for comment in comments] == [1]
+        assert cursor == 6
+        comments, cursor, _ = repository.thread(post_id, after=cursor, limit=2)
+        assert [comment["id"] for comment in comments] == [7, 9]
+        comments, cursor, _ = repository.thread(post_id, after=cursor, limit=2)
+        assert [comment["id"] for comment in comments] == [10]
+        assert cursor is None
+
+
+def test_thread_truncated_with_next_page(sample_data):
+    post_id = sample_data["posts"][0].id
+    # 최상위 댓글 3개 중 2개를 조회하고, 그 아래 대댓글 10개 중 3개만 불러옵니다.
+    values = [{"id": i, "parent_comment_id": None} for i in (1, 2, 3)]
+    values += [{"id": 10 + i, "parent_comment_id": 1 + i % 2} for i in range(10)]
+    with DatabaseManager() as session:
+        session.execute(
+            insert(Comment).values(
+                [{**value, "post_id": post_id, "content": "댓글"} for value in values]
+            )
+        )
+        comments, cursor, truncated = CommentRepository(session).thread(
+            post_id, limit=2, max_nodes=3
+        )
+    assert cursor == 2 and truncated
+    assert sum(len(comment["replies"]) for comment in comments) == 3
+    assert all(comment["more_replies"] for comment in comments)
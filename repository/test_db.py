@@ -42,5 +42,77 @@ def test_create_table(db_engine):
     assert "videos" in table_names
 
 
+def test_async_singleton():
+    from repository.handler import AsyncDatabaseManager
+
+    db1 = AsyncDatabaseManager()
+    db2 = AsyncDatabaseManager(host="127.0.0.1")
+    assert db1.engine is db2.engine, "Same connection parameters should return the same engine"
+    assert db1.db_url == DatabaseManager().db_url
+    assert db1.engine is not AsyncDatabaseManager(database="meme").engine
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("db_engine")
+async def test_async_session():
+    from sqlalchemy import func, insert, select
+
+    from model.repository import Video
+    from repository.handler import AsyncDatabaseManager
+
+    async with AsyncDatabaseManager() as session:
+        await session.execute(insert(Video).values(id="a", title="밈"))
+
+    with pytest.raises(RuntimeError):
+        async with AsyncDatabaseManager() as session:
+            await session.execute(insert(Video).values(id="b", title="밈"))
+            raise RuntimeError
+
+    async with AsyncDatabaseManager() as session:
+        assert await session.scalar(select(func.count()).select_from(Video)) == 1
+    await AsyncDatabaseManager.dispose()
+
+
+def test_session_per_enter():
+    db = DatabaseManager()
+    with db as s1:
+        pass
+    with db as s2:
+        pass
+    assert s1 is not s2
+    assert s1.bind is s2.bind is db.engine
+
+
+def test_pool_metrics():
+    from sqlalchemy import create_engine
+    from sqlalchemy.exc import TimeoutError
+
+    from repository.handler import MeteredQueuePool, pool_stats
+
+    engine = create_engine(
+        DatabaseManager().db_url,
+        poolclass=MeteredQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    with engine.connect():
+        assert engine.pool.stats()["checked_out"] == 1
+        with pytest.raises(TimeoutError):
+            engine.connect()
+    stats = engine.pool.stats()
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["max_wait_ms"] >= 50
+    engine.dispose()
+
+    with DatabaseManager():
+        pass
+    (stats,) = [s for url, s in pool_stats()["sync"].items() if url.endswith("/dev")]
+    assert stats["checkouts"] >= 1
+    assert "user:***@" in next(iter(pool_stats()["sync"]))
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,133 @@
+import pytest
+from sqlalchemy import text
+
+from model.repository import User
+from repository.follow_repository import FollowRepository
+from repository.handler import DatabaseManager
+
+
+@pytest.fixture(autouse=True)
+def users():
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+    with DatabaseManager() as session:
+        users = [
+            User(email=f"user{i}@test.com", password="pw", password_salt="salt") for i in range(5)
+        ]
+        session.add_all(users)
+        session.flush()
+        return [user.id for user in users]
+
+
+def _counts(session, user_id):
+    user = session.get(User, user_id)
+    return user.follower_count, user.following_count
+
+
+def test_follow_updates_counts(users):
+    a, b, c, *_ = users
+    with DatabaseManager() as session:
+        repository = FollowRepository(session)
+        assert repository.follow(a, b)
+        assert not repository.follow(a, b)
+        assert repository.follow(c, b)
+        assert repository.follow(b, a)
+        with pytest.raises(ValueError):
+            repository.follow(a, a)
+
+    with DatabaseManager() as session:
+        assert _counts(session, a) == (1, 1)
+        assert _counts(session, b) == (2, 1)
+        assert _counts(session, c) == (0, 1)
+
+        repository = FollowRepository(session)
+        assert repository.unfollow(c, b)
+        assert not repository.unfollow(c, b)
+
+    with DatabaseManager() as session:
+        assert _counts(session, b) == (1, 1)
+        assert _counts(session, c) == (0, 0)
+
+
+def test_keyset_pagination(users):
+    target, *others = users
+    with DatabaseManager() as session:
+        repository = FollowRepository(session)
+        for user_id in others:
+            repository.follow(user_id, target)
+
+    with DatabaseManager() as session:
+        repository = FollowRepository(session)
+        page, cursor = repository.followers(target, limit=3)
+        assert [user.id for user in page] == others[:3]
+        page, cursor = repository.followers(target, after=cursor, limit=3)
+        assert [user.id for user in page] == others[3:]
+        assert cursor is None
+
+        page, cursor = repository.following(others[0])
+        assert [user.id for user in page] == [target]
+        assert cursor is None
+        assert repository.following(target) == ([], None)
+
+        # 팔로워 목록은 역방향 인덱스를 사용합니다.
+        session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = session.execute(
+            text(
+                "EXPLAIN SELECT from_user_id FROM follows "
+                "WHERE to_user_id = :id AND from_user_id > 0 ORDER BY from_user_id LIMIT 3"
+            ),
+            {"id": target},
+        ).scalars()
+        assert "ix_follows_to_user_id_from_user_id" in "\n".join(plan)
+
+
+def test_repair_counts(users):
+    a, b, c, *_ = users
+    with DatabaseManager() as session:
+        FollowRepository(session).follow(a, b)
+        # 집계값을 거치지 않고 관계를 직접 수정하면 집계값이 어긋납니다.
+        follower = session.get(User, c)
+        follower.following.append(session.get(User, b))
+        session.execute(text("UPDATE users SET follower_count = 100 WHERE id = :id"), {"id": a})
+
+    with DatabaseManager() as session:
+        repository = FollowRepository(session)
+        assert repository.repair_counts(0, limit=2) == (2, users[1])
+        assert repository.repair_counts(users[1], limit=2) == (1, users[3])
+        assert repository.repair_counts(users[3], limit=2) == (0, users[4])
+        assert repository.repair_counts(users[4], limit=2) == (0, None)
+
+    with DatabaseManager() as session:
+        assert _counts(session, a) == (0, 1)
+        assert _counts(session, b) == (2, 0)
+        assert _counts(session, c) == (0, 1)
+
+
+def test_soft_deleted_follows_and_users_are_excluded(users):
+    a, b, c, d, _ = users
+    with DatabaseManager() as session:
+        repository = FollowRepository(session)
+        for user_id in (b, c, d):
+            repository.follow(user_id, a)
+        session.execute(
+            text("UPDATE follows SET is_deleted = true WHERE from_user_id = :id"), {"id": b}
+        )
+        session.execute(text("UPDATE users SET is_deleted = true WHERE id = :id"), {"id": c})
+
+    with DatabaseManager() as session:
+        repository = FollowRepository(session)
+        assert [user.id for user in repository.followers(a)[0]] == [d]
+        assert repository.following(b) == ([], None)
+        assert not repository.unfollow(b, a)
+        repository.repair_counts()
+    with DatabaseManager() as session:
+        assert _counts(session, a) == (1, 0)
+        assert _counts(session, b) == (0, 0)
+
+    with DatabaseManager() as session:
+        # soft-delete된 팔로우는 다시 팔로우하면 되살아납니다.
+        assert FollowRepository(session).follow(b, a)
+        assert not FollowRepository(session).follow(b, a)
+    with DatabaseManager() as session:
+        assert _counts(session, a) == (2, 0)
+        assert [user.id for user in FollowRepository(session).followers(a)[0]] == [b, d]
@@ -0,0 +1,103 @@
+import pytest
+from sqlalchemy import text
+
+from model.repository import User
+from repository.handler import DatabaseManager
+from repository.like_repository import LikeRepository
+
+
+@pytest.fixture(autouse=True)
+def users():
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+    with DatabaseManager() as session:
+        users = [
+            User(email=f"user{i}@test.com", password="pw", password_salt="salt") for i in range(3)
+        ]
+        session.add_all(users)
+        session.flush()
+        return [user.id for user in users]
+
+
+def test_like_and_counts(users):
+    a, b, _ = users
+    with DatabaseManager() as session:
+        repository = LikeRepository(session)
+        assert repository.like(a, ("post", 1))
+        assert not repository.like(a, ("post", 1))
+        assert repository.like(b, ("post", 1))
+        assert repository.unlike(b, ("post", 1))
+        assert not repository.unlike(b, ("post", 1))
+
+        assert repository.apply_deltas({("post", 1): 2, ("comment", 1): 1, ("post", 2): 0}) == 2
+        assert repository.apply_deltas({("post", 1): -1}) == 1
+        assert repository.counts([("post", 1), ("comment", 1), ("post", 2), ("post", 1)]) == {
+            ("post", 1): 1,
+            ("comment", 1): 1,
+            ("post", 2): 0,
+        }
+        assert repository.counts([]) == {}
+
+
+def test_reconcile(users):
+    a, b, c = users
+    with DatabaseManager() as session:
+        repository = LikeRepository(session)
+        for user_id in (a, b, c):
+            repository.like(user_id, ("post", 1))
+        repository.like(a, ("comment", 7))
+        # 잃어버린 변경분과 잘못 반영된 변경분을 재현합니다.
+        repository.apply_deltas({("post", 1): 1, ("post", 2): 5})
+
+    with DatabaseManager() as session:
+        repository = LikeRepository(session)
+        assert repository.reconcile() == 3
+        assert repository.reconcile() == 0
+        assert repository.counts([("post", 1), ("post", 2), ("comment", 7)]) == {
+            ("post", 1): 3,
+            ("post", 2): 0,
+            ("comment", 7): 1,
+        }
+        rows = session.execute(text("SELECT count(*) FROM like_counts")).scalar()
+        assert rows == 3
+
+
+def test_apply_deltas_skips_previous_epoch(users):
+    a, _, _ = users
+    with DatabaseManager() as session:
+        repository = LikeRepository(session)
+        epoch = repository.epoch()
+        repository.like(a, ("post", 1))
+
+    with DatabaseManager() as session:
+        repository = LikeRepository(session)
+        assert repository.reconcile() == 1
+        assert repository.epoch() == epoch + 1
+
+    with DatabaseManager() as session:
+        repository = LikeRepository(session)
+        assert repository.apply_deltas({("post", 1): 1}, epoch) == 0
+        assert repository.apply_deltas({("post", 1): 1}, epoch + 1) == 1
+        assert repository.counts([("post", 1)]) == {("post", 1): 2}
+
+
+def test_soft_deleted_likes(users):
+    a, b, _ = users
+    with DatabaseManager() as session:
+        repository = LikeRepository(session)
+        repository.like(a, ("post", 1))
+        repository.like(b, ("post", 1))
+        session.execute(text("UPDATE likes SET is_deleted = TRUE, deleted_at = now()"))
+
+    with DatabaseManager() as session:
+        repository = LikeRepository(session)
+        # soft-delete된 좋아요는 다시 계산할 때 제외하고, 취소할 수 없습니다.
+        repository.reconcile()
+        assert repository.counts([("post", 1)]) == {("post", 1): 0}
+        assert not repository.unlike(b, ("post", 1))
+        # 다시 좋아요하면 soft-delete된 기록을 되살립니다.
+        assert repository.like(a, ("post", 1))
+        assert not repository.like(a, ("post", 1))
+        repository.reconcile()
+        assert repository.counts([("post", 1)]) == {("post", 1): 1}
+        assert session.execute(text("SELECT count(*) FROM likes")).scalar() == 2
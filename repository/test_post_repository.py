@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert
+
+from model.repository import Category, Post, User, UserDetail
+from model.repository.post import PostTag, Tag
+from repository.handler import DatabaseManager
+from repository.post_repository import PostRepository
+
+
+@pytest.fixture(autouse=True)
+def posts():
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+    with DatabaseManager() as session:
+        users = [
+            User(email=f"user{i}@test.com", password="pw", password_salt="salt") for i in range(3)
+        ]
+        for i, user in enumerate(users):
+            UserDetail(user=user, username=f"사용자{i}")
+        root = Category(name="루트")
+        child = Category(name="하위", upper_category=root)
+        other = Category(name="기타")
+        started = datetime(2025, 1, 1)
+        posts = [
+            Post(
+                title=f"글{i}",
+                content="내용",
+                media_url="https://picsum.photos/200",
+                # 같은 업로드 시간이 있어도 id로 순서를 정합니다.
+                media_upload_time=started + timedelta(minutes=i // 2),
+                user=users[i % 3],
+                category=[root, child, other][i % 3],
+            )
+            for i in range(25)
+        ]
+        session.add_all(posts)
+        session.flush()
+        session.execute(insert(Tag).values([{"id": 1, "name": "밈"}, {"id": 2, "name": "챌린지"}]))
+        session.execute(
+            insert(PostTag).values(
+                [{"post_id": post.id, "tag_id": 1} for post in posts[::2]]
+                + [{"post_id": post.id, "tag_id": 2} for post in posts[::5]]
+            )
+        )
+        return {
+            "ids": [post.id for post in posts],
+            "keys": [(post.media_upload_time, post.id) for post in posts],
+            "categories": {"root": root.id, "child": child.id, "other": other.id},
+        }
+
+
+@pytest.fixture
+def count_queries():
+    engine = DatabaseManager().engine
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_feed_pages_with_fixed_query_count(posts, count_queries):
+    expected = [post_id for _, post_id in sorted(posts["keys"], reverse=True)]
+    seen, cursor = [], None
+    with DatabaseManager() as session:
+        repository = PostRepository(session)
+        while True:
+            count_queries.clear()
+            page, cursor = repository.feed(cursor, limit=10)
+            # 관계에 접근해도 추가 쿼리가 발생하지 않습니다.
+            for post in page:
+                assert post.user.details.username.startswith("사용자")
+                assert post.category.name
+                assert isinstance(post.tags, list)
+            assert len(count_queries) == 2
+            seen += [post.id for post in page]
+            if cursor is None:
+                break
+    assert seen == expected
+
+
+def test_feed_filters(posts):
+    categories = posts["categories"]
+    with DatabaseManager() as session:
+        repository = PostRepository(session)
+        page, cursor = repository.feed(category_ids=[categories["other"]], limit=100)
+        assert {post.category.name for post in page} == {"기타"}
+        assert len(page) == 8 and cursor is None
+
+        page, _ = repository.feed(tag="챌린지", limit=100)
+        assert {post.id for post in page} == set(posts["ids"][::5])
+        assert all("챌린지" in [tag.name for tag in post.tags] for post in page)
+        page, _ = repository.feed(tag=" #챌린지 ", limit=100)
+        assert {post.id for post in page} == set(posts["ids"][::5])
+
+        page, _ = repository.feed(
+            category_ids=[categories["root"], categories["child"]], tag="밈", limit=100
+        )
+        assert {post.id for post in page} == {
+            post_id for i, post_id in enumerate(posts["ids"]) if i % 2 == 0 and i % 3 != 2
+        }
+
+        newest, second = sorted(posts["keys"], reverse=True)[:2]
+        session.get(Post, newest[1]).soft_delete()
+        session.flush()
+        page, _ = repository.feed(limit=1)
+        assert page[0].id == second[1]
@@ -0,0 +1,103 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from model.repository import Post, SearchDocument
+from repository.handler import DatabaseManager
+from repository.search_repository import SearchRepository, tokenize
+
+VIDEOS = [
+    ("v1", "고양이 밈 모음", "웃긴 고양이 영상"),
+    ("v2", "강아지 브이로그", "고양이와 강아지가 함께 노는 영상"),
+    ("v3", "BTS Dance Challenge", None),
+    ("v4", "밈들의 역사", "인터넷 밈의 기원"),
+]
+
+
+def test_tokenize():
+    assert tokenize("밈모음 BTS_2024!") == ["밈모", "모음", "bts", "2024"]
+    assert tokenize("밈") == ["밈"]
+    assert tokenize(None) == []
+
+
+@pytest.fixture
+def reset_db():
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+
+
+@pytest.fixture
+def pg_session(reset_db):
+    with DatabaseManager() as session:
+        SearchRepository(session).index("video", VIDEOS)
+        yield session
+
+
+@pytest.fixture
+def sqlite_session():
+    engine = create_engine("sqlite://")
+    SearchDocument.__table__.create(engine)
+    with Session(engine) as session:
+        SearchRepository(session).index("video", VIDEOS)
+        yield session
+
+
+@pytest.mark.parametrize("session_fixture", ["pg_session", "sqlite_session"])
+def test_search(request, session_fixture):
+    session = request.getfixturevalue(session_fixture)
+    repository = SearchRepository(session)
+
+    def ids(query, **kwargs):
+        return [result["doc_id"] for result in repository.search(query, **kwargs)[0]]
+
+    # 제목에 포함된 문서가 본문에만 포함된 문서보다 먼저 나옵니다.
+    assert ids("고양이") == ["v1", "v2"]
+    assert ids("고양이 영상") == ["v1", "v2"]
+    assert ids("dance") == ["v3"]
+    assert set(ids("밈")) == {"v1", "v4"}
+    assert ids("없는 검색어") == []
+    assert ids("!!!") == []
+    assert ids("고양이", doc_type="post") == []
+
+    # 본문 없이 제목만 갱신하면 저장된 본문은 유지됩니다.
+    repository.index("video", [("v2", "강아지 일상", None)])
+    assert ids("강아지 일상") == ["v2"]
+    assert ids("노는") == ["v2"]
+
+
+@pytest.mark.parametrize("session_fixture", ["pg_session", "sqlite_session"])
+def test_search_keyset_pages(request, session_fixture):
+    session = request.getfixturevalue(session_fixture)
+    repository = SearchRepository(session)
+    repository.index("video", [(f"p{i}", f"밈 {i}", "밈" * (i % 3 + 1)) for i in range(7)])
+
+    everything, _ = repository.search("밈", limit=100)
+    pages, cursor = [], None
+    while True:
+        page, cursor = repository.search("밈", after=cursor, limit=3)
+        pages += page
+        if cursor is None:
+            break
+    assert pages == everything
+    assert [r["score"] for r in pages] == sorted((r["score"] for r in pages), reverse=True)
+
+
+@pytest.mark.usefixtures("reset_db")
+def test_post_index_follows_orm(sample_data):
+    with DatabaseManager() as session:
+        repository = SearchRepository(session)
+        post_id = sample_data["posts"][0].id
+        assert [r["doc_id"] for r in repository.search("카테고리 관련", doc_type="post")[0]]
+
+        post = session.get(Post, post_id)
+        post.title = "새 제목"
+        session.flush()
+        assert [r["doc_id"] for r in repository.search("새 제목")[0]] == [str(post_id)]
+
+        post.soft_delete()
+        session.flush()
+        assert repository.search("새 제목")[0] == []
+
+        session.execute(text("DELETE FROM search_documents"))
+        assert repository.rebuild() == len(sample_data["posts"]) - 1
+        assert len(repository.search("카테고리", doc_type="post", limit=100)[0]) == 6
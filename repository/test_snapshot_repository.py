@@ -0,0 +1,159 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import text
+
+from repository.handler import DatabaseManager
+from repository.snapshot_repository import ViewSnapshotRepository
+
+
+@pytest.fixture(autouse=True)
+def reset_db():
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+
+
+def _count(session, table: str) -> int:
+    return session.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+
+
+def test_ensure_partitions():
+    with DatabaseManager() as session:
+        repository = ViewSnapshotRepository(session)
+        assert repository.ensure_partitions(date(2024, 12, 15)) == [
+            "video_view_snapshots_202412",
+            "video_view_snapshots_202501",
+        ]
+        assert repository.ensure_partitions(date(2025, 1, 1)) == ["video_view_snapshots_202502"]
+
+        repository.add_many([("a", 1)], captured_at=datetime(2025, 1, 10))
+        assert _count(session, "video_view_snapshots_202501") == 1
+        assert _count(session, "video_view_snapshots_default") == 0
+
+
+def test_ensure_partitions_moves_rows_from_default():
+    with DatabaseManager() as session:
+        repository = ViewSnapshotRepository(session)
+        # 파티션이 없을 때 쌓인 기록은 파티션을 만들면서 그 파티션으로 옮깁니다.
+        repository.add_many([("a", 1)], captured_at=datetime(2025, 1, 10))
+        repository.add_many([("a", 2)], captured_at=datetime(2025, 3, 10))
+        assert repository.ensure_partitions(date(2025, 1, 1)) == [
+            "video_view_snapshots_202501",
+            "video_view_snapshots_202502",
+        ]
+        assert _count(session, "video_view_snapshots_202501") == 1
+        assert _count(session, "video_view_snapshots_default") == 1
+        assert _count(session, "video_view_snapshots") == 2
+        # 옮긴 파티션에도 기본 키가 적용됩니다.
+        assert repository.add_many([("a", 3)], captured_at=datetime(2025, 1, 10)) == 1
+        assert _count(session, "video_view_snapshots_202501") == 1
+
+
+def test_prepare_partitions_commits_separately():
+    from service.snapshot_service import ViewSnapshotService
+
+    with pytest.raises(RuntimeError):
+        with DatabaseManager() as session:
+            ViewSnapshotService.prepare_partitions(date(2025, 1, 1))
+            ViewSnapshotService.record(session, [("a", 1)])
+            raise RuntimeError
+    with DatabaseManager() as session:
+        assert ViewSnapshotRepository(session)._partition_exists("video_view_snapshots_202501")
+        assert _count(session, "video_view_snapshots") == 0
+
+
+def test_rollup_and_series():
+    with DatabaseManager() as session:
+        repository = ViewSnapshotRepository(session)
+        repository.ensure_partitions(date(2025, 1, 1))
+        for minute, views in [(0, 10), (20, 30), (40, 20)]:
+            repository.add_many(
+                [("a", views), ("b", views * 2), ("c", None)],
+                captured_at=datetime(2025, 1, 1, 10, minute),
+            )
+        repository.add_many([("a", 40)], captured_at=datetime(2025, 1, 1, 11, 5))
+        repository.add_many([("a", 50)], captured_at=datetime(2025, 2, 3, 9))
+
+    with DatabaseManager() as session:
+        repository = ViewSnapshotRepository(session)
+        # 1월 파티션은 통째로 요약되어 삭제되고, 2월 기록은 남습니다.
+        assert repository.rollup("hour", datetime(2025, 2, 3, 9, 30)) == 7
+        assert repository._partitions()[0][0] == "video_view_snapshots_202502"
+        assert _count(session, "video_view_snapshots") == 1
+
+        hourly = session.execute(
+            text(
+                "SELECT video_id, bucket_start, views_min, views_max, views_last, samples "
+                "FROM video_view_rollups ORDER BY video_id, bucket_start"
+            )
+        ).all()
+        assert [tuple(row) for row in hourly] == [
+            ("a", datetime(2025, 1, 1, 10), 10, 30, 20, 3),
+            ("a", datetime(2025, 1, 1, 11), 40, 40, 40, 1),
+            ("b", datetime(2025, 1, 1, 10), 20, 60, 40, 3),
+        ]
+
+        assert repository.rollup("day", datetime(2025, 1, 2)) == 7
+        assert repository.series(["a", "b", "missing", "a"]) == {
+            "a": [(datetime(2025, 1, 1), 40), (datetime(2025, 2, 3, 9), 50)],
+            "b": [(datetime(2025, 1, 1), 40)],
+            "missing": [],
+        }
+        assert repository.series(["a"], since=datetime(2025, 2, 1)) == {
+            "a": [(datetime(2025, 2, 3, 9), 50)]
+        }
+
+    with pytest.raises(ValueError):
+        with DatabaseManager() as session:
+            ViewSnapshotRepository(session).rollup("week", datetime(2025, 1, 1))
+
+
+def test_compact_skips_when_another_process_holds_the_lock():
+    from sqlalchemy import func, select
+
+    from service.snapshot_service import ViewSnapshotService
+
+    service = ViewSnapshotService()
+    with DatabaseManager() as session:
+        session.execute(select(func.pg_advisory_xact_lock(service.COMPACT_LOCK_ID)))
+        result = service.compact(datetime(2025, 1, 15))
+        # 요약은 건너뛰어도 파티션은 준비합니다.
+        assert result["skipped"] is True
+        assert result["created_partitions"] == [
+            "video_view_snapshots_202501",
+            "video_view_snapshots_202502",
+        ]
+    assert service.compact(datetime(2025, 1, 15)) == {
+        "created_partitions": [],
+        "skipped": False,
+        "hourly_rolled_up": 0,
+        "daily_rolled_up": 0,
+    }
+
+
+def test_maintenance_runs_compact_periodically():
+    import threading
+
+    from service.snapshot_service import SnapshotMaintenance
+
+    class FakeService:
+        def __init__(self):
+            self.calls = 0
+            self.ran_twice = threading.Event()
+
+        def compact(self):
+            self.calls += 1
+            if self.calls == 1:
+                raise RuntimeError("db down")
+            self.ran_twice.set()
+            return {"skipped": False}
+
+    service = FakeService()
+    maintenance = SnapshotMaintenance(interval=0.01, service=service)
+    # 첫 실행이 실패해도 다음 주기에 다시 실행합니다.
+    assert service.ran_twice.wait(5)
+    maintenance.close()
+    stats = maintenance.stats()
+    assert stats["failed_runs"] == 1
+    assert stats["runs"] >= 1
+    assert stats["last_result"] == {"skipped": False}
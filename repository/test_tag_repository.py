@@ -0,0 +1,110 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, func, select
+
+from model.repository import Post
+from model.repository.post import PostTag, Tag
+from repository.handler import DatabaseManager
+from repository.tag_repository import TagRepository, normalize_tag
+
+
+@pytest.fixture(autouse=True)
+def posts():
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+    with DatabaseManager() as session:
+        posts = [
+            Post(
+                title=f"글{i}",
+                content="내용",
+                media_url="https://picsum.photos/200",
+                media_upload_time=datetime(2025, 1, 1),
+                user=None,
+                category=None,
+            )
+            for i in range(3)
+        ]
+        session.add_all(posts)
+        session.flush()
+        return [post.id for post in posts]
+
+
+@pytest.fixture
+def count_queries():
+    engine = DatabaseManager().engine
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_normalize_tag():
+    assert normalize_tag("  #밈 ") == "밈"
+    assert normalize_tag("##") == ""
+    assert len(normalize_tag("가" * 300)) == 255
+
+
+def test_get_or_create(count_queries):
+    with DatabaseManager() as session:
+        session.add(Tag(name="밈"))
+        session.flush()
+        existing = session.scalar(select(Tag.id).where(Tag.name == "밈"))
+
+    with DatabaseManager() as session:
+        repository = TagRepository(session)
+        count_queries.clear()
+        ids, created = repository.get_or_create(["밈", "#챌린지", " 먹방", "챌린지", ""])
+        assert len(count_queries) == 2
+        assert ids.keys() == {"밈", "챌린지", "먹방"}
+        assert ids["밈"] == existing
+        assert created == {"챌린지", "먹방"}
+
+        count_queries.clear()
+        assert repository.get_or_create(["챌린지", "먹방"]) == (
+            {"챌린지": ids["챌린지"], "먹방": ids["먹방"]},
+            set(),
+        )
+        assert len(count_queries) == 1
+        assert repository.get_or_create([]) == ({}, set())
+
+
+def test_get_or_create_after_concurrent_insert():
+    with DatabaseManager() as session:
+        repository = TagRepository(session)
+        # 조회한 뒤 다른 트랜잭션이 같은 태그를 커밋한 상황을 재현합니다.
+        select_existing = repository._select
+        raced = {}
+
+        def select_then_race(names):
+            found = select_existing(names)
+            if not raced:
+                with DatabaseManager() as other:
+                    other.add(Tag(name="밈"))
+                    other.flush()
+                    raced["밈"] = other.scalar(select(Tag.id).where(Tag.name == "밈"))
+            return found
+
+        repository._select = select_then_race
+        ids, created = repository.get_or_create(["밈", "챌린지"])
+        assert ids["밈"] == raced["밈"]
+        assert created == {"챌린지"}
+
+
+def test_attach(posts):
+    with DatabaseManager() as session:
+        repository = TagRepository(session)
+        ids, _ = repository.get_or_create(["밈", "챌린지"])
+        pairs = [(post_id, ids["밈"]) for post_id in posts] + [(posts[0], ids["챌린지"])]
+        assert repository.attach(pairs + pairs[:1]) == 4
+        assert repository.attach(pairs) == 0
+        assert repository.attach([]) == 0
+
+    with DatabaseManager() as session:
+        assert session.scalar(select(func.count()).select_from(PostTag)) == 4
+        post = session.get(Post, posts[0])
+        assert sorted(tag.name for tag in post.tags) == ["밈", "챌린지"]
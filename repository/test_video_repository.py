@@ -0,0 +1,69 @@
+import pytest
+
+from repository.handler import DatabaseManager
+from repository.video_repository import SeenVideoIndex
+
+
+@pytest.fixture(autouse=True)
+def reset_db():
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+
+
+def test_seen_video_index():
+    with DatabaseManager() as session:
+        index = SeenVideoIndex(session)
+        assert index.load("밈") == frozenset()
+
+        assert index.add("밈", ["a", "b", "a"]) == 2
+        assert index.add("밈", ["b", "c"]) == 1
+        assert index.add("챌린지", ["a"]) == 1
+        assert index.add("밈", []) == 0
+
+    with DatabaseManager() as session:
+        index = SeenVideoIndex(session)
+        assert index.load("밈") == {"a", "b", "c"}
+        assert index.load("챌린지") == {"a"}
+
+
+def test_seen_video_index_filtered():
+    with DatabaseManager() as session:
+        index = SeenVideoIndex(session)
+        index.add("밈", ["a"])
+        assert index.add_filtered("밈", "views>=1", ["b", "c", "b"]) == 2
+        assert index.add_filtered("밈", "views>=1", ["b"]) == 0
+        assert index.add_filtered("밈", "views>=1", []) == 0
+
+    with DatabaseManager() as session:
+        index = SeenVideoIndex(session)
+        # 제외한 영상은 같은 필터 조건일 때만 이미 검사한 영상으로 봅니다.
+        assert index.load("밈") == {"a"}
+        assert index.load("밈", "views>=1") == {"a", "b", "c"}
+        assert index.load("밈", "views>=2") == {"a"}
+        assert index.add_filtered("밈", "views>=2", ["b"]) == 1
+        assert index.load("밈", "views>=2") == {"a", "b"}
+        assert index.load("밈", "views>=1") == {"a", "c"}
+
+
+def test_upsert_search_results_keeps_detail_columns():
+    from model.repository import Video
+    from repository.video_repository import VideoRepository
+
+    with DatabaseManager() as session:
+        VideoRepository(session).upsert(
+            {"id": "a", "title": "상세", "description": "설명", "length": 60, "views": 1}
+        )
+
+    rows = [
+        {"id": "a", "title": "밈", "thumbnail_url": None, "views": 5_000_000_000},
+        {"id": "b", "title": "이전", "thumbnail_url": None, "views": 1},
+        {"id": "b", "title": "챌린지", "thumbnail_url": None, "views": 2},
+    ]
+    with DatabaseManager() as session:
+        assert VideoRepository(session).upsert_search_results(rows) == 2
+
+    with DatabaseManager() as session:
+        a, b = session.query(Video).order_by(Video.id).all()
+        assert (a.title, a.description, a.length, a.views) == ("밈", "설명", 60, 5_000_000_000)
+        assert a.fetched_at is not None
+        assert (b.title, b.views, b.fetched_at) == ("챌린지", 2, None)
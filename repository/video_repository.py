@@ -0,0 +1,153 @@
+from datetime import timedelta
+from typing import Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from model.repository import HashTagFilteredVideo, HashTagSeenVideo, Video
+
+# upsert 시 갱신하는 영상 메타데이터 컬럼
+VIDEO_COLUMNS = (
+    "title",
+    "description",
+    "length",
+    "rating",
+    "publish_date",
+    "thumbnail_url",
+    "views",
+)
+# 해시태그 크롤링 결과에서 얻을 수 있는 컬럼
+SEARCH_RESULT_COLUMNS = ("title", "thumbnail_url", "views")
+
+
+class VideoRepository:
+    """`videos` 테이블을 조회하고 크롤링한 메타데이터를 upsert합니다."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_with_freshness(
+        self, video_id: str, fresh_for: timedelta
+    ) -> tuple[Video | None, timedelta]:
+        """영상과 함께 상세 메타데이터를 가져온 후 fresh_for까지 남은 시간을 반환합니다.
+
+        가져온 시간은 데이터베이스 시간으로 저장되므로 계산도 데이터베이스에서 수행합니다.
+        최신이 아니면 남은 시간은 0이며, 해시태그 크롤링으로만 저장된 영상은 상세 메타데이터가
+        없으므로 최신이 아닌 것으로 봅니다.
+        """
+        return self.get_many_with_freshness([video_id], fresh_for).get(
+            video_id, (None, timedelta(0))
+        )
+
+    def get_many_with_freshness(
+        self, video_ids: Iterable[str], fresh_for: timedelta
+    ) -> dict[str, tuple[Video, timedelta]]:
+        """여러 영상을 한 번의 쿼리로 조회합니다. 저장되지 않은 영상은 결과에 포함되지 않습니다."""
+        rows = self.session.execute(
+            select(Video, (Video.fetched_at + fresh_for - func.now()).label("remaining")).where(
+                Video.id.in_(list(video_ids)), Video.is_deleted.is_not(True)
+            )
+        )
+        return {
+            row.Video.id: (row.Video, max(row.remaining or timedelta(0), timedelta(0)))
+            for row in rows
+        }
+
+    def upsert(self, values: dict):
+        """YouTube에서 가져온 상세 메타데이터를 저장합니다. 이미 있으면 덮어씁니다."""
+        stmt = insert(Video).values(**values, fetched_at=func.now())
+        self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Video.id],
+                set_={
+                    **{
+                        column: stmt.excluded[column]
+                        for column in VIDEO_COLUMNS
+                        if column in values
+                    },
+                    "fetched_at": func.now(),
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    def upsert_search_results(self, rows: list[dict]) -> int:
+        """해시태그 크롤링 결과를 한 번의 executemany로 upsert하고 저장한 행 수를 반환합니다.
+
+        rows는 `id`와 `SEARCH_RESULT_COLUMNS`를 키로 갖습니다. 크롤링 결과에 없는 설명, 길이 등의
+        컬럼은 덮어쓰지 않으며, 같은 ID가 여러 번 있으면 마지막 행을 사용합니다.
+        """
+        rows = list({row["id"]: row for row in rows}.values())
+        if not rows:
+            return 0
+        stmt = insert(Video)
+        self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Video.id],
+                set_={
+                    **{column: stmt.excluded[column] for column in SEARCH_RESULT_COLUMNS},
+                    "updated_at": func.now(),
+                },
+            ),
+            rows,
+        )
+        return len(rows)
+
+
+class SeenVideoIndex:
+    """해시태그별로 이미 수집한 영상 ID와, 필터 조건에 맞지 않아 제외한 영상 ID를 조회하고 기록합니다."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def load(self, hashtag: str, filter_key: str | None = None) -> frozenset[str]:
+        """해시태그에서 지금까지 수집한 영상 ID 집합을 한 번의 쿼리로 불러옵니다.
+
+        filter_key가 주어지면 같은 필터 조건으로 제외한 영상 ID도 포함합니다.
+        """
+        seen = select(HashTagSeenVideo.video_id).where(HashTagSeenVideo.hashtag == hashtag)
+        if filter_key is not None:
+            seen = seen.union(
+                select(HashTagFilteredVideo.video_id).where(
+                    HashTagFilteredVideo.hashtag == hashtag,
+                    HashTagFilteredVideo.filter_key == filter_key,
+                )
+            )
+        return frozenset(self.session.scalars(seen))
+
+    def add(self, hashtag: str, video_ids: Iterable[str]) -> int:
+        """영상 ID를 일괄 추가하고 새로 추가된 개수를 반환합니다. 이미 있는 ID는 무시합니다."""
+        values = [
+            {"hashtag": hashtag, "video_id": video_id} for video_id in dict.fromkeys(video_ids)
+        ]
+        if not values:
+            return 0
+        inserted = self.session.scalars(
+            insert(HashTagSeenVideo)
+            .values(values)
+            .on_conflict_do_nothing()
+            .returning(HashTagSeenVideo.video_id)
+        )
+        return len(inserted.all())
+
+    def add_filtered(self, hashtag: str, filter_key: str, video_ids: Iterable[str]) -> int:
+        """필터 조건에 맞지 않아 제외한 영상 ID를 일괄 기록하고, 새로 기록한 개수를 반환합니다.
+
+        이전 필터 조건으로 기록된 ID는 현재 조건으로 바꿉니다.
+        """
+        values = [
+            {"hashtag": hashtag, "video_id": video_id, "filter_key": filter_key}
+            for video_id in dict.fromkeys(video_ids)
+        ]
+        if not values:
+            return 0
+        statement = insert(HashTagFilteredVideo).values(values)
+        inserted = self.session.scalars(
+            statement.on_conflict_do_update(
+                index_elements=[HashTagFilteredVideo.hashtag, HashTagFilteredVideo.video_id],
+                set_={"filter_key": statement.excluded.filter_key},
+                where=HashTagFilteredVideo.filter_key != statement.excluded.filter_key,
+            ).returning(HashTagFilteredVideo.video_id)
+        )
+        return len(inserted.all())
@@ -0,0 +1,153 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from model.controller import HashTagCrawlRequest
+
+# 워커 프로세스마다 초기화되는 전역 상태
+_worker_concurrency = 1
+_host_semaphores: dict = {}
+
+# 해시태그 크롤링이 요청을 보내는 호스트 (호스트별 동시 실행 수 제한 대상)
+HASHTAG_HOST = "www.youtube.com"
+
+
+def _init_worker(concurrency: int, host_semaphores: dict):
+    """워커 프로세스 시작 시 동시 실행 수와 호스트별 세마포어를 설정합니다."""
+    global _worker_concurrency, _host_semaphores
+    _worker_concurrency = concurrency
+    _host_semaphores = host_semaphores
+
+    from service.youtube.pool import get_driver_pool
+
+    # 워커 내부의 동시 작업마다 브라우저 하나씩 대여할 수 있도록 풀 크기를 맞춥니다.
+    get_driver_pool(size=concurrency)
+
+
+def _crawl_one(req: dict) -> dict:
+    from service.hashtag_service import HashTagService
+
+    item = {"hashtag": req["hashtag"], "limit": req["limit"], "result": None, "error": None}
+    semaphore = _host_semaphores.get(HASHTAG_HOST)
+    try:
+        if semaphore is not None:
+            semaphore.acquire()
+        try:
+            item["result"] = HashTagService().crawl_hashtag(HashTagCrawlRequest(**req))
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+    except Exception as e:
+        item["error"] = f"{type(e).__name__}: {e}"
+    return item
+
+
+def _crawl_shard(reqs: list[dict]) -> list[dict]:
+    """워커 프로세스에서 할당받은 해시태그들을 최대 `_worker_concurrency`개씩 동시에 크롤링합니다."""
+    with ThreadPoolExecutor(_worker_concurrency, thread_name_prefix="batch") as executor:
+        return list(executor.map(_crawl_one, reqs))
+
+
+class HashTagBatchService:
+    """여러 해시태그를 워커 프로세스들에 나누어 크롤링하고 결과와 오류를 모아 반환합니다.
+
+    - processes: 워커 프로세스 수 (`BATCH_PROCESSES`)
+    - per_worker: 워커 프로세스 하나가 동시에 실행하는 크롤링 수 (`BATCH_WORKER_CONCURRENCY`)
+    - per_host: 모든 워커를 통틀어 한 호스트에 동시에 보내는 크롤링 수 (`CRAWL_HOST_CONCURRENCY`)
+    """
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        per_worker: int | None = None,
+        per_host: int | None = None,
+    ):
+        self.processes = processes or int(os.getenv("BATCH_PROCESSES", "2"))
+        self.per_worker = per_worker or int(os.getenv("BATCH_WORKER_CONCURRENCY", "1"))
+        self.per_host = per_host or int(os.getenv("CRAWL_HOST_CONCURRENCY", "4"))
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def crawl(self, reqs: list[HashTagCrawlRequest]) -> dict:
+        """일부 해시태그가 실패해도 나머지 결과는 그대로 반환합니다."""
+        shards = self._partition([req.model_dump() for req in reqs])
+        executor = self._get_executor()
+        futures = [
+            (shard, executor.submit(_crawl_shard, [req for _, req in shard])) for shard in shards
+        ]
+
+        results = {}
+        for shard, future in futures:
+            try:
+                items = future.result()
+            except BrokenProcessPool as e:
+                self._reset_executor(executor)
+                items = [self._failed(req, e) for _, req in shard]
+            except Exception as e:
+                items = [self._failed(req, e) for _, req in shard]
+            for (idx, _), item in zip(shard, items):
+                results[idx] = item
+
+        ordered = [results[idx] for idx in range(len(reqs))]
+        failed = sum(1 for item in ordered if item["error"])
+        return {"succeeded": len(ordered) - failed, "failed": failed, "results": ordered}
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _partition(self, reqs: list[dict]) -> list[list[tuple[int, dict]]]:
+        """요청 순서를 기억한 채로 워커 프로세스 수만큼 라운드 로빈 분할합니다."""
+        shards = [[] for _ in range(min(self.processes, len(reqs)))]
+        for idx, req in enumerate(reqs):
+            shards[idx % len(shards)].append((idx, req))
+        return shards
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # 스레드가 많은 서버 프로세스를 fork하지 않도록 spawn 방식으로 워커를 생성합니다.
+                context = multiprocessing.get_context("spawn")
+                host_semaphores = {HASHTAG_HOST: context.BoundedSemaphore(self.per_host)}
+                self._executor = ProcessPoolExecutor(
+                    self.processes,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self.per_worker, host_semaphores),
+                )
+            return self._executor
+
+    def _reset_executor(self, broken: ProcessPoolExecutor):
+        """깨진 실행기를 버리고 남은 워커 프로세스를 정리합니다. 다음 요청에서 새로 생성합니다."""
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _failed(req: dict, error: Exception) -> dict:
+        return {
+            "hashtag": req["hashtag"],
+            "limit": req["limit"],
+            "result": None,
+            "error": f"{type(error).__name__}: {error}",
+        }
+
+
+_default_service: HashTagBatchService | None = None
+_default_service_lock = threading.Lock()
+
+
+def get_batch_service() -> HashTagBatchService:
+    """프로세스 전역에서 공유하는 배치 크롤링 서비스를 반환합니다."""
+    global _default_service
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = HashTagBatchService()
+            atexit.register(_default_service.shutdown)
+        return _default_service
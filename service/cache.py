@@ -0,0 +1,254 @@
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 요청한 개수보다 적게 수집했더라도 전체 결과로 간주할 수 있는 종료 사유
+_COMPLETE_REASONS = ("end_of_feed",)
+# 캐시에 저장할 수 있는 종료 사유 (오류, 시간 초과, 취소로 끝난 결과는 저장하지 않습니다)
+_CACHEABLE_REASONS = ("limit", *_COMPLETE_REASONS)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """해시태그 하나의 크롤링 결과와 저장 시점입니다."""
+
+    limit: int
+    data: dict
+    stored_at: float
+
+    def covers(self, limit: int) -> bool:
+        """더 작거나 같은 limit의 요청에 이 결과를 잘라서 응답할 수 있는지 확인합니다."""
+        return self.limit >= limit or self.data.get("stop_reason") in _COMPLETE_REASONS
+
+    def slice(self, limit: int) -> dict:
+        contents = self.data["contents"][:limit]
+        return {**self.data, "length": len(contents), "contents": contents}
+
+
+class MemoryTier:
+    """프로세스 내부의 LRU 캐시 계층입니다. 저장하는 값의 형식은 사용하는 쪽에서 정합니다."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: Any):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteTier:
+    """uvicorn 워커 프로세스들이 함께 사용하는 SQLite 파일 캐시 계층입니다."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS crawl_cache ("
+                "key TEXT PRIMARY KEY, max_limit INTEGER, stored_at REAL, data TEXT)"
+            )
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT max_limit, stored_at, data FROM crawl_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(limit=row[0], data=json.loads(row[2]), stored_at=row[1])
+
+    def put(self, key: str, entry: CacheEntry):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO crawl_cache VALUES (?, ?, ?, ?)",
+                (key, entry.limit, entry.stored_at, json.dumps(entry.data, ensure_ascii=False)),
+            )
+
+    def prune(self, expired_before: float):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM crawl_cache WHERE stored_at < ?", (expired_before,))
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM crawl_cache")
+
+    def _connect(self) -> sqlite3.Connection:
+        # 연결을 스레드 간에 공유하지 않도록 작업마다 새로 엽니다.
+        return sqlite3.connect(self.path, timeout=5)
+
+
+class CrawlCache:
+    """메모리 LRU와 공유 SQLite 두 계층으로 이루어진 해시태그 크롤링 결과 캐시입니다.
+
+    - ttl: 저장 후 이 시간(초) 동안은 그대로 응답합니다. (`HASHTAG_CACHE_TTL`)
+    - stale_ttl: ttl이 지난 뒤 이 시간(초)까지는 오래된 결과로 응답하면서
+      백그라운드에서 한 번만 갱신합니다. (`HASHTAG_CACHE_STALE_TTL`)
+    - maxsize: 메모리 계층에 보관하는 해시태그 수 (`HASHTAG_CACHE_SIZE`)
+    - path: 공유 계층 SQLite 파일 경로 (`HASHTAG_CACHE_PATH`)
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        stale_ttl: float | None = None,
+        maxsize: int | None = None,
+        path: str | Path | None = None,
+    ):
+        self.ttl = ttl if ttl is not None else float(os.getenv("HASHTAG_CACHE_TTL", "60"))
+        self.stale_ttl = (
+            stale_ttl
+            if stale_ttl is not None
+            else float(os.getenv("HASHTAG_CACHE_STALE_TTL", "600"))
+        )
+        self.memory = MemoryTier(maxsize or int(os.getenv("HASHTAG_CACHE_SIZE", "256")))
+        self.shared = SqliteTier(
+            path or os.getenv("HASHTAG_CACHE_PATH", ".cache/hashtag_cache.sqlite3")
+        )
+        self._refreshing: set[str] = set()
+        self._refresher = ThreadPoolExecutor(1, thread_name_prefix="cache-refresh")
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(
+            ("memory_hits", "shared_hits", "stale_hits", "misses", "bypasses", "refreshes"), 0
+        )
+
+    def get(self, key: str, limit: int, refresh: Callable[[int], Any] | None = None) -> dict | None:
+        """limit 이상을 담은 결과가 있으면 limit개로 잘라 반환하고, 없으면 None을 반환합니다.
+
+        오래된 결과를 반환할 때는 refresh를 백그라운드에서 호출합니다.
+        refresh는 저장된 limit으로 다시 크롤링하고 `put`으로 결과를 갱신해야 합니다.
+        """
+        now = time.time()
+        entry, tier = self.memory.get(key), "memory_hits"
+        if entry is None or not entry.covers(limit) or not self._is_fresh(entry):
+            # 다른 워커가 더 최신이거나 더 큰 결과를 공유 계층에 저장했을 수 있습니다.
+            shared = self.shared.get(key)
+            if shared is not None and (
+                entry is None
+                or (shared.covers(limit), shared.stored_at) > (entry.covers(limit), entry.stored_at)
+            ):
+                entry, tier = shared, "shared_hits"
+                self.memory.put(key, entry)
+
+        age = now - entry.stored_at if entry is not None else None
+        if entry is None or not entry.covers(limit) or age >= self.ttl + self.stale_ttl:
+            self._count("misses")
+            return None
+        if age >= self.ttl:
+            self._count("stale_hits")
+            if refresh is not None:
+                self._schedule_refresh(key, entry.limit, refresh)
+        else:
+            self._count(tier)
+        return entry.slice(limit)
+
+    def put(self, key: str, limit: int, data: dict):
+        """종료 사유가 정상인 결과만 두 계층에 모두 저장합니다."""
+        if self.ttl <= 0 or data.get("stop_reason") not in _CACHEABLE_REASONS:
+            return
+        entry = CacheEntry(limit=limit, data=data, stored_at=time.time())
+        current = self.memory.get(key)
+        if current is not None and current.limit > limit and self._is_fresh(current):
+            # 더 많은 결과를 담은 최신 항목을 작은 결과로 덮어쓰지 않습니다.
+            return
+        self.memory.put(key, entry)
+        self.shared.put(key, entry)
+        self.shared.prune(entry.stored_at - self.ttl - self.stale_ttl)
+
+    def bypass(self):
+        """호출자가 캐시를 무시하고 새로 크롤링했음을 기록합니다."""
+        self._count("bypasses")
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["memory_hits"] + stats["shared_hits"] + stats["stale_hits"]
+        lookups += stats["misses"]
+        hits = lookups - stats["misses"]
+        return {
+            **stats,
+            "hit_ratio": round(hits / lookups, 4) if lookups else None,
+            "memory_size": len(self.memory),
+            "refreshing": len(self._refreshing),
+        }
+
+    def clear(self):
+        self.memory.clear()
+        self.shared.clear()
+
+    def shutdown(self):
+        self._refresher.shutdown(wait=False, cancel_futures=True)
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def _schedule_refresh(self, key: str, limit: int, refresh: Callable[[int], Any]):
+        """같은 키의 갱신이 이미 진행 중이면 새로 예약하지 않습니다."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self._stats["refreshes"] += 1
+
+        def run():
+            try:
+                refresh(limit)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._refresher.submit(run)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+
+_default_cache: CrawlCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_crawl_cache() -> CrawlCache:
+    """프로세스 전역에서 공유하는 해시태그 크롤링 결과 캐시를 반환합니다."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = CrawlCache()
+            atexit.register(_default_cache.shutdown)
+        return _default_cache
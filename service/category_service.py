@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+from dotenv import load_dotenv
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+# .env 파일 로드
+load_dotenv()
+
+
+@dataclass(frozen=True)
+class CategoryTree:
+    """카테고리 계층 전체의 읽기 전용 스냅샷입니다."""
+
+    names: dict[int, str]
+    parents: dict[int, int | None]
+    children: dict[int, list[int]] = field(default_factory=dict)
+
+    def descendants(self, category_id: int) -> list[int]:
+        """category_id와 모든 하위 카테고리 ID를 반환합니다."""
+        result, stack = [], [category_id]
+        while stack:
+            current = stack.pop()
+            result.append(current)
+            stack.extend(reversed(self.children.get(current, [])))
+        return result
+
+    def path_to_root(self, category_id: int) -> list[int]:
+        """category_id부터 최상위 카테고리까지의 ID를 반환합니다."""
+        path = [category_id]
+        while (parent := self.parents.get(path[-1])) is not None:
+            path.append(parent)
+        return path
+
+
+class CategoryTreeCache:
+    """카테고리 계층을 프로세스 메모리에 보관합니다.
+
+    카테고리를 추가/이동/삭제한 트랜잭션이 커밋되면 즉시 무효화하고, 다른 프로세스의 변경은
+    `CATEGORY_TREE_TTL`초 안에 반영됩니다.
+    """
+
+    def __init__(self, ttl: float | None = None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("CATEGORY_TREE_TTL", "60"))
+        self._lock = threading.Lock()
+        self._tree: CategoryTree | None = None
+        self._loaded_at = 0.0
+        self._version = 0
+
+    def get(self, session: Session | None = None) -> CategoryTree:
+        """캐시된 계층을 반환합니다. 만료되었으면 session(없으면 새 세션)으로 다시 불러옵니다."""
+        with self._lock:
+            if self._tree is not None and time.monotonic() - self._loaded_at < self.ttl:
+                return self._tree
+            version = self._version
+        tree = self._load(session)
+        with self._lock:
+            # 불러오는 동안 무효화되었다면 저장하지 않습니다.
+            if version == self._version:
+                self._tree, self._loaded_at = tree, time.monotonic()
+        return tree
+
+    def invalidate(self):
+        with self._lock:
+            self._tree = None
+            self._version += 1
+
+    @staticmethod
+    def _load(session: Session | None = None) -> CategoryTree:
+        from model.repository import Category
+        from repository.handler import DatabaseManager
+
+        query = select(Category.id, Category.name, Category.upper_category_id)
+        query = query.order_by(Category.id)
+        if session is not None:
+            rows = session.execute(query).all()
+        else:
+            with DatabaseManager() as session:
+                rows = session.execute(query).all()
+        children: dict[int, list[int]] = {}
+        for category_id, _, parent_id in rows:
+            if parent_id is not None:
+                children.setdefault(parent_id, []).append(category_id)
+        return CategoryTree(
+            names={category_id: name for category_id, name, _ in rows},
+            parents={category_id: parent_id for category_id, _, parent_id in rows},
+            children=children,
+        )
+
+
+_default_tree_cache: CategoryTreeCache | None = None
+_default_tree_cache_lock = threading.Lock()
+
+
+def get_category_tree_cache() -> CategoryTreeCache:
+    """프로세스 전역에서 공유하는 카테고리 계층 캐시를 반환합니다."""
+    global _default_tree_cache
+    with _default_tree_cache_lock:
+        if _default_tree_cache is None:
+            _default_tree_cache = CategoryTreeCache()
+        return _default_tree_cache
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session):
+    if session.info.pop("category_changed", False) and _default_tree_cache is not None:
+        _default_tree_cache.invalidate()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_on_rollback(session: Session, previous_transaction):
+    if not previous_transaction.nested:
+        session.info.pop("category_changed", None)
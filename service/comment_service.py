@@ -0,0 +1,44 @@
+import os
+
+from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from service.cursor import InvalidCursor, decode_cursor, encode_cursor
+
+# .env 파일 로드
+load_dotenv()
+
+
+class CommentThreadService:
+    """게시글의 댓글 트리를 조회합니다.
+
+    - 대댓글은 `COMMENT_THREAD_MAX_DEPTH` 깊이까지 펼칩니다.
+    - 한 페이지에서 불러오는 대댓글은 최대 `COMMENT_THREAD_MAX_NODES`개입니다.
+    """
+
+    MAX_DEPTH = int(os.getenv("COMMENT_THREAD_MAX_DEPTH", "10"))
+    MAX_NODES = int(os.getenv("COMMENT_THREAD_MAX_NODES", "2000"))
+
+    async def thread(
+        self, session: AsyncSession, post_id: int, limit: int = 20, cursor: str | None = None
+    ) -> dict:
+        from repository.comment_repository import CommentRepository
+
+        after = self.decode_cursor(cursor) if cursor else None
+        comments, next_cursor, truncated = await session.run_sync(
+            lambda sync_session: CommentRepository(sync_session).thread(
+                post_id, after, limit, self.MAX_DEPTH, self.MAX_NODES
+            )
+        )
+        return {
+            "comments": comments,
+            "next_cursor": encode_cursor([next_cursor]) if next_cursor else None,
+            "truncated": truncated,
+        }
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> int:
+        (comment_id,) = decode_cursor(cursor, 1)
+        if not isinstance(comment_id, int):
+            raise InvalidCursor(f"잘못된 커서입니다: {cursor}")
+        return comment_id
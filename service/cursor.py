@@ -0,0 +1,23 @@
+import base64
+import json
+
+
+class InvalidCursor(ValueError):
+    """해석할 수 없는 페이지 커서입니다."""
+
+
+def encode_cursor(values: list) -> str:
+    """키셋 페이지네이션의 마지막 키를 URL에 넣을 수 있는 불투명한 문자열로 만듭니다."""
+    raw = json.dumps(values, ensure_ascii=False).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    """`encode_cursor`로 만든 커서를 해석합니다. 값이 length개가 아니면 `InvalidCursor`입니다."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:
+        raise InvalidCursor(f"잘못된 커서입니다: {cursor}") from e
+    if not isinstance(values, list) or len(values) != length:
+        raise InvalidCursor(f"잘못된 커서입니다: {cursor}")
+    return values
@@ -1,26 +1,189 @@
+import os
+import time
+from typing import Callable, Generator
+
 from model.controller import HashTagCrawlRequest
 
 
 class HashTagService:
-    def crawl_hashtag(self, req: HashTagCrawlRequest) -> dict:
-        from urllib.parse import quote
+    # 스트리밍 중 수집한 콘텐츠를 저장 파이프라인에 넘기는 단위
+    STREAM_PERSIST_BATCH = 20
 
-        from service.youtube.crawler import YouTubeCrawler
-        from service.youtube.strategy import HashTagStrategy
+    def __init__(self, engine: str | None = None, extraction: str | None = None):
+        """
+        engine은 `browser`(Selenium) 또는 `http`(브라우저 없는 HTTP 요청) 중 하나입니다.
+        extraction은 browser 엔진의 추출 방식으로 `element`(요소별) 또는 `batch`(스크립트 일괄)입니다.
+        """
+        self.engine = engine or os.getenv("HASHTAG_CRAWL_ENGINE", "browser")
+        self.extraction = extraction or os.getenv("HASHTAG_EXTRACTION", "element")
+
+    def crawl_hashtag(
+        self, req: HashTagCrawlRequest, on_progress: Callable[[int], None] | None = None
+    ) -> dict:
+        from urllib.parse import quote
 
-        with YouTubeCrawler() as crawler:
+        crawler, strategy = self._youtube_engine()
+        with crawler:
+            # 제외한 영상 기록은 전략의 필터 조건에 따라 다르므로 전략을 만든 뒤 불러옵니다.
+            incremental = (
+                self._load_incremental(req.hashtag, strategy.filter_key())
+                if req.incremental
+                else None
+            )
             url = f"https://www.youtube.com/hashtag/{quote(req.hashtag)}"
-            data = crawler.scrape(url, HashTagStrategy(), req.limit)
+            data = crawler.scrape(url, strategy, req.limit, on_progress, incremental)
 
-            # [ ] TODO db 저장
+        if incremental is not None:
+            self._save_incremental(req.hashtag, incremental)
+        else:
+            from service.cache import get_crawl_cache
+
+            get_crawl_cache().put(req.hashtag, req.limit, data)
+
+        self._persist(data["contents"])
+        return data
 
+    @staticmethod
+    def flight_key(req: HashTagCrawlRequest) -> str:
+        """같은 결과를 얻는 요청끼리 같은 값을 갖는 single-flight 키입니다.
+
+        해시태그는 `HashTagCrawlRequest`에서 정규화되므로 캐시 키, 수집 이력 키와 같습니다.
+        """
+        return f"hashtag:{req.hashtag}:{'incremental' if req.incremental else 'full'}"
+
+    @staticmethod
+    def limit_result(data: dict, limit: int) -> dict:
+        """더 큰 limit으로 크롤링한 결과를 요청한 limit만큼 잘라냅니다."""
+        if len(data["contents"]) <= limit:
             return data
+        contents = data["contents"][:limit]
+        return {**data, "length": len(contents), "contents": contents}
+
+    def cached_hashtag(self, req: HashTagCrawlRequest) -> dict | None:
+        """캐시된 크롤링 결과를 반환합니다. 오래된 결과라면 백그라운드에서 다시 크롤링합니다."""
+        from service.cache import get_crawl_cache
+
+        if req.incremental:
+            # 증분 크롤링 결과는 이전 크롤링 이력에 따라 달라지므로 캐시하지 않습니다.
+            return None
+
+        def refresh(limit: int):
+            from service.job_service import get_job_manager
+
+            # 갱신도 크롤링 작업 실행기에서 수행하여 동시에 실행되는 브라우저 수를 제한합니다.
+            refresh_req = HashTagCrawlRequest(hashtag=req.hashtag, limit=limit)
+            job = get_job_manager().submit(
+                "refresh_hashtag", lambda job: self.crawl_hashtag(refresh_req), total=limit
+            )
+            job.future.result()
+
+        return get_crawl_cache().get(req.hashtag, req.limit, refresh)
+
+    def stream_hashtag(self, req: HashTagCrawlRequest) -> Generator[dict, None, None]:
+        """콘텐츠를 수집하는 즉시 `item` 레코드로 반환하고, 마지막에 `summary` 레코드를 반환합니다.
+
+        summary에는 첫 콘텐츠까지 걸린 시간(time_to_first_item)과 전체 소요 시간이 포함됩니다.
+        저장 큐가 가득 찼을 때 콘텐츠마다 기다리지 않도록 STREAM_PERSIST_BATCH개씩 모아 저장
+        파이프라인에 넘기고, 남은 콘텐츠는 스트림이 끝나거나 중단될 때 넘깁니다.
+        """
+        from urllib.parse import quote
+
+        started = time.monotonic()
+        first_item_at, length, pending = None, 0, []
+        crawler, strategy = self._youtube_engine()
+        try:
+            with crawler:
+                url = f"https://www.youtube.com/hashtag/{quote(req.hashtag)}"
+                items = crawler.iterate(url, strategy, req.limit)
+                while True:
+                    try:
+                        content = next(items)
+                    except StopIteration as stop:
+                        reason = stop.value
+                        break
+                    if first_item_at is None:
+                        first_item_at = time.monotonic()
+                    length += 1
+                    pending.append(content)
+                    if len(pending) >= self.STREAM_PERSIST_BATCH:
+                        self._persist(pending)
+                        pending = []
+                    yield {"type": "item", "data": content}
+        finally:
+            if pending:
+                self._persist(pending)
+
+        yield {
+            "type": "summary",
+            "data": {
+                "length": length,
+                "stop_reason": reason.value,
+                "time_to_first_item": (
+                    round(first_item_at - started, 3) if first_item_at is not None else None
+                ),
+                "elapsed": round(time.monotonic() - started, 3),
+            },
+        }
+
+    @staticmethod
+    def _persist(contents: list[dict]):
+        """수집한 콘텐츠를 `videos` 테이블에 비동기로 저장하도록 파이프라인에 전달합니다."""
+        from service.video_pipeline import get_video_pipeline
+
+        get_video_pipeline().submit(contents)
+
+    @staticmethod
+    def _load_incremental(hashtag: str, filter_key: str):
+        """해시태그에서 이미 수집했거나 같은 필터 조건으로 제외한 영상 ID로 증분 크롤링 설정을 만듭니다."""
+        from repository.handler import DatabaseManager
+        from repository.video_repository import SeenVideoIndex
+        from service.youtube.strategy import Incremental
+
+        with DatabaseManager() as session:
+            known = SeenVideoIndex(session).load(hashtag, filter_key)
+        return Incremental(
+            known=known,
+            stop_after=int(os.getenv("HASHTAG_KNOWN_STOP_RUN", "20")),
+            filter_key=filter_key,
+        )
+
+    @staticmethod
+    def _save_incremental(hashtag: str, incremental):
+        """이번 크롤링에서 새로 추출한 영상 ID와 필터에서 제외한 영상 ID를 인덱스에 기록합니다."""
+        from repository.handler import DatabaseManager
+        from repository.video_repository import SeenVideoIndex
+
+        with DatabaseManager() as session:
+            index = SeenVideoIndex(session)
+            index.add(hashtag, incremental.new_ids)
+            index.add_filtered(hashtag, incremental.filter_key, incremental.filtered_ids)
+
+    def _youtube_engine(self):
+        """설정된 엔진에 맞는 크롤러와 스크래핑 전략을 생성합니다."""
+        match self.engine:
+            case "http":
+                from service.youtube.http_crawler import YouTubeHttpCrawler
+                from service.youtube.strategy import HashTagHttpStrategy
+
+                return YouTubeHttpCrawler(), HashTagHttpStrategy()
+            case "browser":
+                from service.youtube.crawler import YouTubeCrawler
+                from service.youtube.pool import get_driver_pool
+                from service.youtube.strategy import BatchedHashTagStrategy, HashTagStrategy
+
+                strategies = {"element": HashTagStrategy, "batch": BatchedHashTagStrategy}
+                if self.extraction not in strategies:
+                    raise ValueError(f"지원하지 않는 추출 방식입니다: {self.extraction}")
+                return YouTubeCrawler(pool=get_driver_pool()), strategies[self.extraction]()
+            case _:
+                raise ValueError(f"지원하지 않는 크롤링 엔진입니다: {self.engine}")
 
     def crawl_namuwiki(self) -> dict:
         from service.youtube.crawler import NamuWikiCrawler
+        from service.youtube.pool import get_driver_pool
         from service.youtube.strategy import NamuWikiStrategy
 
-        with NamuWikiCrawler() as crawler:
+        with NamuWikiCrawler(pool=get_driver_pool()) as crawler:
             url = "https://namu.wiki/w/%EB%B0%88(%EC%9D%B8%ED%84%B0%EB%84%B7%20%EC%9A%A9%EC%96%B4)"
             data = crawler.scrape(url, NamuWikiStrategy())
 
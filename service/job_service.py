@@ -0,0 +1,163 @@
+import atexit
+import os
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Callable
+
+from service.youtube.strategy import ScrapeStopped, StopReason
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class JobCancelled(ScrapeStopped):
+    """취소 요청된 작업에서 진행 상황을 보고할 때 발생합니다.
+
+    `ScrapeStrategy.run`은 이 예외를 받으면 지금까지 수집한 결과를 반환하고 종료합니다.
+    """
+
+    def __init__(self):
+        super().__init__(StopReason.CANCELLED)
+
+
+@dataclass
+class Job:
+    """실행기에서 비동기로 수행되는 작업의 상태입니다."""
+
+    kind: str
+    total: int | None = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: JobStatus = JobStatus.PENDING
+    progress: int = 0
+    result: Any = None
+    error: str | None = None
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    future: Future | None = field(default=None, repr=False)
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+    def report(self, progress: int):
+        """진행 상황을 기록합니다. 취소 요청이 있으면 `JobCancelled`를 발생시킵니다."""
+        if self.cancel_requested:
+            raise JobCancelled()
+        self.progress = progress
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status.value,
+            "progress": self.progress,
+            "total": self.total,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobManager:
+    """블로킹 크롤링 작업을 크기가 제한된 스레드 실행기에서 수행하고 상태를 보관합니다."""
+
+    def __init__(self, max_workers: int | None = None, retention: timedelta | None = None):
+        self.max_workers = max_workers or int(
+            os.getenv("CRAWLER_WORKERS", os.getenv("CRAWLER_POOL_SIZE", "2"))
+        )
+        self.retention = retention or timedelta(
+            minutes=float(os.getenv("JOB_RETENTION_MINUTES", "60"))
+        )
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="crawler")
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, fn: Callable[[Job], Any], total: int | None = None) -> Job:
+        """작업을 등록하고 즉시 반환합니다. fn은 자신의 `Job`을 인자로 받아 실행됩니다."""
+        job = Job(kind=kind, total=total)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        job.future = self._executor.submit(self._execute, job, fn)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Job | None:
+        """작업 취소를 요청합니다. 대기 중인 작업은 즉시, 실행 중인 작업은 다음 진행 보고 시 취소됩니다."""
+        job = self.get(job_id)
+        if job is None or job.done:
+            return job
+        job._cancel.set()
+        if job.future is not None and job.future.cancel():
+            job.status = JobStatus.CANCELLED
+            job.finished_at = datetime.now()
+        return job
+
+    def shutdown(self):
+        """대기 중인 작업을 취소하고 실행 중인 작업에 취소를 요청합니다."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            self.cancel(job.id)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _execute(self, job: Job, fn: Callable[[Job], Any]) -> Any:
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.now()
+        try:
+            job.result = fn(job)
+        except JobCancelled:
+            job.status = JobStatus.CANCELLED
+        except Exception as e:
+            job.status = JobStatus.FAILED
+            job.error = f"{type(e).__name__}: {e}"
+            raise
+        else:
+            job.status = JobStatus.CANCELLED if job.cancel_requested else JobStatus.SUCCEEDED
+        finally:
+            job.finished_at = datetime.now()
+        return job.result
+
+    def _prune(self):
+        """보관 기간이 지난 완료 작업을 삭제합니다."""
+        expired_before = datetime.now() - self.retention
+        for job_id in [
+            job.id
+            for job in self._jobs.values()
+            if job.done and job.finished_at and job.finished_at < expired_before
+        ]:
+            del self._jobs[job_id]
+
+
+_default_manager: JobManager | None = None
+_default_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """프로세스 전역에서 공유하는 작업 관리자를 반환합니다."""
+    global _default_manager
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = JobManager()
+            atexit.register(_default_manager.shutdown)
+        return _default_manager
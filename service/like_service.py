@@ -0,0 +1,204 @@
+import atexit
+import os
+import threading
+from collections import Counter
+from typing import Callable, Iterable
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# .env 파일 로드
+load_dotenv()
+
+# 좋아요 대상: (target_type, target_id)
+Target = tuple[str, int]
+
+
+def _write_deltas(deltas: dict[Target, int], epoch: int) -> int:
+    from repository.handler import DatabaseManager
+    from repository.like_repository import LikeRepository
+
+    with DatabaseManager() as session:
+        return LikeRepository(session).apply_deltas(deltas, epoch)
+
+
+class LikeCounter:
+    """좋아요 수 변경분을 메모리에 모았다가 주기적으로 `like_counts`에 일괄 반영합니다.
+
+    인기 게시글에 좋아요가 몰려도 집계 행은 flush_interval초(`LIKE_COUNT_FLUSH_INTERVAL`)마다
+    한 번만 갱신됩니다. flush_interval이 0이면 모으지 않고 바로 반영합니다. 반영에 실패한 변경분은
+    다음 주기에 다시 반영하며, 프로세스가 비정상 종료되어 잃어버린 변경분은
+    `inssider repair likes`로 바로잡습니다.
+
+    변경분은 좋아요를 기록할 때 읽은 집계 세대별로 모읍니다. 그 사이 집계를 다시 계산했다면
+    이전 세대의 변경분은 이미 집계에 포함되어 있으므로 반영할 때 버려집니다.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float | None = None,
+        writer: Callable[[dict[Target, int], int], int] = _write_deltas,
+    ):
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else float(os.getenv("LIKE_COUNT_FLUSH_INTERVAL", "1"))
+        )
+        self.writer = writer
+        # 세대 -> 대상별 변경분
+        self._pending: dict[int, Counter[Target]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._stats = {"flushes": 0, "targets_written": 0, "failed_flushes": 0}
+        self._thread = threading.Thread(target=self._run, name="like-counter", daemon=True)
+        self._thread.start()
+
+    def add(self, target: Target, delta: int, epoch: int = 0):
+        with self._lock:
+            self._pending.setdefault(epoch, Counter())[target] += delta
+        if self.flush_interval == 0:
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"좋아요 수 반영 실패: {e}")
+
+    def pending(self, targets: Iterable[Target]) -> dict[Target, int]:
+        """아직 반영하지 않은 변경분을 반환합니다. 조회 결과에 더하면 방금 누른 좋아요도 보입니다."""
+        with self._lock:
+            pending = Counter()
+            for deltas in self._pending.values():
+                pending.update(deltas)
+            return {target: pending[target] for target in targets if target in pending}
+
+    def flush(self):
+        """모아 둔 변경분을 세대 순으로 반영합니다. 실패하면 남은 변경분을 되돌려 놓고 예외를 발생시킵니다."""
+        with self._flush_lock:
+            with self._lock:
+                batches = {}
+                for epoch, deltas in sorted(self._pending.items()):
+                    if deltas := {target: delta for target, delta in deltas.items() if delta}:
+                        batches[epoch] = deltas
+                self._pending.clear()
+            if not batches:
+                return
+            written = 0
+            for epoch, deltas in batches.items():
+                try:
+                    written += self.writer(deltas, epoch)
+                except Exception:
+                    with self._lock:
+                        for failed, failed_deltas in batches.items():
+                            if failed >= epoch:
+                                self._pending.setdefault(failed, Counter()).update(failed_deltas)
+                        self._stats["failed_flushes"] += 1
+                    raise
+            with self._lock:
+                self._stats["flushes"] += 1
+                self._stats["targets_written"] += written
+
+    def close(self):
+        """백그라운드 스레드를 종료하고 남은 변경분을 반영합니다."""
+        self._closed.set()
+        self._thread.join()
+        self.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            targets = {target for deltas in self._pending.values() for target in deltas}
+            return {**self._stats, "pending_targets": len(targets)}
+
+    def _run(self):
+        # flush_interval이 0이면 add에서 바로 반영하므로 종료될 때까지 기다리기만 합니다.
+        while not self._closed.wait(self.flush_interval or None):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"좋아요 수 반영 실패: {e}")
+
+
+_default_counter: LikeCounter | None = None
+_default_counter_lock = threading.Lock()
+
+
+def get_like_counter() -> LikeCounter:
+    """프로세스 전역에서 공유하는 좋아요 수 버퍼를 반환합니다."""
+    global _default_counter
+    with _default_counter_lock:
+        if _default_counter is None:
+            _default_counter = LikeCounter()
+            atexit.register(_default_counter.close)
+        return _default_counter
+
+
+class LikeService:
+    """호출자의 세션에서 좋아요를 기록하고 좋아요 수를 조회합니다."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def like(self, user_id: int, target: Target) -> bool:
+        """좋아요를 기록합니다. 좋아요 수는 트랜잭션이 커밋된 뒤 버퍼에 더합니다."""
+        from repository.like_repository import LikeRepository
+
+        repository = LikeRepository(self.session)
+        epoch = self._epoch(repository)
+        liked = repository.like(user_id, target)
+        if liked:
+            self._add_after_commit(target, 1, epoch)
+        return liked
+
+    def unlike(self, user_id: int, target: Target) -> bool:
+        from repository.like_repository import LikeRepository
+
+        repository = LikeRepository(self.session)
+        epoch = self._epoch(repository)
+        unliked = repository.unlike(user_id, target)
+        if unliked:
+            self._add_after_commit(target, -1, epoch)
+        return unliked
+
+    def counts(self, targets: Iterable[Target]) -> dict[Target, int]:
+        """여러 대상의 좋아요 수를 한 번의 쿼리로 조회하고, 반영 대기 중인 변경분을 더합니다."""
+        from repository.like_repository import LikeRepository
+
+        counts = LikeRepository(self.session).counts(targets)
+        for target, delta in get_like_counter().pending(counts).items():
+            counts[target] = max(counts[target] + delta, 0)
+        return counts
+
+    def _epoch(self, repository) -> int:
+        # 세대는 트랜잭션당 한 번 읽습니다. 공유 잠금은 트랜잭션이 끝날 때까지 유지됩니다.
+        if "like_epoch" not in self.session.info:
+            self.session.info["like_epoch"] = repository.epoch()
+        return self.session.info["like_epoch"]
+
+    def _add_after_commit(self, target: Target, delta: int, epoch: int):
+        # 롤백된 좋아요가 집계에 반영되지 않도록 커밋된 뒤에 버퍼에 더합니다.
+        self.session.info.setdefault("like_deltas", Counter())[(epoch, target)] += delta
+
+
+@event.listens_for(Session, "after_commit")
+def _add_on_commit(session: Session):
+    session.info.pop("like_epoch", None)
+    for (epoch, target), delta in session.info.pop("like_deltas", {}).items():
+        get_like_counter().add(target, delta, epoch)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_on_rollback(session: Session, previous_transaction):
+    if not previous_transaction.nested:
+        session.info.pop("like_epoch", None)
+        session.info.pop("like_deltas", None)
+
+
+def reconcile_like_counts() -> int:
+    """이 프로세스의 변경분을 반영한 뒤 `likes`에서 좋아요 수를 다시 계산합니다."""
+    from repository.handler import DatabaseManager
+    from repository.like_repository import LikeRepository
+
+    if _default_counter is not None:
+        _default_counter.flush()
+    with DatabaseManager() as session:
+        return LikeRepository(session).reconcile()
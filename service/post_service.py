@@ -0,0 +1,76 @@
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from service.cursor import InvalidCursor, decode_cursor, encode_cursor
+
+
+class PostFeedService:
+    """게시글 피드를 조회합니다. 카테고리 필터는 하위 카테고리를 모두 포함합니다."""
+
+    async def feed(
+        self,
+        session: AsyncSession,
+        limit: int = 20,
+        cursor: str | None = None,
+        category_id: int | None = None,
+        tag: str | None = None,
+    ) -> dict:
+        after = self.decode_cursor(cursor) if cursor else None
+        return await session.run_sync(
+            lambda sync_session: self._feed(sync_session, limit, after, category_id, tag)
+        )
+
+    def _feed(self, session: Session, limit, after, category_id, tag) -> dict:
+        from repository.post_repository import PostRepository
+        from service.category_service import get_category_tree_cache
+        from service.like_service import LikeService
+
+        category_ids = None
+        if category_id is not None:
+            category_ids = get_category_tree_cache().get(session).descendants(category_id)
+        posts, next_cursor = PostRepository(session).feed(after, limit, category_ids, tag)
+        # 페이지의 좋아요 수는 한 번의 쿼리로 함께 조회합니다.
+        like_counts = LikeService(session).counts(("post", post.id) for post in posts)
+        return {
+            "posts": [
+                {**self._to_dict(post), "like_count": like_counts[("post", post.id)]}
+                for post in posts
+            ],
+            "next_cursor": self.encode_cursor(next_cursor) if next_cursor else None,
+        }
+
+    @staticmethod
+    def encode_cursor(cursor: tuple[datetime, int]) -> str:
+        uploaded_at, post_id = cursor
+        return encode_cursor([uploaded_at.isoformat(), post_id])
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, int]:
+        uploaded_at, post_id = decode_cursor(cursor, 2)
+        try:
+            return datetime.fromisoformat(uploaded_at), int(post_id)
+        except (ValueError, TypeError) as e:
+            raise InvalidCursor(f"잘못된 커서입니다: {cursor}") from e
+
+    @staticmethod
+    def _to_dict(post) -> dict:
+        user, category = post.user, post.category
+        return {
+            "id": post.id,
+            "title": post.title,
+            "content": post.content,
+            "media_url": post.media_url,
+            "media_upload_time": post.media_upload_time,
+            "user": (
+                {
+                    "id": user.id,
+                    "username": user.details.username if user.details else None,
+                }
+                if user
+                else None
+            ),
+            "category": {"id": category.id, "name": category.name} if category else None,
+            "tags": [tag.name for tag in post.tags],
+        }
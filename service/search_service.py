@@ -0,0 +1,39 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from service.cursor import InvalidCursor, decode_cursor, encode_cursor
+
+# 응답에 포함하는 본문 길이
+BODY_PREVIEW_LENGTH = 200
+
+
+class SearchService:
+    async def search(
+        self,
+        session: AsyncSession,
+        query: str,
+        doc_type: str | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> dict:
+        from repository.search_repository import SearchRepository
+
+        after = self.decode_cursor(cursor) if cursor else None
+        results, next_cursor = await session.run_sync(
+            lambda sync_session: SearchRepository(sync_session).search(
+                query, doc_type, after, limit
+            )
+        )
+        for result in results:
+            if result["body"]:
+                result["body"] = result["body"][:BODY_PREVIEW_LENGTH]
+        return {
+            "results": results,
+            "next_cursor": encode_cursor(list(next_cursor)) if next_cursor else None,
+        }
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[float, str, str]:
+        score, doc_type, doc_id = decode_cursor(cursor, 3)
+        if not isinstance(score, (int, float)):
+            raise InvalidCursor(f"잘못된 커서입니다: {cursor}")
+        return float(score), str(doc_type), str(doc_id)
@@ -0,0 +1,91 @@
+import threading
+from collections import defaultdict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass
+class _Flight:
+    size: int
+    future: Future
+
+
+class SingleFlight:
+    """같은 키의 작업이 진행 중이면 새로 실행하지 않고 진행 중인 작업의 결과를 함께 기다립니다.
+
+    키는 `<종류>:<정규화된 요청>` 형식으로 작성하며, 지표는 종류별로 집계합니다.
+    size는 작업 결과의 크기(예: 크롤링 limit)로, 진행 중인 작업의 size가 요청한 size 이상이면
+    그 결과로 요청을 처리할 수 있다고 보고 합류합니다. 결과를 size에 맞게 자르는 것은 호출자의 몫입니다.
+    """
+
+    def __init__(self):
+        self._flights: dict[str, list[_Flight]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, int]] = defaultdict(
+            lambda: {"executed": 0, "coalesced": 0}
+        )
+
+    def submit(self, key: str, start: Callable[[], Future], size: int = 0) -> tuple[Future, bool]:
+        """진행 중인 작업에 합류하거나 start로 새 작업을 시작하고, (Future, 합류 여부)를 반환합니다."""
+        with self._lock:
+            flight = self._find(key, size)
+            if flight is not None:
+                self._stats[self._namespace(key)]["coalesced"] += 1
+                return flight.future, True
+            flight = _Flight(size, start())
+            self._flights[key].append(flight)
+            self._stats[self._namespace(key)]["executed"] += 1
+        flight.future.add_done_callback(lambda _: self._finish(key, flight))
+        return flight.future, False
+
+    def do(self, key: str, fn: Callable[[], Any], size: int = 0) -> Any:
+        """`submit`과 같지만, 새 작업은 호출한 스레드에서 직접 실행하고 결과를 반환합니다."""
+        future, coalesced = self.submit(key, Future, size)
+        if not coalesced:
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+        return future.result()
+
+    def stats(self) -> dict:
+        with self._lock:
+            in_flight = defaultdict(int)
+            for key, flights in self._flights.items():
+                in_flight[self._namespace(key)] += len(flights)
+            return {
+                namespace: {**counts, "in_flight": in_flight[namespace]}
+                for namespace, counts in self._stats.items()
+            }
+
+    def _find(self, key: str, size: int) -> _Flight | None:
+        for flight in self._flights.get(key, ()):
+            if flight.size >= size and not flight.future.done():
+                return flight
+        return None
+
+    def _finish(self, key: str, flight: _Flight):
+        with self._lock:
+            flights = self._flights.get(key)
+            if flights and flight in flights:
+                flights.remove(flight)
+                if not flights:
+                    del self._flights[key]
+
+    @staticmethod
+    def _namespace(key: str) -> str:
+        return key.split(":", 1)[0]
+
+
+_default_flight: SingleFlight | None = None
+_default_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """프로세스 전역에서 공유하는 single-flight 계층을 반환합니다."""
+    global _default_flight
+    with _default_flight_lock:
+        if _default_flight is None:
+            _default_flight = SingleFlight()
+        return _default_flight
@@ -0,0 +1,151 @@
+import atexit
+import os
+import threading
+from datetime import date, datetime, timedelta
+
+from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# .env 파일 로드
+load_dotenv()
+
+
+class ViewSnapshotService:
+    """영상 조회수 기록의 저장, 보존 기간에 따른 요약, 시계열 조회를 담당합니다.
+
+    - 원본 기록은 `SNAPSHOT_RAW_RETENTION_DAYS`일이 지나면 시간 단위로 요약합니다.
+    - 시간 단위 요약은 `SNAPSHOT_HOURLY_RETENTION_DAYS`일이 지나면 일 단위로 요약합니다.
+    """
+
+    RAW_RETENTION = timedelta(days=float(os.getenv("SNAPSHOT_RAW_RETENTION_DAYS", "7")))
+    HOURLY_RETENTION = timedelta(days=float(os.getenv("SNAPSHOT_HOURLY_RETENTION_DAYS", "90")))
+    # 요약 작업을 한 번에 하나의 프로세스만 실행하도록 잡는 advisory lock의 키
+    COMPACT_LOCK_ID = 0x5E1F_0016
+
+    @staticmethod
+    def record(session: Session, rows: list[tuple[str, int | None]]) -> int:
+        """(영상 ID, 조회수) 목록을 호출자의 트랜잭션에서 저장합니다.
+
+        월 파티션은 만들지 않습니다. 파티션 DDL이 영상 저장 트랜잭션에 섞이지 않도록
+        `SnapshotMaintenance`가 주기적으로 실행하는 `compact`에서 미리 만듭니다.
+        """
+        from repository.snapshot_repository import ViewSnapshotRepository
+
+        return ViewSnapshotRepository(session).add_many(rows)
+
+    @staticmethod
+    def prepare_partitions(today: date | None = None) -> list[str]:
+        """today가 속한 달과 다음 달의 파티션을 별도 트랜잭션에서 만들고 커밋합니다.
+
+        파티션이 없는 동안의 기록은 기본 파티션에 쌓였다가 파티션을 만들 때 옮겨집니다.
+        반환값은 새로 만든 파티션 이름이며, 만들지 못한 파티션은 오류로 기록됩니다.
+        """
+        from repository.handler import DatabaseManager
+        from repository.snapshot_repository import ViewSnapshotRepository
+
+        with DatabaseManager() as session:
+            return ViewSnapshotRepository(session).ensure_partitions(today or date.today())
+
+    def compact(self, now: datetime | None = None) -> dict:
+        """보존 기간이 지난 기록을 요약하고, 앞으로 사용할 월 파티션을 준비합니다.
+
+        요약은 여러 프로세스에서 동시에 실행하면 같은 구간을 두 번 더하므로, advisory lock을
+        얻지 못하면 요약을 건너뛰고 `skipped`를 True로 반환합니다.
+        """
+        from sqlalchemy import func, select
+
+        from repository.handler import DatabaseManager
+        from repository.snapshot_repository import ViewSnapshotRepository
+
+        now = now or datetime.now()
+        # 요약 작업이 실패해도 파티션은 남도록 먼저 커밋합니다.
+        created = self.prepare_partitions(now.date())
+        with DatabaseManager() as session:
+            locked = session.execute(
+                select(func.pg_try_advisory_xact_lock(self.COMPACT_LOCK_ID))
+            ).scalar()
+            if not locked:
+                return {"created_partitions": created, "skipped": True}
+            repository = ViewSnapshotRepository(session)
+            return {
+                "created_partitions": created,
+                "skipped": False,
+                "hourly_rolled_up": repository.rollup("hour", now - self.RAW_RETENTION),
+                "daily_rolled_up": repository.rollup("day", now - self.HOURLY_RETENTION),
+            }
+
+    async def series(
+        self, session: AsyncSession, video_ids: list[str], since: datetime | None = None
+    ) -> dict:
+        """여러 영상의 조회수 시계열을 영상 ID별로 반환합니다. 요청의 비동기 세션에서 조회합니다."""
+        from repository.snapshot_repository import ViewSnapshotRepository
+
+        # 저장소 코드는 동기 세션을 사용하므로 같은 연결 위에서 run_sync로 실행합니다.
+        series = await session.run_sync(
+            lambda sync_session: ViewSnapshotRepository(sync_session).series(video_ids, since)
+        )
+        return {
+            "series": {
+                video_id: [{"at": at, "views": views} for at, views in points]
+                for video_id, points in series.items()
+            }
+        }
+
+
+class SnapshotMaintenance:
+    """백그라운드 스레드에서 interval초(`SNAPSHOT_MAINTENANCE_INTERVAL`)마다 `compact`를 실행합니다.
+
+    시작하자마자 한 번 실행하므로, 서버가 여러 달 동안 실행되어도 다음 달 파티션이 미리 만들어지고
+    보존 기간이 지난 기록이 요약됩니다. 실패하면 기록하고 다음 주기에 다시 시도합니다.
+    """
+
+    def __init__(self, interval: float | None = None, service: ViewSnapshotService | None = None):
+        self.interval = interval or float(os.getenv("SNAPSHOT_MAINTENANCE_INTERVAL", "3600"))
+        self.service = service or ViewSnapshotService()
+        self._closed = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {"runs": 0, "failed_runs": 0, "last_result": None}
+        self._thread = threading.Thread(target=self._run, name="snapshot-maintenance", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """백그라운드 스레드를 종료합니다. 실행 중인 작업은 끝날 때까지 기다립니다."""
+        self._closed.set()
+        self._thread.join()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def _run(self):
+        while not self._closed.is_set():
+            try:
+                result = self.service.compact()
+                with self._lock:
+                    self._stats["runs"] += 1
+                    self._stats["last_result"] = result
+            except Exception as e:
+                print(f"조회수 기록 정리 실패: {e}")
+                with self._lock:
+                    self._stats["failed_runs"] += 1
+            self._closed.wait(self.interval)
+
+
+_default_maintenance: SnapshotMaintenance | None = None
+_default_maintenance_lock = threading.Lock()
+
+
+def get_snapshot_maintenance() -> SnapshotMaintenance:
+    """프로세스 전역에서 공유하는 조회수 기록 정리 작업을 반환합니다. 처음 호출할 때 시작합니다."""
+    global _default_maintenance
+    with _default_maintenance_lock:
+        if _default_maintenance is None:
+            _default_maintenance = SnapshotMaintenance()
+            atexit.register(_default_maintenance.close)
+        return _default_maintenance
+
+
+if __name__ == "__main__":
+    # 서버 밖에서 한 번 실행하는 보존 및 요약 작업 (`inssider snapshots compact`와 같습니다)
+    print(ViewSnapshotService().compact())
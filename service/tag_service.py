@@ -0,0 +1,89 @@
+import os
+import threading
+from typing import Iterable
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from service.cache import MemoryTier
+
+# .env 파일 로드
+load_dotenv()
+
+# 태그 이름 -> 태그 ID. 태그는 soft-delete만 하므로 한 번 만든 ID는 바뀌지 않습니다.
+_memory: MemoryTier | None = None
+_memory_lock = threading.Lock()
+
+
+def _get_memory() -> MemoryTier:
+    global _memory
+    with _memory_lock:
+        if _memory is None:
+            _memory = MemoryTier(int(os.getenv("TAG_CACHE_SIZE", "4096")))
+        return _memory
+
+
+class TagService:
+    """호출자의 세션에서 태그 이름을 ID로 변환하고 게시글에 태그를 연결합니다.
+
+    자주 쓰는 태그의 ID는 크기가 제한된 LRU 캐시(`TAG_CACHE_SIZE`)에 두고 DB를 거치지 않습니다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def resolve(self, names: Iterable[str]) -> dict[str, int]:
+        """태그 이름을 ID로 변환하고 없는 태그는 만듭니다. 키는 정규화한 이름입니다."""
+        from repository.tag_repository import TagRepository, normalize_tag
+
+        memory = _get_memory()
+        # 이 트랜잭션에서 만든 태그는 커밋 전이므로 캐시 대신 세션에서 찾습니다.
+        pending = self.session.info.get("created_tags", {})
+        ids, missing = {}, set()
+        for name in names:
+            if not (normalized := normalize_tag(name)) or normalized in ids:
+                continue
+            if (tag_id := pending.get(normalized, memory.get(normalized))) is not None:
+                ids[normalized] = tag_id
+            else:
+                missing.add(normalized)
+        if not missing:
+            return ids
+
+        found, created = TagRepository(self.session).get_or_create(missing)
+        for name, tag_id in found.items():
+            if name in created:
+                # 롤백되면 사라지는 ID이므로 커밋된 뒤에 캐시에 넣습니다.
+                self.session.info.setdefault("created_tags", {})[name] = tag_id
+            else:
+                memory.put(name, tag_id)
+        return ids | found
+
+    def tag_posts(self, post_tags: dict[int, Iterable[str]]) -> int:
+        """게시글 ID -> 태그 이름 목록을 받아 태그를 한 번에 변환하고, 새로 연결한 수를 반환합니다."""
+        from repository.tag_repository import TagRepository, normalize_tag
+
+        post_tags = {post_id: list(names) for post_id, names in post_tags.items()}
+        ids = self.resolve(name for names in post_tags.values() for name in names)
+        return TagRepository(self.session).attach(
+            (post_id, ids[normalized])
+            for post_id, names in post_tags.items()
+            for name in names
+            if (normalized := normalize_tag(name))
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_on_commit(session: Session):
+    created = session.info.pop("created_tags", {})
+    if created:
+        memory = _get_memory()
+        for name, tag_id in created.items():
+            memory.put(name, tag_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_on_rollback(session: Session, previous_transaction):
+    if not previous_transaction.nested:
+        session.info.pop("created_tags", None)
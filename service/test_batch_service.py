@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from model.controller import HashTagBatchCrawlResponse, HashTagCrawlRequest
+from service import batch_service
+from service.batch_service import HashTagBatchService
+from service.hashtag_service import HashTagService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    def fake_crawl_hashtag(self, req, on_progress=None):
+        if req.hashtag == "실패":
+            raise RuntimeError("crawl failed")
+        return {"length": 0, "contents": [], "stop_reason": "end_of_feed"}
+
+    monkeypatch.setattr(HashTagService, "crawl_hashtag", fake_crawl_hashtag)
+    monkeypatch.setattr(batch_service, "_worker_concurrency", 2)
+
+    # 워커 프로세스 대신 현재 프로세스의 스레드에서 샤드를 실행합니다.
+    service = HashTagBatchService(processes=2, per_worker=2, per_host=1)
+    monkeypatch.setattr(service, "_get_executor", lambda: ThreadPoolExecutor(2))
+    return service
+
+
+def test_partition_round_robin():
+    service = HashTagBatchService(processes=2)
+    shards = service._partition([{"hashtag": str(i)} for i in range(5)])
+    assert [[idx for idx, _ in shard] for shard in shards] == [[0, 2, 4], [1, 3]]
+
+    assert len(service._partition([{"hashtag": "밈"}])) == 1
+
+
+def test_partial_failure_keeps_other_results(service: HashTagBatchService):
+    hashtags = ["밈", "실패", "챌린지", "먹방"]
+    data = service.crawl([HashTagCrawlRequest(hashtag=hashtag, limit=5) for hashtag in hashtags])
+
+    assert data["succeeded"] == 3
+    assert data["failed"] == 1
+    assert [item["hashtag"] for item in data["results"]] == hashtags
+    assert data["results"][1]["error"] == "RuntimeError: crawl failed"
+
+    res = HashTagBatchCrawlResponse.from_dict(data)
+    assert res.results[0].result.stop_reason == "end_of_feed"
+    assert res.results[1].result is None
+
+
+def test_per_host_limit_across_workers(service: HashTagBatchService, monkeypatch):
+    import threading
+    import time
+
+    running, peak = 0, 0
+    lock = threading.Lock()
+
+    def slow_crawl_hashtag(self, req, on_progress=None):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return {"length": 0, "contents": [], "stop_reason": "end_of_feed"}
+
+    monkeypatch.setattr(HashTagService, "crawl_hashtag", slow_crawl_hashtag)
+    # 워커 두 개가 각각 두 개씩 동시에 실행할 수 있어도 호스트 제한(per_host=1)을 넘지 않습니다.
+    semaphore = threading.BoundedSemaphore(service.per_host)
+    monkeypatch.setattr(batch_service, "_host_semaphores", {batch_service.HASHTAG_HOST: semaphore})
+
+    data = service.crawl([HashTagCrawlRequest(hashtag=str(i), limit=5) for i in range(6)])
+    assert data["succeeded"] == 6
+    assert peak == service.per_host
+
+
+def test_broken_pool_is_shut_down(monkeypatch):
+    from concurrent.futures import Future
+    from concurrent.futures.process import BrokenProcessPool
+
+    class BrokenExecutor:
+        shut_down = False
+
+        def submit(self, fn, *args):
+            future = Future()
+            future.set_exception(BrokenProcessPool("worker died"))
+            return future
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shut_down = True
+
+    broken = BrokenExecutor()
+    service = HashTagBatchService(processes=1)
+    service._executor = broken
+
+    data = service.crawl([HashTagCrawlRequest(hashtag="밈", limit=5)])
+    assert data["failed"] == 1
+    assert broken.shut_down
+    assert service._executor is None
@@ -0,0 +1,117 @@
+import threading
+import time
+
+import pytest
+
+from service.cache import CrawlCache
+
+
+def _data(n: int, stop_reason: str = "limit") -> dict:
+    contents = [{"video_id": f"video{i}"} for i in range(n)]
+    return {"length": n, "contents": contents, "stop_reason": stop_reason}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CrawlCache(ttl=60, stale_ttl=60, maxsize=2, path=tmp_path / "cache.sqlite3")
+    yield cache
+    cache.shutdown()
+
+
+def test_larger_limit_answers_smaller_request(cache: CrawlCache):
+    assert cache.get("밈", 5) is None
+    cache.put("밈", 10, _data(10))
+
+    data = cache.get("밈", 5)
+    assert data["length"] == 5
+    assert [c["video_id"] for c in data["contents"]] == [f"video{i}" for i in range(5)]
+    assert cache.get("밈", 20) is None
+
+    # 피드 끝까지 수집한 결과는 더 큰 limit의 요청에도 응답할 수 있습니다.
+    cache.put("챌린지", 10, _data(3, "end_of_feed"))
+    assert cache.get("챌린지", 20)["length"] == 3
+
+    stats = cache.stats()
+    assert stats["memory_hits"] == 2
+    assert stats["misses"] == 2
+
+
+def test_incomplete_results_are_not_cached(cache: CrawlCache):
+    cache.put("밈", 10, _data(2, "timeout"))
+    cache.put("밈", 10, _data(2, "error"))
+    assert cache.get("밈", 1) is None
+
+
+def test_shared_tier_between_processes(cache: CrawlCache, tmp_path):
+    cache.put("밈", 10, _data(10))
+
+    # 같은 파일을 사용하는 다른 워커 프로세스의 캐시
+    other = CrawlCache(ttl=60, stale_ttl=60, path=tmp_path / "cache.sqlite3")
+    assert other.get("밈", 10)["length"] == 10
+    assert other.get("밈", 10)["length"] == 10
+    assert other.stats()["shared_hits"] == 1
+    assert other.stats()["memory_hits"] == 1
+    other.shutdown()
+
+
+def test_stale_entry_refreshes_once(tmp_path):
+    cache = CrawlCache(ttl=0.01, stale_ttl=60, path=tmp_path / "cache.sqlite3")
+    cache.put("밈", 10, _data(10))
+    time.sleep(0.02)
+
+    release, calls = threading.Event(), []
+
+    def refresh(limit: int):
+        calls.append(limit)
+        release.wait(timeout=1)
+        cache.put("밈", limit, _data(limit))
+
+    # 갱신이 끝나기 전의 요청들은 오래된 결과를 받고, 갱신은 한 번만 실행됩니다.
+    assert cache.get("밈", 3, refresh)["length"] == 3
+    assert cache.get("밈", 3, refresh)["length"] == 3
+    release.set()
+    cache.shutdown()
+    cache._refresher.shutdown(wait=True)
+
+    assert calls == [10]
+    assert cache.stats()["stale_hits"] == 2
+    assert cache.stats()["refreshes"] == 1
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = CrawlCache(ttl=0.01, stale_ttl=0.01, path=tmp_path / "cache.sqlite3")
+    cache.put("밈", 10, _data(10))
+    time.sleep(0.03)
+    assert cache.get("밈", 3) is None
+    cache.shutdown()
+
+
+def test_stale_memory_entry_falls_through_to_shared_tier(cache: CrawlCache, tmp_path):
+    other = CrawlCache(ttl=60, stale_ttl=60, path=tmp_path / "cache.sqlite3")
+    cache.put("밈", 5, _data(5))
+    # 다른 워커가 더 큰 결과를 저장하면 메모리의 작은 결과에 가려지지 않습니다.
+    other.put("밈", 10, _data(10))
+    assert cache.get("밈", 10)["length"] == 10
+    assert cache.stats()["shared_hits"] == 1
+    assert cache.get("밈", 10)["length"] == 10
+    assert cache.stats()["memory_hits"] == 1
+    other.shutdown()
+
+
+def test_hashtag_variants_share_keys():
+    from model.controller import HashTagCrawlRequest
+    from service.hashtag_service import HashTagService
+
+    requests = [HashTagCrawlRequest(hashtag=hashtag) for hashtag in ("#Meme", " meme", "MEME")]
+    assert {req.hashtag for req in requests} == {"meme"}
+    assert len({HashTagService.flight_key(req) for req in requests}) == 1
+
+
+def test_empty_hashtag_is_rejected():
+    from pydantic import ValidationError
+
+    from model.controller import HashTagCrawlRequest
+
+    for hashtag in ("", "#", "  ", " # "):
+        with pytest.raises(ValidationError):
+            HashTagCrawlRequest(hashtag=hashtag)
@@ -0,0 +1,43 @@
+import pytest
+
+from model.repository import Category
+from repository.handler import DatabaseManager
+from service.category_service import CategoryTreeCache
+
+
+@pytest.fixture(autouse=True)
+def reset_db():
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+
+
+def test_category_tree_cache(monkeypatch):
+    from service import category_service
+
+    cache = CategoryTreeCache(ttl=3600)
+    monkeypatch.setattr(category_service, "_default_tree_cache", cache)
+
+    with DatabaseManager() as session:
+        root = Category(name="루트")
+        child = Category(name="하위", upper_category=root)
+        session.add_all([root, child])
+        session.flush()
+        root_id, child_id = root.id, child.id
+
+    tree = cache.get()
+    assert tree.descendants(root_id) == [root_id, child_id]
+    assert tree.path_to_root(child_id) == [child_id, root_id]
+    assert cache.get() is tree
+
+    # 커밋하지 않은 변경은 캐시를 무효화하지 않습니다.
+    with pytest.raises(RuntimeError):
+        with DatabaseManager() as session:
+            session.add(Category(name="취소", upper_category_id=root_id))
+            session.flush()
+            raise RuntimeError
+    assert cache.get() is tree
+
+    with DatabaseManager() as session:
+        session.add(Category(name="추가", upper_category_id=child_id))
+    tree = cache.get()
+    assert [tree.names[i] for i in tree.descendants(root_id)] == ["루트", "하위", "추가"]
@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+
+from service.job_service import Job, JobManager, JobStatus
+from service.youtube.strategy import ScrapeStrategy
+
+
+@pytest.fixture
+def manager():
+    manager = JobManager(max_workers=1)
+    yield manager
+    manager.shutdown()
+
+
+def test_job_succeeds(manager: JobManager):
+    def work(job: Job):
+        job.report(3)
+        return {"length": 3}
+
+    job = manager.submit("test", work, total=3)
+    assert job.future.result(timeout=1) == {"length": 3}
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.progress == 3
+    assert manager.get(job.id) is job
+
+
+def test_job_fails(manager: JobManager):
+    def work(job: Job):
+        raise ValueError("boom")
+
+    job = manager.submit("test", work)
+    with pytest.raises(ValueError):
+        job.future.result(timeout=1)
+    assert job.status == JobStatus.FAILED
+    assert job.error == "ValueError: boom"
+
+
+def test_cancel_running_job(manager: JobManager):
+    started = threading.Event()
+
+    def work(job: Job):
+        started.set()
+        for progress in range(1000):
+            job.report(progress)
+            time.sleep(0.01)
+
+    job = manager.submit("test", work)
+    started.wait(timeout=1)
+    manager.cancel(job.id)
+    job.future.result(timeout=1)
+    assert job.status == JobStatus.CANCELLED
+    assert job.progress < 1000
+
+
+def test_cancel_pending_job(manager: JobManager):
+    release = threading.Event()
+    blocking = manager.submit("test", lambda job: release.wait(timeout=1))
+    pending = manager.submit("test", lambda job: "unreachable")
+
+    manager.cancel(pending.id)
+    release.set()
+    blocking.future.result(timeout=1)
+    assert pending.status == JobStatus.CANCELLED
+    assert pending.result is None
+
+
+def test_cancel_scrape_returns_partial_result(manager: JobManager):
+    class EndlessStrategy(ScrapeStrategy):
+        @classmethod
+        def _run(cls, driver, idx):
+            time.sleep(0.01)
+            return [{"idx": idx}]
+
+        @classmethod
+        def _filter(cls, content):
+            return True
+
+        @classmethod
+        def _scrape_content(cls, content):
+            return content
+
+    job = manager.submit("test", lambda job: EndlessStrategy.run(None, 1000, job.report))
+    while job.progress < 3:
+        time.sleep(0.01)
+    manager.cancel(job.id)
+
+    data = job.future.result(timeout=1)
+    assert job.status == JobStatus.CANCELLED
+    assert data["stop_reason"] == "cancelled"
+    assert 3 <= data["length"] < 1000
@@ -0,0 +1,153 @@
+import time
+
+import pytest
+
+from service.like_service import LikeCounter
+
+
+def test_like_counter_batches_deltas():
+    written = []
+    counter = LikeCounter(
+        flush_interval=3600, writer=lambda deltas, epoch: written.append(deltas) or 1
+    )
+    for _ in range(100):
+        counter.add(("post", 1), 1)
+    counter.add(("post", 2), 1)
+    counter.add(("post", 2), -1)
+    assert counter.pending([("post", 1), ("post", 3)]) == {("post", 1): 100}
+
+    counter.flush()
+    assert written == [{("post", 1): 100}]
+    assert counter.pending([("post", 1)]) == {}
+    counter.close()
+    assert counter.stats() == {
+        "flushes": 1,
+        "targets_written": 1,
+        "failed_flushes": 0,
+        "pending_targets": 0,
+    }
+
+
+def test_like_counter_keeps_deltas_on_failure():
+    def fail(deltas, epoch):
+        raise RuntimeError("db down")
+
+    counter = LikeCounter(flush_interval=3600, writer=fail)
+    counter.add(("post", 1), 1)
+    with pytest.raises(RuntimeError):
+        counter.flush()
+    counter.add(("post", 1), 1)
+    assert counter.pending([("post", 1)]) == {("post", 1): 2}
+    assert counter.stats()["failed_flushes"] == 1
+
+    written = []
+    counter.writer = lambda deltas, epoch: written.append(deltas) or len(deltas)
+    counter.close()
+    assert written == [{("post", 1): 2}]
+
+
+def test_like_counter_flushes_periodically():
+    written = []
+    counter = LikeCounter(
+        flush_interval=0.01, writer=lambda deltas, epoch: written.append(deltas) or 1
+    )
+    counter.add(("post", 1), 1)
+    deadline = time.monotonic() + 5
+    while not written and time.monotonic() < deadline:
+        time.sleep(0.001)
+    counter.close()
+    assert written == [{("post", 1): 1}]
+
+
+def test_like_counter_groups_by_epoch():
+    written = []
+    counter = LikeCounter(
+        flush_interval=3600, writer=lambda deltas, epoch: written.append((epoch, deltas)) or 1
+    )
+    counter.add(("post", 1), 1, epoch=1)
+    counter.add(("post", 1), 1, epoch=0)
+    assert counter.pending([("post", 1)]) == {("post", 1): 2}
+    counter.close()
+    assert written == [(0, {("post", 1): 1}), (1, {("post", 1): 1})]
+
+
+def test_like_counter_without_interval_writes_through():
+    written = []
+    counter = LikeCounter(
+        flush_interval=0, writer=lambda deltas, epoch: written.append(deltas) or 1
+    )
+    assert counter.flush_interval == 0
+    counter.add(("post", 1), 1)
+    assert written == [{("post", 1): 1}]
+    counter.close()
+
+
+def test_like_service_adds_after_commit(monkeypatch):
+    from model.repository import User
+    from repository.handler import DatabaseManager
+    from service import like_service
+    from service.like_service import LikeService
+
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+    counter = LikeCounter(flush_interval=3600, writer=lambda deltas, epoch: len(deltas))
+    monkeypatch.setattr(like_service, "_default_counter", counter)
+
+    with DatabaseManager() as session:
+        user = User(email="user@test.com", password="pw", password_salt="salt")
+        session.add(user)
+        session.flush()
+        user_id = user.id
+
+    with pytest.raises(RuntimeError):
+        with DatabaseManager() as session:
+            LikeService(session).like(user_id, ("post", 1))
+            raise RuntimeError
+    assert counter.pending([("post", 1)]) == {}
+
+    with DatabaseManager() as session:
+        service = LikeService(session)
+        assert service.like(user_id, ("post", 1))
+        assert not service.like(user_id, ("post", 1))
+        assert counter.pending([("post", 1)]) == {}
+    assert counter.pending([("post", 1)]) == {("post", 1): 1}
+
+    with DatabaseManager() as session:
+        assert LikeService(session).counts([("post", 1), ("post", 2)]) == {
+            ("post", 1): 1,
+            ("post", 2): 0,
+        }
+    counter.close()
+
+
+def test_reconcile_drops_counted_pending_deltas(monkeypatch):
+    from model.repository import User
+    from repository.handler import DatabaseManager
+    from repository.like_repository import LikeRepository
+    from service import like_service
+    from service.like_service import LikeService
+
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+    counter = LikeCounter(flush_interval=3600)
+    monkeypatch.setattr(like_service, "_default_counter", counter)
+
+    with DatabaseManager() as session:
+        users = [
+            User(email=f"user{i}@test.com", password="pw", password_salt="salt") for i in (0, 1)
+        ]
+        session.add_all(users)
+        session.flush()
+        first, second = [user.id for user in users]
+
+    with DatabaseManager() as session:
+        LikeService(session).like(first, ("post", 1))
+    # 다른 워커가 반영하기 전에 집계를 다시 계산하면, 그 변경분은 이미 집계에 포함되어 있습니다.
+    with DatabaseManager() as session:
+        assert LikeRepository(session).reconcile() == 1
+    with DatabaseManager() as session:
+        LikeService(session).like(second, ("post", 1))
+    counter.close()
+
+    with DatabaseManager() as session:
+        assert LikeRepository(session).counts([("post", 1)]) == {("post", 1): 2}
@@ -0,0 +1,68 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from service.singleflight import SingleFlight
+
+
+def test_identical_requests_share_one_call():
+    flight, release, calls = SingleFlight(), threading.Event(), []
+
+    def fetch():
+        calls.append(1)
+        release.wait(timeout=1)
+        return "result"
+
+    with ThreadPoolExecutor(5) as executor:
+        futures = [executor.submit(flight.do, "video:abc", fetch) for _ in range(5)]
+        while flight.stats().get("video", {}).get("coalesced", 0) < 4:
+            time.sleep(0.001)
+        release.set()
+        assert [future.result(timeout=1) for future in futures] == ["result"] * 5
+
+    assert calls == [1]
+    assert flight.stats() == {"video": {"executed": 1, "coalesced": 4, "in_flight": 0}}
+
+
+def test_larger_flight_satisfies_smaller_request():
+    flight, started = SingleFlight(), []
+
+    def start():
+        future = Future()
+        started.append(future)
+        return future
+
+    large, coalesced = flight.submit("hashtag:밈", start, size=20)
+    assert not coalesced
+    assert flight.submit("hashtag:밈", start, size=10) == (large, True)
+
+    # 진행 중인 작업보다 큰 요청은 새로 실행합니다.
+    larger, coalesced = flight.submit("hashtag:밈", start, size=30)
+    assert larger is not large and not coalesced
+    assert len(started) == 2
+
+    large.set_result("done")
+    larger.set_result("done")
+    assert flight.stats()["hashtag"] == {"executed": 2, "coalesced": 1, "in_flight": 0}
+
+    # 완료된 작업에는 합류하지 않습니다.
+    assert flight.submit("hashtag:밈", start, size=10)[1] is False
+
+
+def test_error_is_shared_with_waiters():
+    flight, release = SingleFlight(), threading.Event()
+
+    def fail():
+        release.wait(timeout=1)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(2) as executor:
+        futures = [executor.submit(flight.do, "video:abc", fail) for _ in range(2)]
+        while flight.stats().get("video", {}).get("coalesced", 0) < 1:
+            time.sleep(0.001)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(timeout=1)
@@ -0,0 +1,137 @@
+import os
+import random
+import time
+from datetime import datetime
+from itertools import batched
+
+import pytest
+from sqlalchemy import func, select
+
+from model.repository import Post
+from model.repository.post import PostTag, Tag
+from repository.handler import DatabaseManager
+from service import tag_service
+from service.cache import MemoryTier
+from service.tag_service import TagService
+
+
+@pytest.fixture(autouse=True)
+def memory(monkeypatch):
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+    memory = MemoryTier(16)
+    monkeypatch.setattr(tag_service, "_memory", memory)
+    return memory
+
+
+def _add_posts(count: int) -> list[int]:
+    from repository import bulk
+
+    rows = (
+        {
+            "title": f"글{i}",
+            "content": "내용",
+            "media_url": "https://picsum.photos/200",
+            "media_upload_time": datetime(2025, 1, 1),
+        }
+        for i in range(count)
+    )
+    bulk.copy_in(
+        DatabaseManager().engine,
+        bulk.get_table("posts"),
+        ["title", "content", "media_url", "media_upload_time"],
+        rows,
+    )
+    with DatabaseManager() as session:
+        return list(session.scalars(select(Post.id).order_by(Post.id)))
+
+
+def test_resolve_caches_committed_tags(memory):
+    with pytest.raises(RuntimeError):
+        with DatabaseManager() as session:
+            ids = TagService(session).resolve(["밈"])
+            # 같은 트랜잭션에서는 커밋 전에 만든 태그도 다시 조회하지 않습니다.
+            assert TagService(session).resolve(["#밈"]) == ids
+            raise RuntimeError
+    assert memory.get("밈") is None
+
+    with DatabaseManager() as session:
+        ids = TagService(session).resolve(["밈", "챌린지", " "])
+        assert memory.get("밈") is None
+    assert ids.keys() == {"밈", "챌린지"}
+    assert memory.get("밈") == ids["밈"]
+
+    with DatabaseManager() as session:
+        session.execute(Tag.__table__.update().values(name=Tag.name + "!"))
+        # 캐시에 있는 태그는 DB를 거치지 않습니다.
+        assert TagService(session).resolve(["밈", "챌린지"]) == ids
+
+
+def test_tag_posts(memory):
+    posts = _add_posts(3)
+    with DatabaseManager() as session:
+        service = TagService(session)
+        assert service.tag_posts({posts[0]: ["밈", "#챌린지"], posts[1]: ["밈", "밈"]}) == 3
+        assert service.tag_posts({posts[0]: ["밈"], posts[2]: []}) == 0
+
+    with DatabaseManager() as session:
+        assert session.scalar(select(func.count()).select_from(Tag)) == 2
+        post = session.get(Post, posts[0])
+        assert sorted(tag.name for tag in post.tags) == ["밈", "챌린지"]
+
+
+def _tag_posts_with_orm(session, post_ids: list[int], names: dict[int, list[str]]):
+    """비교 기준: 게시글마다 태그를 하나씩 조회하고, 없으면 ORM으로 만들어 연결합니다."""
+    posts = session.scalars(select(Post).where(Post.id.in_(post_ids)))
+    for post in posts:
+        for name in names[post.id]:
+            tag = session.scalar(select(Tag).where(Tag.name == name))
+            if tag is None:
+                tag = Tag(name=name)
+                session.add(tag)
+            if tag not in post.tags:
+                post.tags.append(tag)
+
+
+@pytest.mark.slow
+def test_benchmark_ingest(monkeypatch):
+    """게시글 `TAG_BENCHMARK_POSTS`개(기본 100,000개)에 태그를 연결하는 처리량을 비교합니다.
+
+    인기 태그에 사용이 몰리도록 태그 1만 개 중에서 게시글마다 5개를 고르고, 크롤링 파이프라인과
+    같이 500개씩 커밋합니다. ORM 방식은 오래 걸리므로 `TAG_BENCHMARK_ORM_POSTS`개(기본 같은 수)만
+    처리하고 초당 게시글 수로 비교합니다.
+    """
+    monkeypatch.setattr(tag_service, "_memory", MemoryTier(4096))
+    count = int(os.getenv("TAG_BENCHMARK_POSTS", "100000"))
+    orm_count = int(os.getenv("TAG_BENCHMARK_ORM_POSTS", str(count)))
+    rng = random.Random(0)
+    vocabulary = [f"태그{i}" for i in range(10_000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    post_ids = _add_posts(count + orm_count)
+    names = {
+        post_id: list(dict.fromkeys(rng.choices(vocabulary, weights, k=5))) for post_id in post_ids
+    }
+
+    def run(post_ids, tag_batch):
+        started = time.monotonic()
+        for batch in batched(post_ids, 500):
+            with DatabaseManager() as session:
+                tag_batch(session, list(batch))
+        return len(post_ids) / (time.monotonic() - started)
+
+    bulk = run(
+        post_ids[:count],
+        lambda session, batch: TagService(session).tag_posts({i: names[i] for i in batch}),
+    )
+    # ORM 방식이 새로 만드는 태그 수가 같도록 태그를 비우고 시작합니다.
+    with DatabaseManager() as session:
+        session.execute(PostTag.__table__.delete())
+        session.execute(Tag.__table__.delete())
+    orm = run(post_ids[count:], lambda session, batch: _tag_posts_with_orm(session, batch, names))
+    print(f"\n일괄 처리: {bulk:,.0f}개/초, ORM: {orm:,.0f}개/초 ({bulk / orm:,.1f}배)")
+
+    with DatabaseManager() as session:
+        assert session.scalar(select(func.count()).select_from(PostTag)) == sum(
+            len(names[post_id]) for post_id in post_ids[count:]
+        )
+    assert bulk > orm
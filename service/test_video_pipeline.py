@@ -0,0 +1,123 @@
+import threading
+
+from service.video_pipeline import VideoUpsertPipeline, to_video_row
+
+
+def _contents(n: int) -> list[dict]:
+    return [
+        {
+            "video_id": f"video{i}",
+            "thumbnail_url": f"https://i.ytimg.com/vi/video{i}/hq720.jpg",
+            "title": "밈",
+            "view_count": 1_000_000 + i,
+        }
+        for i in range(n)
+    ]
+
+
+def test_to_video_row():
+    content = {**_contents(1)[0], "thumbnail_url": "https://i.ytimg.com/" + "x" * 300}
+    assert to_video_row(content) == {
+        "id": "video0",
+        "title": "밈",
+        "thumbnail_url": "https://i.ytimg.com/vi/video0/hq2.jpg",
+        "views": 1_000_000,
+    }
+
+
+def test_flush_in_batches():
+    batches = []
+    pipeline = VideoUpsertPipeline(batch_size=3, flush_interval=0.05, writer=batches.append)
+
+    assert pipeline.submit(_contents(7)) == 7
+    pipeline.flush()
+    pipeline.close()
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert [row["id"] for batch in batches for row in batch] == [f"video{i}" for i in range(7)]
+    stats = pipeline.stats()
+    assert stats["rows_written"] == 7
+    assert stats["batches"] == 3
+    assert stats["queued"] == 0
+
+
+def test_back_pressure_drops_rows_when_queue_is_full():
+    release = threading.Event()
+    pipeline = VideoUpsertPipeline(
+        batch_size=1,
+        flush_interval=0.01,
+        max_queue=2,
+        put_timeout=0.01,
+        writer=lambda batch: release.wait(timeout=1),
+    )
+
+    # 첫 행은 저장 중이고, 큐에는 두 행만 들어갈 수 있습니다.
+    accepted = pipeline.submit(_contents(10))
+    release.set()
+    pipeline.close()
+
+    assert 2 <= accepted < 10
+    assert pipeline.stats()["dropped"] == 10 - accepted
+
+
+def test_failed_batch_is_counted():
+    from sqlalchemy.exc import OperationalError
+
+    calls = []
+
+    def fail(batch):
+        calls.append(len(batch))
+        raise OperationalError("INSERT", {}, Exception("db down"))
+
+    pipeline = VideoUpsertPipeline(batch_size=8, flush_interval=0.05, writer=fail)
+    pipeline.submit(_contents(8))
+    pipeline.flush()
+    pipeline.close()
+
+    # 연결 오류는 행과 무관하므로 배치를 나누어 다시 시도하지 않습니다.
+    assert calls == [8]
+    stats = pipeline.stats()
+    assert stats["failed_rows"] == 8
+    assert stats["rows_written"] == 0
+    assert stats["split_batches"] == 0
+
+
+def test_failed_batch_is_split_to_isolate_bad_rows():
+    from sqlalchemy.exc import DataError
+
+    written = []
+
+    def write(batch):
+        if any(row["id"] == "video3" for row in batch):
+            raise DataError("INSERT", {}, Exception("bad row"))
+        written.extend(batch)
+
+    pipeline = VideoUpsertPipeline(batch_size=8, flush_interval=0.05, writer=write)
+    pipeline.submit(_contents(8))
+    pipeline.flush()
+    pipeline.close()
+
+    assert sorted(row["id"] for row in written) == [f"video{i}" for i in range(8) if i != 3]
+    stats = pipeline.stats()
+    assert stats["failed_rows"] == 1
+    assert stats["rows_written"] == 7
+    assert stats["split_batches"] == 3
+
+
+def test_search_index_failure_keeps_video_rows(monkeypatch):
+    from sqlalchemy import text
+
+    from repository.handler import DatabaseManager
+    from repository.search_repository import SearchRepository
+    from service.video_pipeline import _write_rows
+
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+
+    def fail(self, doc_type, docs):
+        raise RuntimeError("index down")
+
+    monkeypatch.setattr(SearchRepository, "index", fail)
+    assert _write_rows([to_video_row(content) for content in _contents(2)]) == 2
+    with DatabaseManager() as session:
+        assert session.execute(text("SELECT count(*) FROM videos")).scalar() == 2
@@ -0,0 +1,178 @@
+from datetime import timedelta
+
+import pytest
+from pytubefix.exceptions import BotDetection, VideoPrivate
+from sqlalchemy import text
+
+from repository.handler import DatabaseManager
+from service import video_service
+from service.video_service import VideoNotFound, VideoService
+
+
+@pytest.fixture(autouse=True)
+def reset(monkeypatch):
+    DatabaseManager().drop_tables()
+    DatabaseManager().create_tables()
+    monkeypatch.setattr(video_service, "_memory", None)
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """`_fetch`를 대신하여 호출된 영상 ID를 기록합니다."""
+    calls = []
+
+    def fake_fetch(self):
+        calls.append(self.video_id)
+        return {
+            "video_id": self.video_id,
+            "title": f"제목 {len(calls)}",
+            "description": None,
+            "length": 60,
+            "views": 15_000_000_000,
+            "rating": None,
+            "publish_date": None,
+            "thumbnail_url": f"https://i.ytimg.com/vi/{self.video_id}/hq2.jpg",
+        }
+
+    monkeypatch.setattr(VideoService, "_fetch", fake_fetch)
+    return calls
+
+
+def test_read_through(fetches):
+    assert VideoService("abc").create_video()["title"] == "제목 1"
+    assert VideoService("abc").create_video()["title"] == "제목 1"
+    assert fetches == ["abc"]
+
+    # 메모리 캐시가 비어 있으면 데이터베이스에서 읽습니다.
+    video_service._memory.clear()
+    data = VideoService("abc").create_video()
+    assert data["title"] == "제목 1"
+    assert data["views"] == 15_000_000_000
+    assert fetches == ["abc"]
+
+
+def test_refetch_stale_metadata(fetches):
+    VideoService("abc").create_video()
+    with DatabaseManager() as session:
+        session.execute(text("UPDATE videos SET fetched_at = now() - interval '2 days'"))
+    video_service._memory.clear()
+
+    assert VideoService("abc").create_video()["title"] == "제목 2"
+    with DatabaseManager() as session:
+        assert session.execute(text("SELECT count(*) FROM videos")).scalar() == 1
+
+
+def test_memory_cache_expires_with_stored_metadata(fetches):
+    import time
+
+    VideoService("abc").create_video()
+    with DatabaseManager() as session:
+        session.execute(
+            text("UPDATE videos SET fetched_at = now() - :age"),
+            {"age": VideoService.FRESH_FOR - timedelta(minutes=10)},
+        )
+    video_service._memory.clear()
+
+    assert VideoService("abc").create_video()["title"] == "제목 1"
+    expires_at, _ = video_service._memory.get("abc")
+    # 최신으로 남은 10분만 캐시하고, FRESH_FOR 전체를 다시 캐시하지 않습니다.
+    assert expires_at - time.monotonic() <= timedelta(minutes=10).total_seconds()
+
+
+def test_unavailable_video_is_cached(monkeypatch):
+    calls = []
+
+    def fake_fetch(self):
+        calls.append(self.video_id)
+        raise VideoPrivate(self.video_id)
+
+    monkeypatch.setattr(VideoService, "_fetch", fake_fetch)
+    for _ in range(2):
+        with pytest.raises(VideoNotFound):
+            VideoService("private").create_video()
+    assert calls == ["private"]
+
+
+def test_transient_error_returns_stored(monkeypatch, fetches):
+    VideoService("abc").create_video()
+    with DatabaseManager() as session:
+        session.execute(text("UPDATE videos SET fetched_at = now() - interval '2 days'"))
+    video_service._memory.clear()
+
+    def blocked(self):
+        raise BotDetection(self.video_id)
+
+    monkeypatch.setattr(VideoService, "_fetch", blocked)
+    assert VideoService("abc").create_video()["title"] == "제목 1"
+
+
+def test_batch(monkeypatch, fetches):
+    import threading
+    import time
+
+    from service.video_service import VideoBatchService
+
+    VideoService("stored").create_video()
+    video_service._memory.clear()
+    fetches.clear()
+
+    fake_fetch = VideoService._fetch
+    release = threading.Event()
+
+    def slow_fetch(self):
+        if self.video_id == "private":
+            raise VideoPrivate(self.video_id)
+        if self.video_id == "slow":
+            release.wait(timeout=5)
+        time.sleep(0.2)
+        return fake_fetch(self)
+
+    monkeypatch.setattr(VideoService, "_fetch", slow_fetch)
+    ids = ["a", "b", "stored", "a", "private", "c", "slow", "d"]
+
+    started = time.monotonic()
+    data = VideoBatchService(ids, timeout=1).create_videos()
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert [video["video_id"] for video in data["videos"]] == ["a", "b", "stored", "c", "d"]
+    assert [error["video_id"] for error in data["errors"]] == ["private", "slow"]
+    assert data["errors"][0]["error"].startswith("VideoNotFound")
+    assert data["errors"][1]["error"].startswith("TimeoutError")
+    # 저장된 영상은 다시 가져오지 않고, 나머지는 동시에 가져옵니다.
+    assert "stored" not in fetches
+    assert elapsed < 1.5
+
+
+def test_batch_timeout_covers_queued_fetches(monkeypatch, fetches):
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from service.video_service import VideoBatchService
+
+    # 워커 하나가 막혀 있으면 나머지 영상은 풀에서 순서를 기다립니다.
+    executor = ThreadPoolExecutor(1)
+    monkeypatch.setattr(video_service, "_executor", executor)
+    fake_fetch = VideoService._fetch
+    release = threading.Event()
+
+    def blocking_fetch(self):
+        release.wait(timeout=5)
+        return fake_fetch(self)
+
+    monkeypatch.setattr(VideoService, "_fetch", blocking_fetch)
+    ids = ["blocked", "queued1", "queued2", "queued3"]
+
+    started = time.monotonic()
+    data = VideoBatchService(ids, timeout=0.5).create_videos()
+    elapsed = time.monotonic() - started
+    release.set()
+    executor.shutdown(wait=True)
+
+    assert data["videos"] == []
+    assert [error["video_id"] for error in data["errors"]] == ids
+    assert all(error["error"].startswith("TimeoutError") for error in data["errors"])
+    # 제한 시간은 호출 전체에 한 번 적용되고, 기다리던 영상은 취소되어 가져오지 않습니다.
+    assert elapsed < 1
+    assert fetches == ["blocked"]
@@ -0,0 +1,208 @@
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Callable
+
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+
+def to_video_row(content: dict) -> dict:
+    """`HashTagCrawlResponse.SearchResult` 형태의 콘텐츠를 `videos` 테이블의 행으로 변환합니다."""
+    video_id = content["video_id"]
+    thumbnail_url = content.get("thumbnail_url")
+    if not thumbnail_url or len(thumbnail_url) > 255:
+        # 서명 파라미터가 붙은 긴 URL은 잘라내면 사용할 수 없으므로 기본 썸네일로 대체합니다.
+        thumbnail_url = f"https://i.ytimg.com/vi/{video_id}/hq2.jpg"
+    return {
+        "id": video_id,
+        "title": (content.get("title") or "")[:255],
+        "thumbnail_url": thumbnail_url,
+        "views": content.get("view_count"),
+    }
+
+
+def _write_rows(rows: list[dict]) -> int:
+    """영상 행을 upsert하고 같은 트랜잭션에서 조회수 기록을 저장한 뒤, 검색 색인을 갱신합니다.
+
+    검색 색인은 별도 트랜잭션에서 갱신하므로, 색인에 실패해도 영상 행은 저장됩니다.
+    어긋난 색인은 `inssider repair search`로 바로잡습니다.
+    """
+    from repository.handler import DatabaseManager
+    from repository.search_repository import SearchRepository
+    from repository.video_repository import VideoRepository
+    from service.snapshot_service import ViewSnapshotService
+
+    with DatabaseManager() as session:
+        written = VideoRepository(session).upsert_search_results(rows)
+        ViewSnapshotService.record(session, [(row["id"], row["views"]) for row in rows])
+
+    try:
+        with DatabaseManager() as session:
+            # 검색 결과에는 설명이 없으므로 제목만 갱신하고 저장된 설명은 유지합니다.
+            SearchRepository(session).index(
+                "video", [(row["id"], row["title"], None) for row in rows]
+            )
+    except Exception as e:
+        print(f"영상 검색 색인 실패 ({len(rows)}행): {e}")
+    return written
+
+
+class VideoUpsertPipeline:
+    """크롤링 결과를 크기가 제한된 큐에 모았다가 백그라운드 스레드에서 일괄 upsert합니다.
+
+    - batch_size: 한 번에 저장하는 최대 행 수 (`VIDEO_PIPELINE_BATCH_SIZE`)
+    - flush_interval: 행이 batch_size만큼 모이지 않아도 저장하는 주기(초) (`VIDEO_PIPELINE_FLUSH_INTERVAL`)
+    - max_queue: 저장을 기다리는 최대 행 수 (`VIDEO_PIPELINE_MAX_QUEUE`)
+    - put_timeout: 큐가 가득 찼을 때 크롤링 쪽이 기다리는 최대 시간(초)으로, 지나면 해당 행을
+      버리고 `dropped`로 집계합니다. (`VIDEO_PIPELINE_PUT_TIMEOUT`)
+
+    제약 조건 위반이나 잘못된 값으로 배치 저장에 실패하면 배치를 반으로 나누어 다시 저장하므로,
+    잘못된 행이 있어도 그 행만 `failed_rows`로 집계하고 나머지 행은 저장합니다. DB 연결 오류는
+    배치를 나누지 않고 배치 전체를 실패로 집계합니다.
+    """
+
+    def __init__(
+        self,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        max_queue: int | None = None,
+        put_timeout: float | None = None,
+        writer: Callable[[list[dict]], int] = _write_rows,
+    ):
+        self.batch_size = batch_size or int(os.getenv("VIDEO_PIPELINE_BATCH_SIZE", "500"))
+        self.flush_interval = flush_interval or float(
+            os.getenv("VIDEO_PIPELINE_FLUSH_INTERVAL", "1")
+        )
+        self.put_timeout = (
+            put_timeout
+            if put_timeout is not None
+            else float(os.getenv("VIDEO_PIPELINE_PUT_TIMEOUT", "1"))
+        )
+        self.writer = writer
+        self._queue: queue.Queue = queue.Queue(
+            max_queue or int(os.getenv("VIDEO_PIPELINE_MAX_QUEUE", "10000"))
+        )
+        self._closed = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {
+            "rows_written": 0,
+            "batches": 0,
+            "failed_rows": 0,
+            "split_batches": 0,
+            "dropped": 0,
+            "write_seconds": 0.0,
+            "last_batch_rows_per_sec": None,
+        }
+        self._thread = threading.Thread(target=self._run, name="video-pipeline", daemon=True)
+        self._thread.start()
+
+    def submit(self, contents: list[dict]) -> int:
+        """콘텐츠를 저장 큐에 넣고 넣은 개수를 반환합니다. 큐가 가득 차면 최대 put_timeout초 기다립니다."""
+        accepted = 0
+        for content in contents:
+            try:
+                self._queue.put(to_video_row(content), timeout=self.put_timeout)
+                accepted += 1
+            except queue.Full:
+                with self._lock:
+                    self._stats["dropped"] += len(contents) - accepted
+                break
+        return accepted
+
+    def flush(self):
+        """큐에 들어간 모든 행이 저장(또는 실패)될 때까지 기다립니다."""
+        self._queue.join()
+
+    def close(self):
+        """남은 행을 저장하고 백그라운드 스레드를 종료합니다."""
+        self._closed.set()
+        self._thread.join()
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        seconds = stats.pop("write_seconds")
+        stats["rows_per_sec"] = round(stats["rows_written"] / seconds, 1) if seconds else None
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            batch = self._take_batch()
+            if batch:
+                self._write(batch)
+
+    def _take_batch(self) -> list[dict]:
+        """batch_size개가 모이거나 flush_interval이 지날 때까지 행을 모읍니다."""
+        batch, deadline = [], time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=min(timeout, 0.1)))
+            except queue.Empty:
+                if self._closed.is_set():
+                    break
+        return batch
+
+    def _write(self, batch: list[dict]):
+        try:
+            self._write_split(batch)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write_split(self, batch: list[dict]):
+        """배치를 저장하고, 행의 데이터 때문에 실패하면 반으로 나누어 다시 저장하여 실패한 행만 골라냅니다.
+
+        DB 연결 실패나 커넥션 풀 대기 시간 초과처럼 행과 무관한 오류는 나누어도 모두 실패하므로,
+        배치를 나누지 않고 한 번에 실패로 집계합니다.
+        """
+        from sqlalchemy.exc import DataError, IntegrityError
+
+        started = time.monotonic()
+        try:
+            self.writer(batch)
+        except (IntegrityError, DataError) as e:
+            if len(batch) > 1:
+                with self._lock:
+                    self._stats["split_batches"] += 1
+                middle = len(batch) // 2
+                self._write_split(batch[:middle])
+                self._write_split(batch[middle:])
+                return
+            print(f"영상 저장 실패 ({batch[0].get('id')}): {e}")
+            with self._lock:
+                self._stats["failed_rows"] += 1
+        except Exception as e:
+            print(f"영상 배치 저장 실패 ({len(batch)}행): {e}")
+            with self._lock:
+                self._stats["failed_rows"] += len(batch)
+        else:
+            elapsed = time.monotonic() - started
+            with self._lock:
+                self._stats["rows_written"] += len(batch)
+                self._stats["batches"] += 1
+                self._stats["write_seconds"] += elapsed
+                if elapsed > 0:
+                    self._stats["last_batch_rows_per_sec"] = round(len(batch) / elapsed, 1)
+
+
+_default_pipeline: VideoUpsertPipeline | None = None
+_default_pipeline_lock = threading.Lock()
+
+
+def get_video_pipeline() -> VideoUpsertPipeline:
+    """프로세스 전역에서 공유하는 영상 저장 파이프라인을 반환합니다."""
+    global _default_pipeline
+    with _default_pipeline_lock:
+        if _default_pipeline is None:
+            _default_pipeline = VideoUpsertPipeline()
+            atexit.register(_default_pipeline.close)
+        return _default_pipeline
@@ -1,12 +1,117 @@
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from dotenv import load_dotenv
+
+from service.cache import MemoryTier
+
+# .env 파일 로드
+load_dotenv()
+
+
+class VideoNotFound(Exception):
+    """비공개, 삭제 등의 이유로 조회할 수 없는 영상입니다."""
+
+    def __init__(self, video_id: str, reason: str | None = None):
+        super().__init__(reason or f"영상을 찾을 수 없습니다: {video_id}")
+        self.video_id = video_id
+
+
+# 영상 ID -> (만료 시각, 응답 데이터). 응답 데이터가 None이면 조회할 수 없는 영상입니다.
+_memory: MemoryTier | None = None
+_memory_lock = threading.Lock()
+
+
+def _get_memory() -> MemoryTier:
+    global _memory
+    with _memory_lock:
+        if _memory is None:
+            _memory = MemoryTier(int(os.getenv("VIDEO_CACHE_SIZE", "1024")))
+        return _memory
+
+
 class VideoService:
+    """영상 메타데이터를 메모리 캐시, `videos` 테이블, YouTube 순서로 조회합니다.
+
+    - 저장된 메타데이터는 `VIDEO_FRESH_MINUTES`분이 지나면 YouTube에서 다시 가져옵니다.
+    - 조회할 수 없는 영상은 `VIDEO_NEGATIVE_TTL`초 동안 다시 요청하지 않습니다.
+    """
+
+    FRESH_FOR = timedelta(minutes=float(os.getenv("VIDEO_FRESH_MINUTES", "1440")))
+    NEGATIVE_TTL = float(os.getenv("VIDEO_NEGATIVE_TTL", "300"))
 
     def __init__(self, video_id: str):
         self.video_id = video_id
 
     def create_video(self) -> dict:
+        from service.singleflight import get_single_flight
+
+        # 같은 영상을 조회하는 요청이 진행 중이면 그 결과를 함께 사용합니다.
+        return get_single_flight().do(f"video:{self.video_id}", self._create_video)
+
+    def _create_video(self) -> dict:
+        if (cached := self._cached()) is not None:
+            return cached
+
+        from repository.handler import DatabaseManager
+        from repository.video_repository import VideoRepository
+
+        with DatabaseManager() as session:
+            video, remaining = VideoRepository(session).get_with_freshness(
+                self.video_id, self.FRESH_FOR
+            )
+            stored = self._from_model(video) if video is not None else None
+        return self._resolve(stored, remaining)
+
+    def _cached(self) -> dict | None:
+        """메모리 캐시에 남아 있는 결과를 반환합니다. 조회할 수 없는 영상이면 `VideoNotFound`를 발생시킵니다."""
+        cached = _get_memory().get(self.video_id)
+        if cached is None or cached[0] <= time.monotonic():
+            return None
+        if cached[1] is None:
+            raise VideoNotFound(self.video_id)
+        return dict(cached[1])
+
+    def _resolve(self, stored: dict | None, remaining: timedelta) -> dict:
+        """저장된 메타데이터가 최신이면 그대로 반환하고, 아니면 YouTube에서 가져와 저장합니다.
 
-        # [ ] TODO 데이터베이스 읽기 -> 이미 존재하면 database에서 읽은 데이터 리턴
+        remaining은 저장된 메타데이터가 최신으로 남아 있는 시간으로, 메모리 캐시도 그만큼만 유지합니다.
+        """
+        from repository.handler import DatabaseManager
+        from repository.video_repository import VideoRepository
 
+        if stored is not None and remaining > timedelta(0):
+            self._remember(stored, remaining.total_seconds())
+            return stored
+
+        try:
+            res = self._fetch()
+        except Exception as e:
+            if self._is_unavailable(e):
+                self._remember(None, self.NEGATIVE_TTL)
+                raise VideoNotFound(self.video_id, str(e)) from e
+            if stored is not None:
+                # 일시적인 오류라면 오래된 메타데이터라도 반환합니다.
+                return stored
+            raise
+
+        from repository.search_repository import SearchRepository
+        from service.snapshot_service import ViewSnapshotService
+
+        with DatabaseManager() as session:
+            VideoRepository(session).upsert(self._to_values(res))
+            ViewSnapshotService.record(session, [(self.video_id, res.get("views"))])
+            SearchRepository(session).index(
+                "video", [(self.video_id, res.get("title"), res.get("description") or "")]
+            )
+        self._remember(res, self.FRESH_FOR.total_seconds())
+        return res
+
+    def _fetch(self) -> dict:
         from pytubefix import YouTube
         from pytubefix.cli import on_progress
 
@@ -20,6 +125,147 @@ class VideoService:
         res["video_id"] = self.video_id
         if res["thumbnail_url"] is None:
             res["thumbnail_url"] = f"https://i.ytimg.com/vi/{self.video_id}/hq2.jpg"
-
-        # [ ] TODO res 데이터베이스 저장
         return res
+
+    def _remember(self, res: dict | None, ttl: float):
+        _get_memory().put(self.video_id, (time.monotonic() + ttl, res))
+
+    @staticmethod
+    def _is_unavailable(error: Exception) -> bool:
+        """영상 자체를 조회할 수 없는 오류인지 확인합니다. 봇 탐지 등 요청 측 문제는 제외합니다."""
+        from pytubefix.exceptions import BotDetection, PoTokenRequired, VideoUnavailable
+
+        return isinstance(error, VideoUnavailable) and not isinstance(
+            error, (BotDetection, PoTokenRequired)
+        )
+
+    @staticmethod
+    def _from_model(video) -> dict:
+        from repository.video_repository import VIDEO_COLUMNS
+
+        return {
+            "video_id": video.id,
+            **{column: getattr(video, column) for column in VIDEO_COLUMNS},
+        }
+
+    @staticmethod
+    def _to_values(res: dict) -> dict:
+        from repository.video_repository import VIDEO_COLUMNS
+
+        return {"id": res["video_id"], **{column: res.get(column) for column in VIDEO_COLUMNS}}
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """YouTube에서 영상 메타데이터를 가져오는 프로세스 전역 스레드 풀을 반환합니다."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                int(os.getenv("VIDEO_FETCH_WORKERS", "8")), thread_name_prefix="video-fetch"
+            )
+            atexit.register(_executor.shutdown, wait=False, cancel_futures=True)
+        return _executor
+
+
+class VideoBatchService:
+    """여러 영상의 메타데이터를 한 번에 조회합니다.
+
+    메모리 캐시와 `videos` 테이블에서 응답할 수 있는 영상은 바로 반환하고, 나머지는
+    크기가 제한된 스레드 풀에서 동시에 가져옵니다. 요청한 뒤 `timeout`초(`VIDEO_FETCH_TIMEOUT`)
+    안에 가져오지 못한 영상은 풀에서 순서를 기다리던 영상을 포함해 기다리지 않고 오류로 응답합니다.
+    """
+
+    def __init__(self, video_ids: list[str], timeout: float | None = None):
+        self.video_ids = list(dict.fromkeys(video_ids))
+        self.timeout = timeout or float(os.getenv("VIDEO_FETCH_TIMEOUT", "20"))
+
+    def create_videos(self) -> dict:
+        from repository.handler import DatabaseManager
+        from repository.video_repository import VideoRepository
+
+        results, errors, missing = {}, {}, []
+        for video_id in self.video_ids:
+            try:
+                cached = VideoService(video_id)._cached()
+            except VideoNotFound as e:
+                errors[video_id] = self._error(e)
+                continue
+            if cached is not None:
+                results[video_id] = cached
+            else:
+                missing.append(video_id)
+
+        stored = {}
+        if missing:
+            with DatabaseManager() as session:
+                rows = VideoRepository(session).get_many_with_freshness(
+                    missing, VideoService.FRESH_FOR
+                )
+                stored = {
+                    video_id: (VideoService._from_model(video), remaining)
+                    for video_id, (video, remaining) in rows.items()
+                }
+
+        to_fetch = []
+        for video_id in missing:
+            data, remaining = stored.get(video_id, (None, timedelta(0)))
+            if data is not None and remaining > timedelta(0):
+                results[video_id] = VideoService(video_id)._resolve(data, remaining)
+            else:
+                to_fetch.append(video_id)
+
+        for video_id, outcome in self._fetch_all(to_fetch, stored).items():
+            if isinstance(outcome, Exception):
+                errors[video_id] = self._error(outcome)
+            else:
+                results[video_id] = outcome
+
+        return {
+            "videos": [results[video_id] for video_id in self.video_ids if video_id in results],
+            "errors": [
+                {"video_id": video_id, "error": errors[video_id]}
+                for video_id in self.video_ids
+                if video_id in errors
+            ],
+        }
+
+    def _fetch_all(self, video_ids: list[str], stored: dict) -> dict[str, dict | Exception]:
+        """영상들을 동시에 가져오고, 제한 시간 안에 끝나지 않은 영상은 `TimeoutError`로 기록합니다.
+
+        제한 시간은 영상마다가 아니라 호출 전체에 한 번 적용하므로, 풀에서 순서를 기다리는 영상이
+        많아도 응답 시간은 timeout초를 넘지 않습니다.
+        """
+
+        def fetch(video_id: str) -> dict:
+            from service.singleflight import get_single_flight
+
+            data, remaining = stored.get(video_id, (None, timedelta(0)))
+            return get_single_flight().do(
+                f"video:{video_id}", lambda: VideoService(video_id)._resolve(data, remaining)
+            )
+
+        executor = _get_executor()
+        futures: dict[Future, str] = {
+            executor.submit(fetch, video_id): video_id for video_id in video_ids
+        }
+        done, not_done = wait(futures, timeout=self.timeout)
+        outcomes: dict[str, dict | Exception] = {}
+        for future in done:
+            try:
+                outcomes[futures[future]] = future.result()
+            except Exception as e:
+                outcomes[futures[future]] = e
+        for future in not_done:
+            # 아직 시작하지 않은 영상은 취소하여 다른 요청이 풀을 쓸 수 있게 합니다. 실행 중인
+            # 스레드는 중단할 수 없으므로 결과를 기다리지 않고 응답합니다.
+            future.cancel()
+            outcomes[futures[future]] = TimeoutError(f"{self.timeout}초 안에 응답이 없습니다.")
+        return outcomes
+
+    @staticmethod
+    def _error(error: Exception) -> str:
+        return f"{type(error).__name__}: {error}"
@@ -1,12 +1,15 @@
 import abc
 import os
+from typing import Callable, Generator
 from urllib.request import Request
 from warnings import filterwarnings
 
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 
-from service.youtube.strategy import ScrapeStrategy
+from service.youtube.pool import DriverPool, PooledDriver
+from service.youtube.profile import DEFAULT_PROFILE, CrawlerProfile, get_profile
+from service.youtube.strategy import Incremental, ScrapeStrategy, StopReason
 
 filterwarnings("ignore", "", DeprecationWarning, "seleniumwire")
 filterwarnings("ignore", "", DeprecationWarning, "OpenSSL.crypto", 1679)
@@ -14,30 +17,65 @@ filterwarnings("ignore", "", DeprecationWarning, "OpenSSL.crypto", 1679)
 from seleniumwire import webdriver  # noqa: E402
 
 
+def launch_driver(
+    profile: CrawlerProfile = DEFAULT_PROFILE, capture_performance: bool = False
+) -> PooledDriver:
+    """프로필에 맞춰 브라우저를 실행하고 기본 요청 헤더를 수집합니다.
+
+    capture_performance가 참이면 전송량 측정을 위해 브라우저 성능 로그를 수집합니다.
+    """
+    options = Options()
+    brave_path = "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser"
+    if not os.path.exists(brave_path):
+        print("경고: Brave Browser를 찾을 수 없습니다. 기본 Chrome을 사용합니다.")
+    else:
+        options.binary_location = brave_path
+    if profile.headless:
+        options.add_argument("--headless=new")
+    for argument in profile.chrome_arguments:
+        options.add_argument(argument)
+    options.page_load_strategy = profile.page_load_strategy
+    if capture_performance:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    driver = webdriver.Chrome(
+        options=options, seleniumwire_options=dict(profile.seleniumwire_options)
+    )
+
+    driver.get("https://httpbin.io/headers")
+    headers = eval(driver.find_element(By.TAG_NAME, "body").text)
+    if profile.headless:
+        _hide_headless_user_agent(headers["headers"])
+    return PooledDriver(driver, headers, profile)
+
+
+def _hide_headless_user_agent(headers: dict):
+    """headless 모드의 User-Agent에 포함된 `HeadlessChrome` 표기를 일반 Chrome으로 바꿉니다."""
+    user_agent = headers.get("User-Agent")
+    if isinstance(user_agent, list):
+        headers["User-Agent"] = [ua.replace("HeadlessChrome", "Chrome") for ua in user_agent]
+    elif isinstance(user_agent, str):
+        headers["User-Agent"] = user_agent.replace("HeadlessChrome", "Chrome")
+
+
 class DefaultCrawler(abc.ABC):
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         original_init = cls.__init__
 
-        def new_init(self, *args, **kwargs):
-            DefaultCrawler.__init__(self)
+        def new_init(self, *args, pool: DriverPool | None = None, **kwargs):
+            DefaultCrawler.__init__(self, pool)
             return original_init(self, *args, **kwargs)
 
         cls.__init__ = new_init
 
-    def __init__(self):
-        brave_path = "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser"
-        if not os.path.exists(brave_path):
-            print("경고: Brave Browser를 찾을 수 없습니다. 기본 Chrome을 사용합니다.")
-            self.driver = webdriver.Chrome()
-        else:
-            options = Options()
-            options.binary_location = brave_path
-            self.driver = webdriver.Chrome(options=options)
-
-        self.driver.get("https://httpbin.io/headers")
-        self.headers = eval(self.driver.find_element(By.TAG_NAME, "body").text)
+    def __init__(self, pool: DriverPool | None = None):
+        """pool이 주어지면 브라우저를 대여하고, 없으면 전용 브라우저를 실행합니다."""
+        self.pool = pool
+        self._pooled = pool.lease() if pool else launch_driver(get_profile())
+        self.driver = self._pooled.driver
+        self.headers = self._pooled.headers
         self.driver.request_interceptor = self.request_interceptor
 
     def __enter__(self):
@@ -46,10 +84,21 @@ class DefaultCrawler(abc.ABC):
 
     def __exit__(self, *args):
         """컨텍스트 매니저 종료 시 호출됩니다."""
-        self.driver.quit()
+        if self.pool:
+            self.pool.release(self._pooled)
+        else:
+            self.driver.quit()
+
+    def _visit(self, url: str):
+        """페이지를 방문하고 브라우저 교체 주기 계산을 위해 방문 횟수를 기록합니다."""
+        self.driver.get(url)
+        self._pooled.pages += 1
 
     def request_interceptor(self, request: Request):
-        """요청 인터셉터를 설정합니다."""
+        """요청 인터셉터를 설정합니다. 프로필에서 차단하는 요청은 전송하지 않습니다."""
+        if self._pooled.profile.blocks(request):
+            request.abort()
+            return
         request.headers = self.headers
 
     @abc.abstractmethod
@@ -64,13 +113,26 @@ class YouTubeCrawler(DefaultCrawler):
     def __init__(self):
         """요청 헤더를 초기화합니다."""
         self.host = "www.youtube.com"
-        self.headers["headers"]["Host"] = self.host
-        self.headers["headers"]["Referer"] = f"https://{self.host}/"
-
-    def scrape(self, url: str, strategy: ScrapeStrategy, limit: int = 10) -> dict:
-        self.driver.get(url)
+        self.headers = self._pooled.headers_for(self.host)
+
+    def scrape(
+        self,
+        url: str,
+        strategy: ScrapeStrategy,
+        limit: int = 10,
+        on_progress: Callable[[int], None] | None = None,
+        incremental: Incremental | None = None,
+    ) -> dict:
+        self._visit(url)
         # self.driver.implicitly_wait(10)
-        return strategy.run(self.driver, limit)
+        return strategy.run(self.driver, limit, on_progress, incremental)
+
+    def iterate(
+        self, url: str, strategy: ScrapeStrategy, limit: int = 10
+    ) -> Generator[dict, None, StopReason]:
+        """수집한 콘텐츠를 하나씩 반환하는 제너레이터를 생성합니다."""
+        self._visit(url)
+        return strategy.iterate(self.driver, limit)
 
 
 class NamuWikiCrawler(DefaultCrawler):
@@ -79,11 +141,16 @@ class NamuWikiCrawler(DefaultCrawler):
     def __init__(self):
         """요청 헤더를 초기화합니다."""
         self.host = "namu.wiki"
-        self.headers["headers"]["Host"] = self.host
-        self.headers["headers"]["Referer"] = f"https://{self.host}/"
+        self.headers = self._pooled.headers_for(self.host)
         # TODO invalid browser 문제 해결
 
-    def scrape(self, url: str, strategy: ScrapeStrategy, limit: int = 10) -> dict:
-        self.driver.get(url)
+    def scrape(
+        self,
+        url: str,
+        strategy: ScrapeStrategy,
+        limit: int = 10,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> dict:
+        self._visit(url)
         # self.driver.implicitly_wait(10)
-        return strategy.run(self.driver, limit)
+        return strategy.run(self.driver, limit, on_progress)
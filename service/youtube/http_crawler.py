@@ -0,0 +1,177 @@
+import atexit
+import json
+import os
+import re
+import threading
+from typing import Callable, Generator
+from urllib.parse import urlsplit
+
+import httpx
+from dotenv import load_dotenv
+
+from service.youtube.strategy import Incremental, ScrapeStrategy, StopReason
+
+# .env 파일 로드
+load_dotenv()
+
+_INITIAL_DATA = re.compile(r"""(?:var\s+ytInitialData|window\[["']ytInitialData["']\])\s*=\s*""")
+_YTCFG = re.compile(r"ytcfg\.set\(\s*(?=\{)")
+_DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """프로세스 전역에서 연결을 재사용하는 HTTP 클라이언트를 반환합니다."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            max_connections = int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "20"))
+            _client = httpx.Client(
+                headers=_DEFAULT_HEADERS,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+                timeout=float(os.getenv("HTTP_CLIENT_TIMEOUT", "10")),
+                follow_redirects=True,
+            )
+            atexit.register(_client.close)
+        return _client
+
+
+def _decode_object(text: str, pattern: re.Pattern) -> list[dict]:
+    """정규식이 가리키는 위치에서 시작하는 JSON 객체들을 모두 디코딩합니다."""
+    decoder = json.JSONDecoder()
+    objects = []
+    for match in pattern.finditer(text):
+        try:
+            obj, _ = decoder.raw_decode(text, match.end())
+        except json.JSONDecodeError:
+            continue
+        objects.append(obj)
+    return objects
+
+
+class YouTubeHttpSession:
+    """브라우저 없이 페이지에 포함된 초기 데이터와 continuation 요청으로 목록을 탐색합니다.
+
+    `ScrapeStrategy.run`에 드라이버 대신 전달되며, `next_page`를 호출할 때마다
+    다음 페이지의 렌더러 목록을 반환합니다.
+    """
+
+    RENDERER_KEYS = ("videoRenderer", "reelItemRenderer")
+
+    def __init__(self, client: httpx.Client, url: str):
+        self.client = client
+        self.url = url
+        parts = urlsplit(url)
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        self.config: dict = {}
+        self.continuation: str | None = None
+        self.requests = 0
+        self._initial_data: dict | None = None
+
+    def load(self):
+        """페이지를 요청하고 내장된 `ytInitialData`와 `ytcfg` 설정을 파싱합니다."""
+        html = self._request("GET", self.url).text
+        data = _decode_object(html, _INITIAL_DATA)
+        if not data:
+            raise ValueError(f"ytInitialData를 찾을 수 없습니다: {self.url}")
+        for config in _decode_object(html, _YTCFG):
+            self.config.update(config)
+        self._initial_data = data[0]
+
+    def next_page(self) -> list[tuple[str, dict]]:
+        """다음 페이지의 (렌더러 종류, 렌더러) 목록을 반환합니다. 더 이상 없으면 빈 목록입니다."""
+        if self._initial_data is not None:
+            data, self._initial_data = self._initial_data, None
+        elif self.continuation:
+            data = self._request(
+                "POST",
+                f"{self.origin}/youtubei/v1/browse",
+                params={"key": self.config.get("INNERTUBE_API_KEY"), "prettyPrint": "false"},
+                json={
+                    "context": self.config.get("INNERTUBE_CONTEXT", {}),
+                    "continuation": self.continuation,
+                },
+                headers={
+                    "X-YouTube-Client-Name": str(
+                        self.config.get("INNERTUBE_CONTEXT_CLIENT_NAME", "1")
+                    ),
+                    "X-YouTube-Client-Version": str(
+                        self.config.get("INNERTUBE_CLIENT_VERSION", "")
+                    ),
+                },
+            ).json()
+        else:
+            return []
+
+        renderers, self.continuation = [], None
+        for key, value in self._walk(data):
+            if key == "continuationCommand":
+                self.continuation = value.get("token")
+            else:
+                renderers.append((key, value))
+        return renderers
+
+    def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        self.requests += 1
+        response = self.client.request(method, url, **kwargs)
+        response.raise_for_status()
+        return response
+
+    @classmethod
+    def _walk(cls, obj):
+        """JSON 트리를 순서대로 탐색하며 영상 렌더러와 continuation 토큰을 찾습니다."""
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                if key in cls.RENDERER_KEYS or key == "continuationCommand":
+                    yield key, value
+                else:
+                    yield from cls._walk(value)
+        elif isinstance(obj, list):
+            for value in obj:
+                yield from cls._walk(value)
+
+
+class YouTubeHttpCrawler:
+    """브라우저를 실행하지 않고 HTTP 요청만으로 동작하는 YouTube 크롤러입니다."""
+
+    def __init__(self, client: httpx.Client | None = None):
+        self.client = client or get_http_client()
+
+    def __enter__(self):
+        """컨텍스트 매니저 진입 시 호출됩니다."""
+        return self
+
+    def __exit__(self, *args):
+        """컨텍스트 매니저 종료 시 호출됩니다. 공유 클라이언트는 닫지 않습니다."""
+        pass
+
+    def scrape(
+        self,
+        url: str,
+        strategy: ScrapeStrategy,
+        limit: int = 10,
+        on_progress: Callable[[int], None] | None = None,
+        incremental: Incremental | None = None,
+    ) -> dict:
+        session = YouTubeHttpSession(self.client, url)
+        session.load()
+        return strategy.run(session, limit, on_progress, incremental)
+
+    def iterate(
+        self, url: str, strategy: ScrapeStrategy, limit: int = 10
+    ) -> Generator[dict, None, StopReason]:
+        """수집한 콘텐츠를 하나씩 반환하는 제너레이터를 생성합니다."""
+        session = YouTubeHttpSession(self.client, url)
+        session.load()
+        return strategy.iterate(session, limit)
@@ -0,0 +1,207 @@
+import atexit
+import copy
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable
+
+from dotenv import load_dotenv
+from selenium.common.exceptions import WebDriverException
+
+from service.youtube.profile import DEFAULT_PROFILE, CrawlerProfile
+
+if TYPE_CHECKING:
+    from seleniumwire.webdriver import Chrome
+
+# .env 파일 로드
+load_dotenv()
+
+
+@dataclass
+class PooledDriver:
+    """풀에서 관리되는 브라우저 드라이버와 그 메타데이터입니다."""
+
+    driver: "Chrome"
+    headers: dict
+    profile: CrawlerProfile = DEFAULT_PROFILE
+    created_at: float = field(default_factory=time.monotonic)
+    pages: int = 0
+    _host_headers: dict[str, dict] = field(default_factory=dict, repr=False)
+
+    def headers_for(self, host: str) -> dict:
+        """호스트별 요청 헤더를 최초 1회만 구성하고 이후에는 재사용합니다."""
+        if host not in self._host_headers:
+            headers = copy.deepcopy(self.headers)
+            headers["headers"]["Host"] = host
+            headers["headers"]["Referer"] = f"https://{host}/"
+            self._host_headers[host] = headers
+        return self._host_headers[host]
+
+    def is_expired(self, max_pages: int, max_age: float) -> bool:
+        """방문 페이지 수 또는 실행 시간이 한도를 넘었는지 확인합니다."""
+        return self.pages >= max_pages or time.monotonic() - self.created_at >= max_age
+
+    def is_healthy(self) -> bool:
+        """브라우저 세션이 아직 응답하는지 확인합니다."""
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+
+
+class DriverPool:
+    """미리 실행해 둔 브라우저를 대여/반납 방식으로 재사용하는 풀입니다.
+
+    - 대여 시 상태 점검에 실패하거나 수명이 다한 브라우저는 폐기 후 새로 실행합니다.
+    - 브라우저는 `max_pages`개의 페이지를 방문했거나 `max_age`초가 지나면 교체됩니다.
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        max_pages: int | None = None,
+        max_age: float | None = None,
+        factory: Callable[[], PooledDriver] | None = None,
+    ):
+        self.size = size or int(os.getenv("CRAWLER_POOL_SIZE", "2"))
+        self.max_pages = max_pages or int(os.getenv("CRAWLER_POOL_MAX_PAGES", "50"))
+        self.max_age = max_age or float(os.getenv("CRAWLER_POOL_MAX_AGE_MINUTES", "30")) * 60
+        self._factory = factory or _launch_default_driver
+
+        self._idle: deque[PooledDriver] = deque()
+        self._total = 0  # 대여 중인 브라우저와 유휴 브라우저의 합
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {"launched": 0, "recycled": 0, "leases": 0}
+
+    def warm_up(self, count: int | None = None):
+        """브라우저를 미리 실행하여 유휴 목록에 채워 둡니다."""
+        count = min(count or self.size, self.size)
+        while True:
+            with self._cond:
+                if self._closed or self._total >= count:
+                    return
+                self._total += 1
+            self.release(self._launch())
+
+    def lease(self, timeout: float | None = None) -> PooledDriver:
+        """브라우저를 대여합니다. 풀이 가득 차 있으면 반납될 때까지 대기합니다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while not self._closed and not self._idle and self._total >= self.size:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("대여 가능한 브라우저가 없습니다.")
+                    self._cond.wait(remaining)
+                if self._closed:
+                    raise RuntimeError("이미 종료된 브라우저 풀입니다.")
+
+                pooled = self._idle.popleft() if self._idle else None
+                if pooled is None:
+                    self._total += 1
+                self._stats["leases"] += 1
+
+            if pooled is None:
+                return self._launch()
+            if not pooled.is_expired(self.max_pages, self.max_age) and pooled.is_healthy():
+                return pooled
+            self._retire(pooled)
+
+    def release(self, pooled: PooledDriver, discard: bool = False):
+        """대여한 브라우저를 반납합니다. 재사용이 불가능하면 폐기합니다."""
+        if discard or self._closed or pooled.is_expired(self.max_pages, self.max_age):
+            self._retire(pooled)
+            return
+        try:
+            # 이전 크롤러의 인터셉터와 캡처된 요청을 정리합니다.
+            del pooled.driver.request_interceptor
+            del pooled.driver.requests
+        except WebDriverException:
+            self._retire(pooled)
+            return
+        with self._cond:
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    @contextmanager
+    def leased(self, timeout: float | None = None):
+        """컨텍스트 매니저 형태로 브라우저를 대여하고 종료 시 반납합니다."""
+        pooled = self.lease(timeout)
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    def close(self):
+        """유휴 브라우저를 모두 종료합니다. 대여 중인 브라우저는 반납 시 종료됩니다."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._cond.notify_all()
+        for pooled in idle:
+            self._retire(pooled)
+
+    def stats(self) -> dict:
+        """풀의 현재 상태와 누적 통계를 반환합니다."""
+        with self._cond:
+            return {
+                "size": self.size,
+                "total": self._total,
+                "idle": len(self._idle),
+                "leased": self._total - len(self._idle),
+                **self._stats,
+            }
+
+    def _launch(self) -> PooledDriver:
+        try:
+            pooled = self._factory()
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats["launched"] += 1
+        return pooled
+
+    def _retire(self, pooled: PooledDriver):
+        pooled.quit()
+        with self._cond:
+            self._total -= 1
+            self._stats["recycled"] += 1
+            self._cond.notify()
+
+
+def _launch_default_driver() -> PooledDriver:
+    from service.youtube.crawler import launch_driver
+    from service.youtube.profile import get_profile
+
+    return launch_driver(get_profile())
+
+
+_default_pool: DriverPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_driver_pool(**options) -> DriverPool:
+    """프로세스 전역에서 공유하는 브라우저 풀을 반환합니다.
+
+    options는 `DriverPool`의 생성 인자이며, 풀이 처음 생성될 때만 적용됩니다.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = DriverPool(**options)
+            atexit.register(_default_pool.close)
+        return _default_pool
@@ -0,0 +1,204 @@
+import os
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+
+from dotenv import load_dotenv
+
+if TYPE_CHECKING:
+    from seleniumwire.request import Request
+
+# .env 파일 로드
+load_dotenv()
+
+_EXTENSION_TYPES = {
+    "image": {".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif", ".svg", ".ico"},
+    "font": {".woff", ".woff2", ".ttf", ".otf"},
+    "video": {".mp4", ".webm", ".m4s", ".ts"},
+}
+
+
+@dataclass(frozen=True)
+class CrawlerProfile:
+    """브라우저 실행 옵션과 요청 차단 규칙을 묶은 크롤러 프로필입니다."""
+
+    name: str
+    headless: bool = False
+    page_load_strategy: str = "normal"
+    chrome_arguments: tuple[str, ...] = ()
+    blocked_resource_types: frozenset[str] = frozenset()
+    blocked_url_patterns: tuple[str, ...] = ()
+    seleniumwire_options: dict = field(default_factory=dict, hash=False)
+
+    def blocks(self, request: "Request") -> bool:
+        """리소스 종류 또는 URL 패턴에 따라 요청을 차단해야 하는지 판단합니다."""
+        if any(pattern in request.url for pattern in self.blocked_url_patterns):
+            return True
+        return resource_type(request) in self.blocked_resource_types
+
+
+def resource_type(request: "Request") -> str:
+    """`Sec-Fetch-Dest` 헤더 또는 확장자로 요청의 리소스 종류를 추정합니다."""
+    dest = request.headers.get("Sec-Fetch-Dest")
+    if dest and dest != "empty":
+        return dest
+    suffix = PurePosixPath(request.path.split("?")[0]).suffix.lower()
+    for kind, extensions in _EXTENSION_TYPES.items():
+        if suffix in extensions:
+            return kind
+    return dest or "other"
+
+
+DEFAULT_PROFILE = CrawlerProfile(name="default")
+
+# 화면 렌더링과 미디어 다운로드를 최소화하고, seleniumwire의 요청 기록을 제한합니다.
+# 스크래핑은 DOM 텍스트와 속성만 읽으므로 이미지/폰트/영상/광고 요청이 필요하지 않습니다.
+LEAN_PROFILE = CrawlerProfile(
+    name="lean",
+    headless=True,
+    page_load_strategy="eager",
+    chrome_arguments=(
+        "--disable-gpu",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-component-update",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--mute-audio",
+        "--no-first-run",
+        "--blink-settings=imagesEnabled=false",
+        "--autoplay-policy=user-gesture-required",
+        "--window-size=1280,2000",
+    ),
+    blocked_resource_types=frozenset({"image", "font", "video", "audio", "track", "manifest"}),
+    blocked_url_patterns=(
+        "googlevideo.com/videoplayback",
+        "doubleclick.net",
+        "googlesyndication.com",
+        "googleadservices.com",
+        "google-analytics.com",
+        "/pagead/",
+        "/ptracking",
+        "/api/stats/",
+        "/generate_204",
+        "/youtubei/v1/log_event",
+        "play.google.com/log",
+    ),
+    seleniumwire_options={
+        "request_storage": "memory",
+        "request_storage_max_size": int(os.getenv("CRAWLER_REQUEST_STORAGE_MAX_SIZE", "50")),
+    },
+)
+
+PROFILES = {profile.name: profile for profile in (DEFAULT_PROFILE, LEAN_PROFILE)}
+
+
+def get_profile(name: str | None = None) -> CrawlerProfile:
+    """이름 또는 `CRAWLER_PROFILE` 환경 변수에 해당하는 프로필을 반환합니다."""
+    name = name or os.getenv("CRAWLER_PROFILE", DEFAULT_PROFILE.name)
+    if name not in PROFILES:
+        raise ValueError(f"지원하지 않는 크롤러 프로필입니다: {name}")
+    return PROFILES[name]
+
+
+def _process_tree_rss(pid: int) -> int | None:
+    """/proc를 읽어 프로세스와 모든 하위 프로세스의 RSS 합계(바이트)를 반환합니다.
+
+    /proc가 없는 운영체제(macOS 등)에서는 측정할 수 없으므로 None을 반환합니다.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as f:
+                    stack.extend(int(child) for child in f.read().split())
+        except (FileNotFoundError, ProcessLookupError):
+            continue
+    return total
+
+
+def measure(profile_name: str, hashtag: str, limit: int) -> dict:
+    """프로필로 해시태그를 크롤링하며 전송 바이트와 최대 메모리 사용량을 측정합니다.
+
+    - transferred_bytes: 브라우저 성능 로그의 `Network.loadingFinished` 인코딩 크기 합계
+    - peak_browser_rss: chromedriver와 브라우저 프로세스 트리의 최대 RSS (측정할 수 없으면 None)
+    - peak_python_rss: seleniumwire 프록시가 동작하는 현재 프로세스의 최대 RSS
+    """
+    import json
+    import resource
+    import sys
+    import threading
+    import time
+    from urllib.parse import quote
+
+    from service.youtube.crawler import YouTubeCrawler, launch_driver
+    from service.youtube.pool import DriverPool
+    from service.youtube.strategy import HashTagStrategy
+
+    profile = get_profile(profile_name)
+    pool = DriverPool(size=1, factory=lambda: launch_driver(profile, capture_performance=True))
+    started = time.monotonic()
+    with YouTubeCrawler(pool=pool) as crawler:
+        peak, done = [None], threading.Event()
+
+        def sample():
+            while not done.wait(0.2):
+                rss = _process_tree_rss(crawler.driver.service.process.pid)
+                if rss is None:
+                    return
+                peak[0] = max(peak[0] or 0, rss)
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        url = f"https://www.youtube.com/hashtag/{quote(hashtag)}"
+        data = crawler.scrape(url, HashTagStrategy(), limit)
+        done.set()
+        sampler.join()
+
+        transferred = 0
+        for entry in crawler.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            if message["method"] == "Network.loadingFinished":
+                transferred += int(message["params"].get("encodedDataLength", 0))
+    pool.close()
+
+    # ru_maxrss는 Linux에서 KiB, macOS에서 바이트 단위입니다.
+    python_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "profile": profile.name,
+        "length": data["length"],
+        "seconds": round(time.monotonic() - started, 2),
+        "transferred_bytes": transferred,
+        "peak_browser_rss": peak[0],
+        "peak_python_rss": python_rss if sys.platform == "darwin" else python_rss * 1024,
+    }
+
+
+if __name__ == "__main__":
+    import sys
+    from concurrent.futures import ProcessPoolExecutor
+
+    hashtag = sys.argv[1] if len(sys.argv) > 1 else "밈"
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    def mib(value: int | None) -> str:
+        return "n/a" if value is None else f"{value / 2**20:.1f}MiB"
+
+    # 최대 RSS가 서로 섞이지 않도록 프로필마다 별도 프로세스에서 측정합니다.
+    for name in PROFILES:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            res = executor.submit(measure, name, hashtag, limit).result()
+        print(
+            f"[{res['profile']:>7}] items={res['length']} time={res['seconds']}s "
+            f"transferred={res['transferred_bytes'] / 2**20:.1f}MiB "
+            f"browser_rss={mib(res['peak_browser_rss'])} "
+            f"python_rss={mib(res['peak_python_rss'])}"
+        )
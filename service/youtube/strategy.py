@@ -1,28 +1,133 @@
 import abc
-from typing import override
+import os
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, AbstractSet, Callable, Generator, override
 
 from selenium.webdriver import Chrome
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
+if TYPE_CHECKING:
+    from service.youtube.http_crawler import YouTubeHttpSession
+
+
+class StopReason(str, Enum):
+    """스크래핑이 종료된 이유입니다."""
+
+    LIMIT = "limit"  # 요청한 개수 또는 최대 탐색 개수에 도달
+    END_OF_FEED = "end_of_feed"  # 더 이상 불러올 콘텐츠가 없음
+    TIMEOUT = "timeout"  # 제한 시간 안에 새 콘텐츠가 로드되지 않음
+    ERROR = "error"  # 스크래핑 도중 예외 발생
+    CANCELLED = "cancelled"  # 호출자가 취소를 요청함
+    KNOWN = "known"  # 이미 수집한 콘텐츠가 연속으로 나타남 (증분 스크래핑)
+
+
+@dataclass
+class Incremental:
+    """증분 스크래핑 설정과 실행 결과입니다.
+
+    - known: 이전에 수집했거나 같은 필터 조건으로 제외한 영상 ID 집합으로, 해당 콘텐츠는
+      추출하지 않고 건너뜁니다.
+    - stop_after: 이미 검사한 콘텐츠가 이 개수만큼 연속으로 나타나면 스크래핑을 종료합니다.
+    - filter_key: known을 불러올 때 적용한 `ScrapeStrategy.filter_key`
+    - skipped: 건너뛴 콘텐츠 수
+    - new_ids: 새로 추출하여 반환한 영상 ID 목록
+    - filtered_ids: 새로 추출했지만 `_filter`에서 제외한 영상 ID 목록. 수집 이력과 따로 기록하여
+      필터 조건이 바뀌면 다시 검사합니다.
+    """
+
+    known: AbstractSet[str]
+    stop_after: int
+    filter_key: str = ""
+    skipped: int = 0
+    new_ids: list[str] = field(default_factory=list)
+    filtered_ids: list[str] = field(default_factory=list)
+
+
+class ScrapeStopped(Exception):
+    """`_run`에서 더 이상 진행할 수 없을 때 종료 이유와 함께 발생시키는 예외입니다."""
+
+    def __init__(self, reason: StopReason):
+        super().__init__(reason.value)
+        self.reason = reason
+
 
 class ScrapeStrategy(abc.ABC):
     """스크래핑 전략을 정의하는 추상 클래스입니다."""
 
     @classmethod
-    def run(cls, driver: Chrome, len_items: int) -> dict:
-        """스크래핑 전략을 실행합니다."""
-        res, idx, limit = [], 0, 400  # YouTube provides max 450 contents
+    def run(
+        cls,
+        driver: Chrome,
+        len_items: int,
+        on_progress: Callable[[int], None] | None = None,
+        incremental: Incremental | None = None,
+    ) -> dict:
+        """스크래핑 전략을 실행하고 수집한 콘텐츠 전체를 반환합니다."""
+        res, items = [], cls.iterate(driver, len_items, on_progress, incremental)
+        while True:
+            try:
+                res.append(next(items))
+            except StopIteration as stop:
+                reason = stop.value
+                break
+        data = {"length": len(res), "contents": res, "stop_reason": reason.value}
+        if incremental is not None:
+            data["new_count"] = len(incremental.new_ids)
+            data["skipped_count"] = incremental.skipped
+        return data
+
+    @classmethod
+    def iterate(
+        cls,
+        driver: Chrome,
+        len_items: int,
+        on_progress: Callable[[int], None] | None = None,
+        incremental: Incremental | None = None,
+    ) -> Generator[dict, None, StopReason]:
+        """`_filter`를 통과한 콘텐츠를 수집 즉시 하나씩 반환하고, 종료 이유를 반환값으로 돌려줍니다.
+
+        on_progress는 콘텐츠를 불러올 때마다 현재까지의 개수로 호출되며,
+        `ScrapeStopped`를 발생시켜 스크래핑을 중단할 수 있습니다.
+        incremental이 주어지면 이미 수집한 콘텐츠는 건너뛰고 통계를 incremental에 기록합니다.
+        """
+        count, idx, limit = 0, 0, 400  # YouTube provides max 450 contents
+        known_run = 0
         try:
-            while idx < limit and len(res) < len_items:
-                found = cls._run(driver, idx)
+            while idx < limit and count < len_items:
+                if incremental is None:
+                    found = cls._run(driver, idx)
+                else:
+                    found = cls._run_skipping(driver, idx, incremental.known)
+                if not found:
+                    return StopReason.END_OF_FEED
                 idx += len(found)
-                filtered = list(filter(cls._filter, found))
-                res.extend(filtered)
+                for content in found:
+                    if incremental is not None:
+                        if content.get("known"):
+                            incremental.skipped += 1
+                            known_run += 1
+                            if known_run >= incremental.stop_after:
+                                return StopReason.KNOWN
+                            continue
+                        known_run = 0
+                    if cls._filter(content):
+                        if incremental is not None:
+                            incremental.new_ids.append(content["video_id"])
+                        count += 1
+                        yield content
+                    elif incremental is not None:
+                        incremental.filtered_ids.append(content["video_id"])
+                if on_progress:
+                    on_progress(count)
+        except ScrapeStopped as e:
+            return e.reason
         except Exception:
             # return current result if error occurs
-            pass
-        return {"length": len(res), "contents": res}
+            return StopReason.ERROR
+        return StopReason.LIMIT
 
     @classmethod
     @abc.abstractmethod
@@ -30,12 +135,37 @@ class ScrapeStrategy(abc.ABC):
         """해시태그 검색 결과를 스크래핑합니다."""
         raise NotImplementedError()
 
+    @classmethod
+    def _run_skipping(cls, driver: Chrome, idx: int, known: AbstractSet[str]) -> list[dict]:
+        """`_run`과 같지만 known에 포함된 콘텐츠는 `_known` 표시로 대신합니다.
+
+        기본 구현은 모든 콘텐츠를 추출한 뒤 표시하므로, 추출 전에 영상 ID를 알 수 있는 전략은
+        이 메서드를 재정의하여 불필요한 추출을 생략합니다.
+        """
+        return [
+            cls._known(content["video_id"]) if content.get("video_id") in known else content
+            for content in cls._run(driver, idx)
+        ]
+
+    @staticmethod
+    def _known(video_id: str) -> dict:
+        """이미 수집하여 추출을 생략한 콘텐츠를 나타냅니다."""
+        return {"video_id": video_id, "known": True}
+
     @classmethod
     @abc.abstractmethod
     def _filter(cls, content: dict) -> bool:
         """스크래핑한 콘텐츠를 필터링합니다."""
         raise NotImplementedError()
 
+    @classmethod
+    def filter_key(cls) -> str:
+        """`_filter`의 조건을 나타내는 문자열입니다.
+
+        증분 크롤링은 같은 조건으로 제외한 콘텐츠만 건너뛰므로, 조건을 바꾸면 이 값도 바꿉니다.
+        """
+        return cls.__name__
+
     @classmethod
     @abc.abstractmethod
     def _scrape_content(cls, content: WebElement) -> dict:
@@ -46,42 +176,81 @@ class ScrapeStrategy(abc.ABC):
 class HashTagStrategy(ScrapeStrategy):
     """해시태그 스크래핑 전략을 정의하는 클래스입니다."""
 
+    SCROLL_TIMEOUT = float(os.getenv("HASHTAG_SCROLL_TIMEOUT", "10"))  # 새 콘텐츠 대기 시간(초)
+    POLL_INTERVAL = 0.25
+    MIN_VIEW_COUNT = 1_000_000  # 수집할 최소 조회수
+
+    # 아직 처리하지 않은 콘텐츠에만 표시를 남기고 반환하여, 이미 처리한 콘텐츠는
+    # WebDriver로 다시 전송하지 않습니다. 새 콘텐츠가 없으면 다음 페이지 로딩을 위해 스크롤합니다.
+    TAKE_NEW_CONTENTS = """
+        const grid = document.querySelector("ytd-rich-grid-renderer");
+        const contents = Array.from(document.querySelectorAll(
+            "#contents > ytd-rich-item-renderer:not([data-inssider-seen])"
+        ));
+        contents.forEach((content) => content.setAttribute("data-inssider-seen", ""));
+
+        const continuation = document.querySelector("#contents > ytd-continuation-item-renderer");
+        if (contents.length === 0) {
+            if (continuation) continuation.scrollIntoView();
+            else window.scrollTo(0, document.documentElement.scrollHeight);
+        }
+        return {contents: contents, ready: grid !== null, more: continuation !== null};
+    """
+
     @classmethod
     @override
     def _run(cls, driver: Chrome, idx: int) -> list[dict]:
-        from selenium.webdriver.common.action_chains import ActionChains
-        from selenium.webdriver.common.keys import Keys
+        contents = cls._wait_new_contents(driver)
+        return cls._scrape_contents(driver, contents)
 
-        actions = ActionChains(driver)
-        _from, _to = idx, idx + 36  # YouTube loads 36 contents at once
-        parsed_contents = []
-        html = driver.find_element(By.TAG_NAME, "html")
+    @classmethod
+    @override
+    def _run_skipping(cls, driver: Chrome, idx: int, known: AbstractSet[str]) -> list[dict]:
+        contents = cls._wait_new_contents(driver)
+        return cls._scrape_contents(driver, contents, known)
 
-        while _from < _to:
-            contents = driver.find_elements(By.CSS_SELECTOR, "#contents > ytd-rich-item-renderer")[
-                _from:
-            ]
-            html.send_keys(Keys.PAGE_DOWN)
+    @classmethod
+    def _wait_new_contents(cls, driver: Chrome) -> list[WebElement]:
+        """새로 추가된 콘텐츠가 로드될 때까지 최대 `SCROLL_TIMEOUT`초 동안 대기합니다."""
+        deadline = time.monotonic() + cls.SCROLL_TIMEOUT
+        while True:
+            state = driver.execute_script(cls.TAKE_NEW_CONTENTS)
+            if state["contents"]:
+                return state["contents"]
+            if state["ready"] and not state["more"]:
+                raise ScrapeStopped(StopReason.END_OF_FEED)
+            if time.monotonic() >= deadline:
+                raise ScrapeStopped(StopReason.TIMEOUT)
+            time.sleep(cls.POLL_INTERVAL)
 
-            for content in contents:
-                actions.move_to_element(content).perform()
-                parsed_contents.append(cls._scrape_content(content))
-            _from += len(contents)
+    @classmethod
+    def _scrape_contents(
+        cls, driver: Chrome, contents: list[WebElement], known: AbstractSet[str] = frozenset()
+    ) -> list[dict]:
+        """새로 불러온 콘텐츠를 요소 단위로 하나씩 파싱합니다.
+
+        known에 포함된 영상은 링크만 읽고 나머지 추출과 스크롤을 생략합니다.
+        """
+        from selenium.webdriver.common.action_chains import ActionChains
 
+        actions = ActionChains(driver)
+        parsed_contents = []
+        for content in contents:
+            if known:
+                href = content.find_element(By.CSS_SELECTOR, "#thumbnail #thumbnail")
+                video_id = cls._parse_video_id(href.get_attribute("href") or "")
+                if video_id in known:
+                    parsed_contents.append(cls._known(video_id))
+                    continue
+            actions.move_to_element(content).perform()
+            parsed_contents.append(cls._scrape_content(content))
         return parsed_contents
 
     @classmethod
     @override
     def _scrape_content(cls, content: WebElement) -> dict:
         thumbnail = content.find_element(By.CSS_SELECTOR, "#thumbnail #thumbnail")
-
-        video_url = thumbnail.get_attribute("href")
-        video_id = video_url.split("/")[-1]
-        thumbnail_url = thumbnail.find_element(By.CSS_SELECTOR, "yt-image > img").get_attribute(
-            "src"
-        )
-        if not thumbnail_url:
-            thumbnail_url = f"https://i.ytimg.com/vi/{video_id}/hq2.jpg"
+        image = thumbnail.find_element(By.CSS_SELECTOR, "yt-image > img")
 
         details = content.find_element(By.ID, "details")
         meta = details.find_element(By.ID, "meta")
@@ -91,21 +260,63 @@ class HashTagStrategy(ScrapeStrategy):
         view_count = meta.find_element(By.CSS_SELECTOR, "#metadata-line > span:nth-child(3)")
         date = meta.find_element(By.CSS_SELECTOR, "#metadata-line > span:nth-child(4)")
 
+        return cls._build_content(
+            {
+                "href": thumbnail.get_attribute("href"),
+                "src": image.get_attribute("src"),
+                "title": title.text,
+                "channel": channel.text,
+                "view_count": view_count.text,
+                "date": date.text,
+            }
+        )
+
+    @classmethod
+    def _build_content(cls, raw: dict) -> dict:
+        """DOM에서 읽은 원시 값을 응답 형태의 콘텐츠로 변환합니다."""
+        video_url = raw["href"] or ""
+        video_id = cls._parse_video_id(video_url)
+        thumbnail_url = raw["src"]
+        if not thumbnail_url:
+            # 화면에 노출되지 않은 썸네일은 lazy loading으로 src가 비어 있습니다.
+            thumbnail_url = f"https://i.ytimg.com/vi/{video_id}/hq2.jpg"
+
         return {
             "video_id": video_id,
             "thumbnail_url": thumbnail_url,
             "video_url": video_url,
-            "title": title.text,
-            "channel": channel.text,
-            "view_count": cls._parse_view_count(view_count.text),
-            "date": date.text,
+            "title": raw["title"],
+            "channel": raw["channel"],
+            "view_count": cls._parse_view_count(raw["view_count"]),
+            "date": raw["date"],
         }
 
     @classmethod
     @override
     def _filter(cls, content: dict) -> bool:
         """콘텐츠를 필터링합니다."""
-        return content["view_count"] >= 1_000_000
+        return content["view_count"] >= cls.MIN_VIEW_COUNT
+
+    @classmethod
+    @override
+    def filter_key(cls) -> str:
+        return f"view_count>={cls.MIN_VIEW_COUNT}"
+
+    @staticmethod
+    def _parse_video_id(video_url: str) -> str:
+        """영상 URL에서 영상 ID를 추출합니다.
+
+        예시:
+        - "https://www.youtube.com/watch?v=MLpmiywRNzY" -> "MLpmiywRNzY"
+        - "https://www.youtube.com/shorts/MLpmiywRNzY" -> "MLpmiywRNzY"
+        """
+        from urllib.parse import parse_qs, urlsplit
+
+        parts = urlsplit(video_url)
+        query = parse_qs(parts.query)
+        if "v" in query:
+            return query["v"][0]
+        return parts.path.rstrip("/").split("/")[-1]
 
     @staticmethod
     def _parse_view_count(view_count_text: str) -> int:
@@ -117,10 +328,12 @@ class HashTagStrategy(ScrapeStrategy):
         - "조회수 1.8만회" -> 18000
         - "조회수 3.5천회" -> 3500
         - "조회수 329회" -> 329
+        - "조회수 1,234,567회" -> 1234567
         - "조회수 없음" -> 0
         """
         try:
-            count_text = view_count_text.replace("조회수", "").replace("회", "").strip()
+            count_text = view_count_text.replace("조회수", "").replace("회", "")
+            count_text = count_text.replace(",", "").strip()
             if "억" in count_text:
                 number = float(count_text.replace("억", ""))
                 return int(number * 100_000_000)
@@ -137,6 +350,111 @@ class HashTagStrategy(ScrapeStrategy):
             return 0
 
 
+class BatchedHashTagStrategy(HashTagStrategy):
+    """새로 불러온 콘텐츠 전체를 한 번의 `execute_script` 호출로 추출하는 해시태그 전략입니다.
+
+    요소마다 WebDriver 요청을 여러 번 보내는 `HashTagStrategy`와 같은 결과를 반환합니다.
+    """
+
+    SCRIPT = """
+        const text = (root, selector) => {
+            const element = root && root.querySelector(selector);
+            return element ? element.innerText.trim() : "";
+        };
+        return arguments[0].map((content) => {
+            const thumbnail = content.querySelector("#thumbnail #thumbnail");
+            const image = thumbnail && thumbnail.querySelector("yt-image > img");
+            const meta = content.querySelector("#details #meta");
+            return {
+                href: thumbnail ? thumbnail.href : "",
+                src: image ? image.src : "",
+                title: text(meta, "#video-title"),
+                channel: text(meta, "#channel-name #text > a"),
+                view_count: text(meta, "#metadata-line > span:nth-child(3)"),
+                date: text(meta, "#metadata-line > span:nth-child(4)"),
+            };
+        });
+    """
+
+    @classmethod
+    @override
+    def _scrape_contents(
+        cls, driver: Chrome, contents: list[WebElement], known: AbstractSet[str] = frozenset()
+    ) -> list[dict]:
+        if not contents:
+            return []
+        parsed_contents = []
+        for raw in driver.execute_script(cls.SCRIPT, contents):
+            video_id = cls._parse_video_id(raw["href"] or "")
+            if video_id in known:
+                parsed_contents.append(cls._known(video_id))
+            else:
+                parsed_contents.append(cls._build_content(raw))
+        return parsed_contents
+
+
+class HashTagHttpStrategy(HashTagStrategy):
+    """브라우저 대신 `YouTubeHttpSession`이 내려주는 JSON 렌더러를 파싱하는 해시태그 전략입니다."""
+
+    @classmethod
+    @override
+    def _run(cls, driver: "YouTubeHttpSession", idx: int) -> list[dict]:
+        return [cls._scrape_content(renderer) for renderer in driver.next_page()]
+
+    @classmethod
+    @override
+    def _run_skipping(
+        cls, driver: "YouTubeHttpSession", idx: int, known: AbstractSet[str]
+    ) -> list[dict]:
+        return [
+            (
+                cls._known(renderer["videoId"])
+                if renderer["videoId"] in known
+                else cls._scrape_content((kind, renderer))
+            )
+            for kind, renderer in driver.next_page()
+        ]
+
+    @classmethod
+    @override
+    def _scrape_content(cls, content: tuple[str, dict]) -> dict:
+        kind, renderer = content
+        video_id = renderer["videoId"]
+
+        thumbnails = renderer.get("thumbnail", {}).get("thumbnails") or []
+        thumbnail_url = thumbnails[-1]["url"] if thumbnails else None
+        if not thumbnail_url:
+            thumbnail_url = f"https://i.ytimg.com/vi/{video_id}/hq2.jpg"
+
+        if kind == "reelItemRenderer":
+            video_url = f"https://www.youtube.com/shorts/{video_id}"
+            title = renderer.get("headline")
+        else:
+            video_url = f"https://www.youtube.com/watch?v={video_id}"
+            title = renderer.get("title")
+        channel = renderer.get("ownerText") or renderer.get("shortBylineText")
+        view_count = renderer.get("shortViewCountText") or renderer.get("viewCountText")
+
+        return {
+            "video_id": video_id,
+            "thumbnail_url": thumbnail_url,
+            "video_url": video_url,
+            "title": cls._text(title),
+            "channel": cls._text(channel),
+            "view_count": cls._parse_view_count(cls._text(view_count)),
+            "date": cls._text(renderer.get("publishedTimeText")),
+        }
+
+    @staticmethod
+    def _text(node: dict | None) -> str:
+        """`simpleText` 또는 `runs` 형태의 텍스트 노드를 문자열로 변환합니다."""
+        if not node:
+            return ""
+        if "simpleText" in node:
+            return node["simpleText"]
+        return "".join(run.get("text", "") for run in node.get("runs", []))
+
+
 class NamuWikiStrategy(ScrapeStrategy):
     """나무위키 스크래핑 전략을 정의하는 클래스입니다."""
 
@@ -0,0 +1,146 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+
+from model.controller import HashTagCrawlResponse
+from service.youtube.http_crawler import YouTubeHttpCrawler
+from service.youtube.strategy import HashTagHttpStrategy, Incremental
+
+FIXTURES = Path(__file__).parent / "fixtures"
+CONTINUATIONS = {
+    "token-page-2": "continuation_page2.json",
+    "token-page-3": "continuation_page3.json",
+}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """저장해 둔 YouTube 응답을 돌려주는 로컬 HTTP 핸들러입니다."""
+
+    requests: list[str] = []
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        if not urlsplit(self.path).path.startswith("/hashtag/"):
+            return self._send(404, b"", "text/plain")
+        self._send(200, (FIXTURES / "hashtag.html").read_bytes(), "text/html; charset=utf-8")
+
+    def do_POST(self):
+        self.requests.append(self.path)
+        query = parse_qs(urlsplit(self.path).query)
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        fixture = CONTINUATIONS.get(body.get("continuation"))
+        if query.get("key") != ["test-api-key"] or fixture is None:
+            return self._send(400, b"{}", "application/json")
+        self._send(200, (FIXTURES / fixture).read_bytes(), "application/json")
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def crawler():
+    FixtureHandler.requests.clear()
+    with httpx.Client() as client:
+        with YouTubeHttpCrawler(client) as crawler:
+            yield crawler
+
+
+def test_follows_continuation_until_limit(base_url, crawler):
+    data = crawler.scrape(f"{base_url}/hashtag/%EB%B0%88", HashTagHttpStrategy(), limit=3)
+
+    video_ids = [content["video_id"] for content in data["contents"]]
+    assert video_ids == ["vid00000001", "vid00000003", "vid00000004"]
+    assert data["stop_reason"] == "limit"
+    # 초기 페이지와 첫 번째 continuation만 요청하고 멈춰야 합니다.
+    assert len(FixtureHandler.requests) == 2
+
+
+def test_stops_at_end_of_feed(base_url, crawler):
+    data = crawler.scrape(f"{base_url}/hashtag/%EB%B0%88", HashTagHttpStrategy(), limit=100)
+
+    assert data["length"] == 4
+    assert data["stop_reason"] == "end_of_feed"
+    assert data["contents"][-1]["video_id"] == "vid00000006"
+    assert len(FixtureHandler.requests) == 3
+
+
+def test_response_shape(base_url, crawler):
+    data = crawler.scrape(f"{base_url}/hashtag/%EB%B0%88", HashTagHttpStrategy(), limit=2)
+    res = HashTagCrawlResponse.from_dict(data)
+
+    video, short = res.contents
+    assert video.video_url == "https://www.youtube.com/watch?v=vid00000001"
+    assert video.thumbnail_url == "https://i.ytimg.com/vi/vid00000001/hq720.jpg?sqp=large"
+    assert video.title == "첫 번째 밈"
+    assert video.channel == "밈 채널"
+    assert video.view_count == 160_000_000
+    assert video.date == "3일 전"
+
+    assert short.video_url == "https://www.youtube.com/shorts/vid00000003"
+    assert short.thumbnail_url == "https://i.ytimg.com/vi/vid00000003/hq2.jpg"
+    assert short.view_count == 12_820_000
+
+
+def test_incremental_skips_known_videos(base_url, crawler):
+    incremental = Incremental(known={"vid00000001", "vid00000002"}, stop_after=3)
+    data = crawler.scrape(
+        f"{base_url}/hashtag/%EB%B0%88", HashTagHttpStrategy(), limit=100, incremental=incremental
+    )
+
+    assert [content["video_id"] for content in data["contents"]] == [
+        "vid00000003",
+        "vid00000004",
+        "vid00000006",
+    ]
+    assert data["stop_reason"] == "end_of_feed"
+    assert data["new_count"] == 3
+    assert data["skipped_count"] == 2
+    # 필터에서 제외한 vid00000005는 수집 이력과 따로 기록합니다.
+    assert incremental.new_ids == ["vid00000003", "vid00000004", "vid00000006"]
+    assert incremental.filtered_ids == ["vid00000005"]
+
+
+def test_incremental_counts_filtered_videos_as_known(base_url, crawler):
+    # 이전 크롤링에서 제외한 영상도 이미 검사한 영상이므로 연속 개수에 포함됩니다.
+    known = {"vid00000001", "vid00000002", "vid00000005"}
+    incremental = Incremental(known=known, stop_after=3)
+    data = crawler.scrape(
+        f"{base_url}/hashtag/%EB%B0%88", HashTagHttpStrategy(), limit=100, incremental=incremental
+    )
+
+    assert data["skipped_count"] == 3
+    assert incremental.filtered_ids == []
+
+
+def test_incremental_stops_after_known_run(base_url, crawler):
+    incremental = Incremental(known={f"vid0000000{i}" for i in range(1, 5)}, stop_after=3)
+    data = crawler.scrape(
+        f"{base_url}/hashtag/%EB%B0%88", HashTagHttpStrategy(), limit=100, incremental=incremental
+    )
+
+    assert data["length"] == 0
+    assert data["stop_reason"] == "known"
+    assert data["new_count"] == 0
+    assert data["skipped_count"] == 3
+    # 초기 페이지에서 멈추고 continuation은 요청하지 않아야 합니다.
+    assert len(FixtureHandler.requests) == 1
@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from service.youtube.pool import DriverPool, PooledDriver
+
+
+class FakeDriver:
+    """브라우저 없이 풀 동작을 검증하기 위한 가짜 드라이버입니다."""
+
+    def __init__(self):
+        self.alive = True
+        self.request_interceptor = None
+        self.requests = []
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise WebDriverException("session deleted")
+        return "about:blank"
+
+    def __delattr__(self, name):
+        # seleniumwire의 드라이버처럼 인터셉터/요청 기록 삭제를 초기화로 처리합니다.
+        setattr(self, name, [] if name == "requests" else None)
+
+    def quit(self):
+        self.alive = False
+
+
+def _factory():
+    return PooledDriver(FakeDriver(), {"headers": {"User-Agent": "test"}})
+
+
+def test_lease_reuses_released_driver():
+    pool = DriverPool(size=1, factory=_factory)
+    first = pool.lease()
+    pool.release(first)
+    second = pool.lease()
+    assert first is second
+    assert pool.stats()["launched"] == 1
+
+
+def test_lease_blocks_until_release():
+    pool = DriverPool(size=1, factory=_factory)
+    leased = pool.lease()
+
+    with pytest.raises(TimeoutError):
+        pool.lease(timeout=0.05)
+
+    threading.Timer(0.05, pool.release, args=(leased,)).start()
+    assert pool.lease(timeout=1) is leased
+
+
+def test_recycle_after_max_pages():
+    pool = DriverPool(size=1, max_pages=2, factory=_factory)
+    with pool.leased() as pooled:
+        pooled.pages += 2
+    assert not pooled.driver.alive, "페이지 한도를 넘은 브라우저는 반납 시 종료되어야 합니다"
+
+    with pool.leased() as renewed:
+        assert renewed is not pooled
+    assert pool.stats()["recycled"] == 1
+
+
+def test_unhealthy_driver_is_replaced():
+    pool = DriverPool(size=1, factory=_factory)
+    pooled = pool.lease()
+    pool.release(pooled)
+    pooled.driver.alive = False
+
+    assert pool.lease() is not pooled
+
+
+def test_headers_for_host_are_cached():
+    pooled = _factory()
+    youtube = pooled.headers_for("www.youtube.com")
+    assert youtube["headers"]["Host"] == "www.youtube.com"
+    assert youtube["headers"]["Referer"] == "https://www.youtube.com/"
+    assert pooled.headers_for("www.youtube.com") is youtube
+    assert "Host" not in pooled.headers["headers"], "원본 헤더는 변경되지 않아야 합니다"
+
+
+def test_warm_up_and_close():
+    pool = DriverPool(size=2, factory=_factory)
+    pool.warm_up()
+    assert pool.stats()["idle"] == 2
+
+    pool.close()
+    assert pool.stats()["total"] == 0
+    with pytest.raises(RuntimeError):
+        pool.lease()
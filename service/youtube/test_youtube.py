@@ -1,6 +1,7 @@
 import unittest
 
-from service.youtube.strategy import HashTagStrategy
+from service.youtube.profile import DEFAULT_PROFILE, LEAN_PROFILE
+from service.youtube.strategy import BatchedHashTagStrategy, HashTagStrategy, StopReason
 
 
 class TestHashTagStrategy(unittest.TestCase):
@@ -13,6 +14,7 @@ class TestHashTagStrategy(unittest.TestCase):
             ("조회수 1.8만회", 18_000),
             ("조회수 3.5천회", 3_500),
             ("조회수 329회", 329),
+            ("조회수 1,234,567회", 1_234_567),
             ("조회수 없음", 0),
         ]
 
@@ -21,6 +23,167 @@ class TestHashTagStrategy(unittest.TestCase):
             with self.subTest(view_count_str=view_count_str):
                 self.assertEqual(HashTagStrategy._parse_view_count(view_count_str), expected_count)
 
+    def test_parse_video_id(self):
+        test_cases = [
+            ("https://www.youtube.com/watch?v=MLpmiywRNzY", "MLpmiywRNzY"),
+            ("https://www.youtube.com/watch?v=MLpmiywRNzY&pp=ygUG", "MLpmiywRNzY"),
+            ("https://www.youtube.com/shorts/MLpmiywRNzY", "MLpmiywRNzY"),
+        ]
+
+        for video_url, expected_id in test_cases:
+            with self.subTest(video_url=video_url):
+                self.assertEqual(HashTagStrategy._parse_video_id(video_url), expected_id)
+
+
+class TestBatchedHashTagStrategy(unittest.TestCase):
+
+    class FakeDriver:
+        def __init__(self, raw_contents):
+            self.raw_contents = raw_contents
+            self.calls = 0
+
+        def execute_script(self, script, contents):
+            self.calls += 1
+            return self.raw_contents[: len(contents)]
+
+    def test_scrape_contents_in_one_call(self):
+        raw_contents = [
+            {
+                "href": "https://www.youtube.com/watch?v=MLpmiywRNzY",
+                "src": "",
+                "title": "밈",
+                "channel": "채널",
+                "view_count": "조회수 1.6억회",
+                "date": "3일 전",
+            }
+        ] * 3
+        driver = self.FakeDriver(raw_contents)
+
+        contents = BatchedHashTagStrategy._scrape_contents(driver, [object()] * 3)
+
+        self.assertEqual(driver.calls, 1)
+        self.assertEqual(len(contents), 3)
+        self.assertEqual(contents[0]["video_id"], "MLpmiywRNzY")
+        self.assertEqual(contents[0]["thumbnail_url"], "https://i.ytimg.com/vi/MLpmiywRNzY/hq2.jpg")
+        self.assertEqual(contents[0]["view_count"], 160_000_000)
+
+    def test_skip_known_contents(self):
+        raw_contents = [
+            {
+                "href": f"https://www.youtube.com/shorts/{video_id}",
+                "src": "",
+                "title": "밈",
+                "channel": "채널",
+                "view_count": "조회수 1.6억회",
+                "date": "3일 전",
+            }
+            for video_id in ["known00001", "new0000001"]
+        ]
+        driver = self.FakeDriver(raw_contents)
+
+        contents = BatchedHashTagStrategy._scrape_contents(driver, [object()] * 2, {"known00001"})
+
+        self.assertEqual(contents[0], {"video_id": "known00001", "known": True})
+        self.assertEqual(contents[1]["video_id"], "new0000001")
+        self.assertEqual(contents[1]["view_count"], 160_000_000)
+
+    def test_scrape_no_contents(self):
+        driver = self.FakeDriver([])
+        self.assertEqual(BatchedHashTagStrategy._scrape_contents(driver, []), [])
+        self.assertEqual(driver.calls, 0)
+
+
+class TestHashTagScroll(unittest.TestCase):
+
+    class Strategy(HashTagStrategy):
+        SCROLL_TIMEOUT = 0.05
+        POLL_INTERVAL = 0.01
+
+        @classmethod
+        def _scrape_contents(cls, driver, contents):
+            return [{"video_id": content, "view_count": 1_000_000} for content in contents]
+
+    class FakeDriver:
+        """미리 정의한 페이지 상태를 순서대로 반환하고, 이후에는 새 콘텐츠 없이 마지막 상태를 유지합니다."""
+
+        def __init__(self, *states):
+            self.states = list(states)
+            self.last = states[-1]
+            self.calls = 0
+
+        def execute_script(self, script):
+            self.calls += 1
+            if self.states:
+                return self.states.pop(0)
+            return {**self.last, "contents": []}
+
+    def test_stop_when_limit_reached(self):
+        driver = self.FakeDriver(
+            {"contents": ["a", "b"], "ready": True, "more": True},
+            {"contents": [], "ready": True, "more": True},
+            {"contents": ["c", "d"], "ready": True, "more": True},
+        )
+        res = self.Strategy.run(driver, 3)
+        self.assertEqual([c["video_id"] for c in res["contents"]], ["a", "b", "c", "d"])
+        self.assertEqual(res["stop_reason"], StopReason.LIMIT)
+        self.assertEqual(driver.calls, 3)
+
+    def test_stop_at_end_of_feed(self):
+        driver = self.FakeDriver(
+            {"contents": [], "ready": False, "more": False},
+            {"contents": ["a"], "ready": True, "more": False},
+            {"contents": [], "ready": True, "more": False},
+        )
+        res = self.Strategy.run(driver, 10)
+        self.assertEqual(res["length"], 1)
+        self.assertEqual(res["stop_reason"], StopReason.END_OF_FEED)
+
+    def test_stop_on_timeout(self):
+        driver = self.FakeDriver(
+            {"contents": ["a"], "ready": True, "more": True},
+            {"contents": [], "ready": True, "more": True},
+        )
+        res = self.Strategy.run(driver, 10)
+        self.assertEqual(res["length"], 1)
+        self.assertEqual(res["stop_reason"], StopReason.TIMEOUT)
+
+
+class TestCrawlerProfile(unittest.TestCase):
+
+    class FakeRequest:
+        def __init__(self, url, dest=None):
+            self.url = url
+            self.path = url.split("://", 1)[-1].split("/", 1)[-1]
+            self.headers = {"Sec-Fetch-Dest": dest} if dest else {}
+
+    def test_lean_profile_blocks_unused_resources(self):
+        test_cases = [
+            (self.FakeRequest("https://i.ytimg.com/vi/a/hq2.jpg", "image"), True),
+            (self.FakeRequest("https://fonts.gstatic.com/s/roboto.woff2"), True),
+            (self.FakeRequest("https://rr1.googlevideo.com/videoplayback?id=1", "empty"), True),
+            (self.FakeRequest("https://www.youtube.com/api/stats/qoe?x=1", "empty"), True),
+            (self.FakeRequest("https://www.youtube.com/hashtag/%EB%B0%88", "document"), False),
+            (self.FakeRequest("https://www.youtube.com/youtubei/v1/browse", "empty"), False),
+            (self.FakeRequest("https://www.youtube.com/s/desktop/base.js", "script"), False),
+        ]
+
+        for request, blocked in test_cases:
+            with self.subTest(url=request.url):
+                self.assertEqual(LEAN_PROFILE.blocks(request), blocked)
+                self.assertFalse(DEFAULT_PROFILE.blocks(request))
+
+    def test_process_tree_rss_without_proc(self):
+        import os
+        from unittest import mock
+
+        from service.youtube.profile import _process_tree_rss
+
+        # /proc가 없으면 0바이트가 아니라 측정할 수 없음(None)으로 보고합니다.
+        with mock.patch("os.path.isdir", return_value=False):
+            self.assertIsNone(_process_tree_rss(os.getpid()))
+        if os.path.isdir("/proc"):
+            self.assertGreater(_process_tree_rss(os.getpid()), 0)
+
 
 if __name__ == "__main__":
     unittest.main()